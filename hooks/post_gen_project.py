@@ -1,9 +1,28 @@
 import os
+import sys
+import time
 import shutil
+import stat
+import hashlib
+import tempfile
 import wave
 import math
-import struct
+import random
+import io
 import json
+import struct
+import subprocess
+import itertools
+import re
+import cProfile
+import contextlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; synthesis falls back to the array module
+    numpy = None
 
 CUSTOM_PLAYER_SVGS = "{{ cookiecutter.custom_player_svgs }}"
 PLAYER_TYPES = "{{ cookiecutter.player_types }}"
@@ -12,6 +31,20 @@ CUSTOM_NPC_SVG_PATH = "{{ cookiecutter.custom_npc_svg }}"
 VICTORY_SOUND_PATH = "{{ cookiecutter.victory_sound }}"
 LEVEL_COUNT = int("{{ cookiecutter.level_count }}")
 LEVELS_CONFIG_PATH = "{{ cookiecutter.levels_config }}"
+ASSET_CACHE = "{{ cookiecutter.asset_cache }}"
+DEDUPE_ASSETS = "{{ cookiecutter.dedupe_assets }}"
+LEVEL_WORKERS = "{{ cookiecutter.level_workers }}"
+LEVEL_SEED = "{{ cookiecutter.level_seed }}"
+LEVELS_OUTPUT = "{{ cookiecutter.levels_output }}"
+DENSE_COLLECTIBLES = "{{ cookiecutter.dense_collectibles }}"
+LEVEL_CHUNK_WIDTH = "{{ cookiecutter.level_chunk_width }}"
+GENERATION_REPORT = "{{ cookiecutter.generation_report }}"
+GENERATION_PROFILE = "{{ cookiecutter.generation_profile }}"
+SOUND_FORMAT = "{{ cookiecutter.sound_format }}"
+PERFORMANCE_MONITOR = "{{ cookiecutter.performance_monitor }}"
+LOG_LEVEL = "{{ cookiecutter.log_level }}"
+TEXTURE_ATLAS = "{{ cookiecutter.texture_atlas }}"
+GODOT_VERSION = "{{ cookiecutter.godot_version }}"
 
 DEFAULT_PLAYER_SVG = """<svg height="128" width="128" xmlns="http://www.w3.org/2000/svg">
   <rect x="10" y="10" width="108" height="108" fill="#478cbf" rx="20" ry="20" />
@@ -28,6 +61,34 @@ DEFAULT_NPC_SVG = """<svg height="128" width="128" xmlns="http://www.w3.org/2000
 """
 
 
+# os.stat() results of input files by absolute path (None when missing),
+# shared by every lookup in this process; a batch run resolves the same
+# inputs for many projects. The hook never writes to its inputs.
+_input_stats = {}
+
+# resolve_path() results by (path, directory). Inputs found by absolute path
+# or relative to the parent directory are keyed by the parent directory, so
+# every project a batch run generates in the same output directory shares
+# them; anything else is keyed by the project (working) directory.
+_resolved_paths = {}
+
+
+def input_stat(path):
+    """Return the cached os.stat() result of an input file, or None if it does not exist."""
+    path = os.path.abspath(path)
+    if path not in _input_stats:
+        try:
+            _input_stats[path] = os.stat(path)
+        except OSError:
+            _input_stats[path] = None
+    return _input_stats[path]
+
+
+def _is_input_file(path):
+    st = input_stat(path)
+    return st is not None and stat.S_ISREG(st.st_mode)
+
+
 def resolve_path(path):
     """
     Resolve a path that can be absolute or relative.
@@ -35,24 +96,45 @@ def resolve_path(path):
     1. Absolute path or path with ~ expansion
     2. Relative to parent directory (where cookiecutter was likely run)
     3. Relative to current directory
+    Results are cached for the rest of the run, as are the file checks behind them.
     """
     if not path:
         return None
 
+    cwd = os.getcwd()
+    shared_key = (path, os.path.dirname(cwd))
+    key = (path, cwd)
+    resolved_path = _resolved_paths.get(shared_key) or _resolved_paths.get(key)
+    if resolved_path is None:
+        resolved_path = _resolve_path(path)
+        shared = _is_input_file(resolved_path) and not resolved_path.startswith(cwd + os.sep)
+        _resolved_paths[shared_key if shared else key] = resolved_path
+    return resolved_path
+
+
+def resolve_input(path):
+    """Resolve path and return it if it names an existing file, otherwise None."""
+    resolved_path = resolve_path(path)
+    if resolved_path and _is_input_file(resolved_path):
+        return resolved_path
+    return None
+
+
+def _resolve_path(path):
     # Expand ~ to user home directory
     expanded_path = os.path.expanduser(path)
 
     # Check if it's an absolute path that exists
-    if os.path.isabs(expanded_path) and os.path.isfile(expanded_path):
+    if os.path.isabs(expanded_path) and _is_input_file(expanded_path):
         return expanded_path
 
     # Check relative to parent directory (where cookiecutter was run)
     parent_relative = os.path.join("..", expanded_path)
-    if os.path.isfile(parent_relative):
+    if _is_input_file(parent_relative):
         return os.path.abspath(parent_relative)
 
     # Check relative to current directory
-    if os.path.isfile(expanded_path):
+    if _is_input_file(expanded_path):
         return os.path.abspath(expanded_path)
 
     # Check absolute path even if it doesn't exist yet (for error reporting)
@@ -63,6 +145,486 @@ def resolve_path(path):
     return os.path.abspath(parent_relative)
 
 
+# Referenced input files that do not exist, as (setting, path) -> True once
+# reported, so report_missing_inputs() lists them together and only once
+_missing_inputs = {}
+
+
+def check_input(setting, path):
+    """Queue path for the missing-input report if it is set but names no existing file."""
+    if path and resolve_input(path) is None:
+        _missing_inputs.setdefault((setting, path), False)
+
+
+def report_missing_inputs():
+    """Print the missing input files queued since the last report as one group."""
+    pending = [key for key, reported in _missing_inputs.items() if not reported]
+    if not pending:
+        return
+    print(f"Warning: {len(pending)} referenced file(s) not found, using defaults instead:")
+    for setting, path in pending:
+        print(f"  {setting}: {path}")
+        _missing_inputs[(setting, path)] = True
+
+
+def hook_setting(value, env_name):
+    """
+    Return a cookiecutter setting, letting an environment variable override it.
+    Useful for batch pipelines that render many projects with the same context.
+    """
+    return os.environ.get(env_name, value).strip()
+
+
+def resolve_output_path(path):
+    """
+    Resolve a path the hook writes outside the project. Relative paths are
+    taken from the parent directory (where cookiecutter was likely run).
+    """
+    if not path:
+        return None
+    expanded_path = os.path.expanduser(path)
+    if os.path.isabs(expanded_path):
+        return expanded_path
+    return os.path.abspath(os.path.join("..", expanded_path))
+
+
+class GenerationProfile:
+    """
+    Wall time, file count and bytes written per generation stage and per level.
+    Files are attributed to the stage that is running when they are recorded.
+    """
+
+    def __init__(self):
+        self.stages = []
+        self.levels = []
+        self._started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        entry = {"name": name, "seconds": 0.0, "files": 0, "bytes": 0}
+        self.stages.append(entry)
+        started = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry["seconds"] = time.perf_counter() - started
+
+    def record_file(self, path, size=None):
+        if not self.stages:
+            return
+        if size is None:
+            size = os.path.getsize(path)
+        self.stages[-1]["files"] += 1
+        self.stages[-1]["bytes"] += size
+
+    def record_level(self, name, seconds, size):
+        self.levels.append({"name": name, "seconds": seconds, "bytes": size})
+
+    def report(self):
+        return {
+            "total_seconds": time.perf_counter() - self._started,
+            "stages": self.stages,
+            "levels": self.levels,
+            "settings": {
+                "level_workers": level_workers(),
+                "dedupe_assets": dedupe_mode(),
+                "texture_atlas": texture_atlas_enabled(),
+                "asset_cache": asset_cache_enabled(),
+                "update": update_mode(),
+                "numpy": numpy is not None,
+                "python": sys.version.split()[0],
+            },
+        }
+
+    def print_summary(self):
+        report = self.report()
+        print("Generation profile:")
+        for entry in self.stages:
+            print(f"  {entry['name']:<16}{entry['seconds'] * 1000:>10.1f} ms"
+                  f"{entry['files']:>6} file(s){entry['bytes'] / 1024:>10.1f} KB")
+        files = sum(entry["files"] for entry in self.stages)
+        size = sum(entry["bytes"] for entry in self.stages)
+        print(f"  {'total':<16}{report['total_seconds'] * 1000:>10.1f} ms"
+              f"{files:>6} file(s){size / 1024:>10.1f} KB")
+        if self.levels:
+            slowest = max(self.levels, key=lambda level: level["seconds"])
+            print(f"  slowest level: {slowest['name']} ({slowest['seconds'] * 1000:.1f} ms)")
+
+    def write_report(self, path):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        print(f"Wrote generation report to: {path}")
+
+
+_profile = GenerationProfile()
+
+
+# Persistent asset cache shared between project generations.
+# Entries are content-addressed: the key is a hash of the generator parameters
+# (or of the source file identity), so identical defaults are produced once.
+ASSET_CACHE_VERSION = 1
+ASSET_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache"), "cookiecutter-godot", "assets")
+ASSET_CACHE_MAX_MB = 256
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones (btrfs, xfs)
+
+
+def asset_cache_enabled():
+    return hook_setting(ASSET_CACHE, "COOKIECUTTER_GODOT_ASSET_CACHE").lower() == "yes"
+
+
+def asset_cache_dir():
+    return os.path.expanduser(hook_setting(ASSET_CACHE_DIR, "COOKIECUTTER_GODOT_CACHE_DIR"))
+
+
+def asset_cache_key(kind, *parts):
+    """Build a cache key from the artifact kind and its generator parameters."""
+    digest = hashlib.sha256(f"{kind}:{ASSET_CACHE_VERSION}".encode())
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = repr(part).encode()
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def _cache_entry_path(key):
+    return os.path.join(asset_cache_dir(), key[:2], key)
+
+
+def _reflink(source_path, dest_path):
+    """Try a copy-on-write clone of source_path. Returns False if unsupported."""
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+    try:
+        with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        return False
+
+
+def materialize_asset(source_path, dest_path):
+    """
+    Place a cached artifact at dest_path without regenerating it.
+    The link mode (COOKIECUTTER_GODOT_CACHE_LINK) is one of:
+    - reflink (default): copy-on-write clone where the filesystem supports it
+    - hardlink: share the cache inode (do not edit the generated file in place)
+    - copy: plain byte copy
+    Every mode falls back to a plain copy.
+    """
+    mode = hook_setting("reflink", "COOKIECUTTER_GODOT_CACHE_LINK").lower()
+    if os.path.lexists(dest_path):
+        os.remove(dest_path)
+
+    if mode == "hardlink":
+        try:
+            os.link(source_path, dest_path)
+            return
+        except OSError:
+            pass
+    elif mode == "reflink" and _reflink(source_path, dest_path):
+        return
+
+    shutil.copyfile(source_path, dest_path)
+
+
+# Bytes of assets produced in this process, by cache key. Only enabled when
+# one process generates many projects (see configure()), so each source file
+# is read and each default asset synthesized once per batch.
+_memory_assets = None
+
+
+def cached_asset(key, dest_path, produce):
+    """
+    Produce dest_path through the asset cache.
+
+    On a hit the cached artifact is materialized and produce() is skipped.
+    On a miss produce(dest_path) writes the file, which is then stored in the
+    cache. Returns True on a cache hit. Without the cache this just calls produce().
+    In a batch run, assets already produced in this process are written from memory.
+    """
+    if _memory_assets is None:
+        return _disk_cached_asset(key, dest_path, produce)
+
+    content = _memory_assets.get(key)
+    if content is not None:
+        if os.path.lexists(dest_path):
+            os.remove(dest_path)
+        with open(dest_path, "wb") as f:
+            f.write(content)
+        return True
+
+    hit = _disk_cached_asset(key, dest_path, produce)
+    with open(dest_path, "rb") as f:
+        _memory_assets[key] = f.read()
+    return hit
+
+
+def _disk_cached_asset(key, dest_path, produce):
+    if not asset_cache_enabled():
+        produce(dest_path)
+        return False
+
+    entry = _cache_entry_path(key)
+    if os.path.isfile(entry):
+        try:
+            materialize_asset(entry, dest_path)
+            # Record the access time explicitly; it is the LRU clock for eviction
+            os.utime(entry, (time.time(), os.stat(entry).st_mtime))
+            return True
+        except FileNotFoundError:
+            pass  # Evicted by another process since the check; regenerate below
+
+    produce(dest_path)
+    try:
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry), prefix=".tmp-")
+        os.close(fd)
+        shutil.copyfile(dest_path, tmp_path)
+        os.replace(tmp_path, entry)
+    except OSError as e:
+        print(f"Warning: Could not store {dest_path} in asset cache: {e}")
+    return False
+
+
+def evict_asset_cache():
+    """Remove least recently used cache entries until the cache fits its size budget."""
+    root = asset_cache_dir()
+    if not os.path.isdir(root):
+        return
+
+    max_bytes = int(hook_setting(str(ASSET_CACHE_MAX_MB), "COOKIECUTTER_GODOT_CACHE_MAX_MB")) * 1024 * 1024
+    entries = []
+    total = 0
+    # Other projects may be writing to or evicting from the same cache, so
+    # entries can vanish mid-scan; in-flight .tmp- files are not entries yet
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.startswith(".tmp-"):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_atime, st.st_size, path))
+            total += st.st_size
+
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total -= size
+
+
+# Generation manifest: maps every generated output to a fingerprint of its
+# inputs, so an update run can skip outputs whose inputs did not change
+GENERATION_MANIFEST = ".generation_manifest.json"
+_previous_outputs = {}
+_generated_outputs = {}
+_kept_outputs = []
+
+# Bump when stream_level_scene() output changes so update runs regenerate every scene
+LEVEL_SCENE_FORMAT = 4
+
+
+def update_mode():
+    """
+    True when the hook runs as an incremental update of an existing project,
+    via `post_gen_project.py --update` or COOKIECUTTER_GODOT_UPDATE=yes.
+    """
+    return "--update" in sys.argv[1:] or hook_setting("no", "COOKIECUTTER_GODOT_UPDATE").lower() == "yes"
+
+
+def load_generation_manifest():
+    if os.path.isfile(GENERATION_MANIFEST):
+        with open(GENERATION_MANIFEST) as f:
+            _previous_outputs.update(json.load(f).get("outputs", {}))
+
+
+def save_generation_manifest():
+    content = json.dumps({"outputs": dict(sorted(_generated_outputs.items()))}, indent=2) + "\n"
+    key = hashlib.sha256(content.encode()).hexdigest()
+
+    def write(path):
+        with open(path, "w") as f:
+            f.write(content)
+
+    if not output_is_current(GENERATION_MANIFEST, key) and not _file_has_text(GENERATION_MANIFEST, content):
+        write(GENERATION_MANIFEST)
+
+
+def _file_has_text(path, content):
+    if not os.path.isfile(path):
+        return False
+    with open(path) as f:
+        return f.read() == content
+
+
+def _output_key(path):
+    return path.replace(os.sep, "/")
+
+
+def output_is_current(dest_path, fingerprint):
+    """True in update mode when dest_path exists and was generated from the same inputs."""
+    return (update_mode()
+            and _previous_outputs.get(_output_key(dest_path)) == fingerprint
+            and os.path.isfile(dest_path))
+
+
+def record_output(dest_path, fingerprint):
+    _generated_outputs[_output_key(dest_path)] = fingerprint
+
+
+def produce_output(dest_path, fingerprint, produce):
+    """
+    Run produce(dest_path) unless an update run finds dest_path already
+    generated from the same inputs, in which case the file (and its mtime) is
+    left untouched. Returns True if the file was written.
+    """
+    record_output(dest_path, fingerprint)
+    if output_is_current(dest_path, fingerprint):
+        _kept_outputs.append(dest_path)
+        return False
+    produce(dest_path)
+    _profile.record_file(dest_path)
+    return True
+
+
+def write_output(dest_path, content):
+    """Write generated text or bytes through produce_output, keyed by a hash of the content."""
+    data = content.encode() if isinstance(content, str) else content
+
+    def write(path):
+        with open(path, "wb") as f:
+            f.write(data)
+
+    return produce_output(dest_path, hashlib.sha256(data).hexdigest(), write)
+
+
+def report_update():
+    """Summarize an update run and list outputs that are no longer generated."""
+    stale = sorted(set(_previous_outputs) - set(_generated_outputs))
+    for path in stale:
+        print(f"  Left in place (no longer generated): {path}")
+    written = len(_generated_outputs) - len(_kept_outputs)
+    print(f"Update complete: rewrote {written} file(s), kept {len(_kept_outputs)} unchanged")
+
+
+# Content digest -> first path written with that content during this run
+_placed_assets = {}
+_placed_paths = set()
+_deduplicated_assets = []
+
+
+def dedupe_mode():
+    """
+    Asset deduplication mode:
+    - no: write every asset separately (default)
+    - link: write identical content once and hard-link the duplicates
+    - rewrite: like link, but assets only referenced from generated scenes are
+      written once under a shared name and the scenes point at that file
+    """
+    mode = hook_setting(DEDUPE_ASSETS, "COOKIECUTTER_GODOT_DEDUPE_ASSETS").lower()
+    return mode if mode in ("link", "rewrite") else "no"
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def place_asset(dest_path, content_digest, produce, shareable=False):
+    """
+    Write an asset once per distinct content and return the path that holds it.
+
+    content_digest is a callable so the content is only hashed when
+    deduplication is enabled. shareable marks assets that are referenced only
+    from generated scenes; in rewrite mode those are stored under a shared
+    name and the caller must reference the returned path.
+    """
+    mode = dedupe_mode()
+    if mode == "no":
+        produce(dest_path)
+        return dest_path
+
+    digest = content_digest()
+    if mode == "rewrite" and shareable:
+        extension = os.path.splitext(dest_path)[1]
+        dest_path = os.path.join(os.path.dirname(dest_path), f"shared_{digest[:12]}{extension}")
+
+    if dest_path in _placed_paths:
+        # A shared asset that an earlier scene already placed
+        _deduplicated_assets.append(dest_path)
+        return dest_path
+
+    first_path = _placed_assets.get(digest)
+    if first_path is None:
+        produce(dest_path)
+        _placed_assets[digest] = dest_path
+    else:
+        _deduplicated_assets.append(dest_path)
+        produce_output(dest_path, f"link:{_output_key(first_path)}", lambda path: link_asset(first_path, path))
+    _placed_paths.add(dest_path)
+    return dest_path
+
+
+def link_asset(source_path, dest_path):
+    """Hard-link dest_path to source_path, falling back to a copy."""
+    if os.path.lexists(dest_path):
+        os.remove(dest_path)
+    try:
+        os.link(source_path, dest_path)
+    except OSError:
+        shutil.copyfile(source_path, dest_path)
+
+
+def write_text_asset(dest_path, content, shareable=False):
+    """
+    Write a generated text asset (e.g. a default SVG), consulting the asset
+    cache and the deduplication stage. Returns the path that holds the content.
+    """
+    def write(path):
+        with open(path, "w") as f:
+            f.write(content)
+
+    key = asset_cache_key("text", content)
+    return place_asset(dest_path, lambda: hashlib.sha256(content.encode()).hexdigest(),
+                       lambda path: produce_output(path, key, lambda p: cached_asset(key, p, write)),
+                       shareable)
+
+
+def copy_asset(source_path, dest_path, shareable=False):
+    """
+    Copy a user-supplied asset, consulting the asset cache and the
+    deduplication stage. Returns the path that holds the content.
+    The cache key uses the source file's identity (path, size, mtime) so a hit
+    never has to read the source again.
+    """
+    st = input_stat(source_path)
+    key = asset_cache_key("copy", os.path.abspath(source_path), st.st_size, st.st_mtime_ns)
+    return place_asset(dest_path, lambda: file_digest(source_path),
+                       lambda path: produce_output(
+                           path, key, lambda p: cached_asset(key, p, lambda q: shutil.copy(source_path, q))),
+                       shareable)
+
+
+def report_deduplicated_assets():
+    if _deduplicated_assets:
+        print(f"Deduplicated {len(_deduplicated_assets)} asset(s) with identical content ({dedupe_mode()} mode)")
+
+
 def parse_player_svgs():
     """
     Parse the custom_player_svgs string into a dictionary.
@@ -98,29 +660,73 @@ def setup_player_svg():
             dest_path = os.path.join("assets", f"player_{player_type}.svg")
 
             if player_type in custom_svgs:
-                resolved_path = resolve_path(custom_svgs[player_type])
-                if resolved_path and os.path.isfile(resolved_path):
-                    shutil.copy(resolved_path, dest_path)
+                resolved_path = resolve_input(custom_svgs[player_type])
+                if resolved_path:
+                    copy_asset(resolved_path, dest_path)
                     print(f"  {player_type}: Copied from {resolved_path}")
                 else:
-                    # Use default if custom not found
-                    with open(dest_path, "w") as f:
-                        f.write(DEFAULT_PLAYER_SVG)
-                    print(f"  {player_type}: Warning - path not found, using default")
+                    # Use default if custom not found (reported by preflight_inputs)
+                    write_text_asset(dest_path, DEFAULT_PLAYER_SVG)
+                    print(f"  {player_type}: Path not found, using default")
             else:
                 # No custom SVG specified for this type, use default
-                with open(dest_path, "w") as f:
-                    f.write(DEFAULT_PLAYER_SVG)
+                write_text_asset(dest_path, DEFAULT_PLAYER_SVG)
                 print(f"  {player_type}: Using default SVG")
     else:
         # Use default for all types
         print("Using default player SVG for all types...")
         for player_type in player_types:
             dest_path = os.path.join("assets", f"player_{player_type}.svg")
-            with open(dest_path, "w") as f:
-                f.write(DEFAULT_PLAYER_SVG)
+            write_text_asset(dest_path, DEFAULT_PLAYER_SVG)
             print(f"  {player_type}: Created default SVG")
 
+    setup_player_frames(player_types)
+
+
+# Player animations in assets/player_<type>_frames.tres as (name, loop, speed)
+PLAYER_ANIMATIONS = [("idle", True, 5.0), ("walk", True, 10.0), ("collect", False, 15.0)]
+
+SPRITE_FRAMES_ANIMATION = '''{
+"frames": [{
+"duration": 1.0,
+"texture": %s
+}],
+"loop": %s,
+"name": &"%s",
+"speed": %s
+}'''
+
+
+def sprite_frames_value(texture, animations):
+    """Godot text value of a SpriteFrames animations list that shows texture in every animation."""
+    return "[" + ", ".join(SPRITE_FRAMES_ANIMATION % (texture, "true" if loop else "false", name, speed)
+                           for name, loop, speed in animations) + "]"
+
+
+def player_frames_resource(frames_path, texture_path):
+    """Text of the SpriteFrames resource (.tres) at frames_path with the player animations showing texture_path."""
+    out = io.StringIO()
+    writer = TscnWriter(out)
+    writer.resource_header("SpriteFrames", 2, godot_uid(res_path(frames_path)))
+    writer.ext_resource(texture_resource_type(texture_path), texture_path, "1_texture")
+    writer.resource([("animations", sprite_frames_value('ExtResource("1_texture")', PLAYER_ANIMATIONS))])
+    return out.getvalue()
+
+
+def setup_player_frames(player_types):
+    """
+    Write assets/player_<type>_frames.tres for every player type, so choosing
+    a character in game loads one prepared SpriteFrames resource instead of
+    building the animations in script.
+    """
+    for player_type in player_types:
+        texture_path = os.path.join("assets", f"player_{player_type}.svg")
+        if texture_atlas_enabled():
+            texture_path = atlas_sprite(texture_path)
+        frames_path = os.path.join("assets", f"player_{player_type}_frames.tres")
+        write_output(frames_path, player_frames_resource(frames_path, res_path(texture_path)))
+    print(f"Wrote SpriteFrames resources for {len(player_types)} player type(s)")
+
 
 def setup_npc():
     if INCLUDE_NPC.lower() != "yes":
@@ -139,10 +745,10 @@ def setup_npc():
 
     # Setup NPC SVG
     npc_svg_dest = os.path.join("assets", "npc.svg")
-    resolved_path = resolve_path(CUSTOM_NPC_SVG_PATH)
+    resolved_path = resolve_input(CUSTOM_NPC_SVG_PATH)
 
-    if resolved_path and os.path.isfile(resolved_path):
-        shutil.copy(resolved_path, npc_svg_dest)
+    if resolved_path:
+        copy_asset(resolved_path, npc_svg_dest)
         print(f"Copied custom NPC SVG from: {resolved_path}")
     else:
         # Use player SVG as default for NPC if no custom NPC SVG provided
@@ -151,85 +757,825 @@ def setup_npc():
             shutil.copy(player_svg_path, npc_svg_dest)
             print("Using player SVG as NPC SVG (default).")
         else:
-            with open(npc_svg_dest, "w") as f:
-                f.write(DEFAULT_NPC_SVG)
+            write_text_asset(npc_svg_dest, DEFAULT_NPC_SVG)
             print("Using default NPC SVG.")
 
-        if CUSTOM_NPC_SVG_PATH:
-            print(f"Warning: Custom NPC SVG path not found: {CUSTOM_NPC_SVG_PATH}")
+    if texture_atlas_enabled():
+        use_atlas_in_scene(os.path.join("scenes", "npc.tscn"), npc_svg_dest)
+
+
+ATLAS_PATH = os.path.join("assets", "characters_atlas.svg")
+ATLAS_SPRITE_DIR = os.path.join("assets", "atlas")
+ATLAS_PADDING = 2  # Transparent pixels around each sprite, so filtering never samples a neighbour
+ATLAS_MAX_SIZE = 16384  # Largest texture most GPUs (and Godot's importer) accept
+SVG_ROOT = re.compile(r"<svg\b[^>]*>", re.S)
+SVG_PLACEMENT = re.compile(r"\s(?:x|y|width|height)\s*=\s*(?:\"[^\"]*\"|'[^']*')")
 
+# Content digest -> (source SVG, AtlasTexture resource) of each distinct character sprite
+_atlas_sprites = {}
+# Every SVG file registered for the atlas; removed once it is packed
+_atlas_sources = set()
 
-def generate_victory_sound(output_path, duration=0.6, sample_rate=44100):
+
+def texture_atlas_enabled():
+    return hook_setting(TEXTURE_ATLAS, "COOKIECUTTER_GODOT_TEXTURE_ATLAS").lower() == "yes"
+
+
+def texture_resource_type(path):
+    """Resource type of a texture reference: an atlas region (.tres) or an imported image."""
+    return "AtlasTexture" if path.endswith(".tres") else "Texture2D"
+
+
+def atlas_sprite(svg_path):
     """
-    Generate a simple victory sound (three ascending notes: C, E, G)
+    Register a character SVG for the texture atlas and return the path of
+    the AtlasTexture resource that replaces it. Sprites with the same content
+    share one region. The resources are written by build_texture_atlas()
+    once every sprite is known, so scenes can reference them right away.
     """
-    # Notes: C5 (523 Hz), E5 (659 Hz), G5 (784 Hz)
-    notes = [523, 659, 784]
-    note_duration = duration / len(notes)
-    samples_per_note = int(sample_rate * note_duration)
+    digest = file_digest(svg_path)
+    if digest not in _atlas_sprites:
+        _atlas_sprites[digest] = (svg_path, os.path.join(ATLAS_SPRITE_DIR, f"sprite_{digest[:16]}.tres"))
+    _atlas_sources.add(svg_path)
+    return _atlas_sprites[digest][1]
 
-    # Open WAV file
-    with wave.open(output_path, 'w') as wav_file:
-        # Set parameters: 1 channel (mono), 2 bytes per sample (16-bit), sample_rate
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
 
-        # Generate each note
-        for freq in notes:
-            for i in range(samples_per_note):
-                # Generate sine wave with envelope (fade in/out)
-                t = i / sample_rate
-                envelope = min(i / (samples_per_note * 0.1),
-                             (samples_per_note - i) / (samples_per_note * 0.2))
-                envelope = min(envelope, 1.0)
+def use_atlas_in_scene(scene_path, svg_path):
+    """Point a template scene's texture ext_resource for svg_path at the sprite's atlas region."""
+    if not os.path.exists(scene_path):
+        return
+    sprite_path = atlas_sprite(svg_path)
+    with open(scene_path) as f:
+        scene = f.read()
+    old = f'type="Texture2D" path="res://{svg_path.replace(os.sep, "/")}"'
+    new = f'type="AtlasTexture" path="res://{sprite_path.replace(os.sep, "/")}"'
+    if old in scene:
+        with open(scene_path, "w") as f:
+            f.write(scene.replace(old, new))
+
+
+def _svg_attribute(tag, name):
+    match = re.search(r"\s" + name + r"\s*=\s*[\"']([^\"']*)[\"']", tag)
+    return match.group(1).strip() if match else None
+
+
+def svg_size(tag):
+    """Pixel size of an SVG from its root tag: width/height, else the viewBox, else 128x128."""
+    def length(value):
+        match = re.match(r"^([0-9.]+)(?:px)?$", value or "")
+        return float(match.group(1)) if match else None
+
+    width, height = length(_svg_attribute(tag, "width")), length(_svg_attribute(tag, "height"))
+    view_box = (_svg_attribute(tag, "viewBox") or "").replace(",", " ").split()
+    if len(view_box) == 4 and float(view_box[2]) > 0 and float(view_box[3]) > 0:
+        view_width, view_height = float(view_box[2]), float(view_box[3])
+        if width is None and height is None:
+            width, height = view_width, view_height
+        elif width is None:
+            width = height * view_width / view_height
+        elif height is None:
+            height = width * view_height / view_width
+    return math.ceil(width or 128), math.ceil(height or 128)
+
+
+def atlas_entry(svg, x, y, prefix):
+    """
+    Nest one sprite's SVG in the atlas at (x, y). Its ids are prefixed so
+    gradients and clip paths of different sprites cannot clash.
+    Returns the entry and the sprite's (width, height).
+    """
+    match = SVG_ROOT.search(svg)
+    tag = match.group(0)
+    width, height = svg_size(tag)
+    self_closing = tag.endswith("/>")
+    attributes = SVG_PLACEMENT.sub("", tag[len("<svg"):-2 if self_closing else -1])
+    if _svg_attribute(tag, "viewBox") is None:
+        attributes += f' viewBox="0 0 {width} {height}"'
+    body = "" if self_closing else svg[match.end():svg.rindex("</svg>")]
+
+    content = f'<svg x="{x}" y="{y}" width="{width}" height="{height}"{attributes}>{body}</svg>\n'
+    content = re.sub(r"(\sid\s*=\s*[\"'])", r"\g<1>" + prefix, content)
+    content = re.sub(r"url\(\s*#", "url(#" + prefix, content)
+    content = re.sub(r"(href\s*=\s*[\"']#)", r"\g<1>" + prefix, content)
+    return content, (width, height)
+
+
+def pack_atlas(sizes, padding=ATLAS_PADDING):
+    """
+    Shelf-pack (width, height) rectangles, tallest first, into a sheet about
+    as wide as it is tall. Returns the (x, y) of each rectangle and the sheet size.
+    """
+    area = sum((width + padding) * (height + padding) for width, height in sizes)
+    sheet_width = max(max(width for width, _ in sizes) + 2 * padding, math.ceil(math.sqrt(area)))
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0], i))
+
+    positions = [None] * len(sizes)
+    x = y = padding
+    shelf_height = 0
+    used_width = 0
+    for i in order:
+        width, height = sizes[i]
+        if x + width + padding > sheet_width and x > padding:
+            y += shelf_height + padding
+            x, shelf_height = padding, 0
+        positions[i] = (x, y)
+        x += width + padding
+        used_width = max(used_width, x)
+        shelf_height = max(shelf_height, height)
+    return positions, (used_width, y + shelf_height + padding)
+
+
+def atlas_texture_resource(resource_path, region):
+    """Text of the AtlasTexture resource (.tres) at resource_path showing region (x, y, width, height) of the atlas."""
+    out = io.StringIO()
+    writer = TscnWriter(out)
+    writer.resource_header("AtlasTexture", 2, godot_uid(res_path(resource_path)))
+    writer.ext_resource("Texture2D", res_path(ATLAS_PATH), "1_atlas")
+    writer.resource([("atlas", 'ExtResource("1_atlas")'), ("region", "Rect2(%d, %d, %d, %d)" % region)])
+    return out.getvalue()
+
+
+def build_texture_atlas():
+    """
+    Pack every registered character sprite into one SVG sheet, write the
+    AtlasTexture resource of each region and remove the separate SVG files,
+    so Godot imports and binds a single character texture.
+    """
+    if not _atlas_sprites:
+        return
+    sprites = []
+    for digest, (source, resource) in _atlas_sprites.items():
+        with open(source, encoding="utf-8", errors="replace") as f:
+            svg = f.read()
+        if not SVG_ROOT.search(svg):
+            print(f"Warning: {source} has no <svg> element, using the default sprite in the atlas")
+            svg = DEFAULT_PLAYER_SVG
+        sprites.append((svg, resource))
+
+    # Measure first, then nest each sprite at its packed position
+    sizes = [svg_size(SVG_ROOT.search(svg).group(0)) for svg, _ in sprites]
+    positions, (sheet_width, sheet_height) = pack_atlas(sizes)
+    os.makedirs(ATLAS_SPRITE_DIR, exist_ok=True)
+    entries = []
+    for i, ((svg, resource), (x, y)) in enumerate(zip(sprites, positions)):
+        entry, (width, height) = atlas_entry(svg, x, y, f"s{i}_")
+        entries.append(entry)
+        write_output(resource, atlas_texture_resource(resource, (x, y, width, height)))
+
+    sheet = (f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+             f'width="{sheet_width}" height="{sheet_height}" viewBox="0 0 {sheet_width} {sheet_height}">\n'
+             + "".join(entries) + "</svg>\n")
+    write_output(ATLAS_PATH, sheet)
+
+    for path in sorted(_atlas_sources):
+        if os.path.lexists(path):
+            os.remove(path)
+        _generated_outputs.pop(_output_key(path), None)
+    print(f"Packed {len(sprites)} character sprite(s) into {ATLAS_PATH} ({sheet_width}x{sheet_height} px), "
+          f"replacing {len(_atlas_sources)} SVG file(s)")
+    if max(sheet_width, sheet_height) > ATLAS_MAX_SIZE:
+        print(f"Warning: the atlas is larger than {ATLAS_MAX_SIZE} px and may not import on every GPU")
+
+
+def setup_performance_monitor():
+    # The autoload entry in project.godot is rendered by cookiecutter; only
+    # the script and its tests are removed here when the monitor is off
+    if PERFORMANCE_MONITOR.lower() == "yes":
+        print("Performance monitor autoload included (samples logged to user://performance.csv)")
+        return
+
+    for filepath in (os.path.join("scripts", "performance_monitor.gd"),
+                     os.path.join("tests", "test_performance_monitor.gd")):
+        if os.path.exists(filepath):
+            os.remove(filepath)
+            print(f"Removed {filepath} (performance monitor not included)")
+
+
+# log_level -> what is kept in the generated scripts:
+#   debug   - everything (the scripts as written)
+#   warning - push_warning/push_error; print("Warning: ...") becomes push_warning
+#   error   - push_error only
+LOG_LEVELS = ("debug", "warning", "error")
+PRINT_STATEMENT = re.compile(r"^([ \t]*)(?:print|prints|printt|printraw|print_rich|print_debug)\(")
+WARNING_PRINT = re.compile(r"^([ \t]*)print\(\"Warning: ")
+PUSH_WARNING_STATEMENT = re.compile(r"^([ \t]*)push_warning\(")
+
+
+def gdscript_statement_end(lines, start):
+    """Index of the line where the call statement starting on lines[start] closes its parentheses."""
+    depth = 0
+    for index in range(start, len(lines)):
+        line = lines[index]
+        quote = None
+        i = 0
+        while i < len(line):
+            char = line[i]
+            if quote:
+                if char == "\\":
+                    i += 1
+                elif char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif char == "#":
+                break
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    return index
+            i += 1
+    return len(lines) - 1
+
+
+def _code_line(line):
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith("#")
+
+
+def _indent_width(line):
+    return len(line) - len(line.lstrip())
+
+
+def strip_log_calls(source, level):
+    """
+    Remove the logging calls that level does not keep from GDScript source.
+    A block left empty by the removal gets a pass statement, so the script
+    still parses. Returns the new source and the number of calls removed.
+    """
+    removable = [PRINT_STATEMENT] + ([PUSH_WARNING_STATEMENT] if level == "error" else [])
+    lines = source.splitlines(True)
+    output = []
+    removed_at = []  # (position in output, indentation) of each removed statement
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        warning = WARNING_PRINT.match(line) if level == "warning" else None
+        match = warning or next((m for m in (r.match(line) for r in removable) if m), None)
+        if not match:
+            output.append(line)
+            i += 1
+            continue
+
+        end = gdscript_statement_end(lines, i)
+        if warning:
+            # Keep warnings, routed to the debugger's warning list instead of stdout
+            output.append(line.replace('print("Warning: ', 'push_warning("', 1))
+            output.extend(lines[i + 1:end + 1])
+        else:
+            removed_at.append((len(output), match.group(1)))
+        i = end + 1
+
+    for position, indent in reversed(removed_at):
+        opener = next((line for line in reversed(output[:position]) if _code_line(line)), None)
+        if opener is None or not opener.split("#", 1)[0].rstrip().endswith(":"):
+            continue
+        if len(indent) <= _indent_width(opener):
+            continue  # The statement followed the opener's block rather than being in it
+        following = next((line for line in output[position:] if _code_line(line)), None)
+        if following is None or _indent_width(following) <= _indent_width(opener):
+            output.insert(position, indent + "pass\n")
+    return "".join(output), len(removed_at)
+
+
+def strip_debug_logging():
+    """Strip the logging calls that LOG_LEVEL does not keep from the generated scripts."""
+    level = LOG_LEVEL.lower()
+    if level == "debug":
+        return
+    if level not in LOG_LEVELS:
+        print(f"Warning: unknown log_level '{LOG_LEVEL}', keeping all logging (expected one of: {', '.join(LOG_LEVELS)})")
+        return
+
+    removed = 0
+    scripts_dir = "scripts"
+    for name in sorted(os.listdir(scripts_dir)):
+        if not name.endswith(".gd"):
+            continue
+        path = os.path.join(scripts_dir, name)
+        with open(path) as f:
+            source = f.read()
+        stripped, count = strip_log_calls(source, level)
+        if stripped != source:
+            with open(path, "w") as f:
+                f.write(stripped)
+            _profile.record_file(path)
+        removed += count
+    print(f"Stripped {removed} logging call(s) from {scripts_dir}/ (log_level: {level})")
+
+
+UID_CHARS = "abcdefghijklmnopqrstuvwxy012345678"  # Godot's base-34 UID alphabet
+IMPORT_DIR = "res://.godot/imported"
+# Template scenes whose ext_resources get the UIDs of the generated resources they use
+TEMPLATE_SCENES = ("main.tscn", "player.tscn", "npc.tscn", "ui_layer.tscn", "collectible.tscn",
+                   "platform.tscn", "player_select.tscn")
+
+# Extension -> (importer, imported type, imported file extension, metadata, params) of
+# the .import files Godot writes with default import settings
+IMPORTERS = {
+    ".svg": ("texture", "CompressedTexture2D", "ctex", 'metadata={\n"vram_texture": false\n}\n', [
+        ("compress/mode", "0"), ("compress/high_quality", "false"), ("compress/lossy_quality", "0.7"),
+        ("compress/hdr_compression", "1"), ("compress/normal_map", "0"), ("compress/channel_pack", "0"),
+        ("mipmaps/generate", "false"), ("mipmaps/limit", "-1"), ("roughness/mode", "0"),
+        ("roughness/src_normal", '""'), ("process/fix_alpha_border", "true"), ("process/premult_alpha", "false"),
+        ("process/normal_map_invert_y", "false"), ("process/hdr_as_srgb", "false"),
+        ("process/hdr_clamp_exposure", "false"), ("process/size_limit", "0"), ("detect_3d/compress_to", "1"),
+        ("svg/scale", "1.0"), ("editor/scale_with_editor_scale", "false"),
+        ("editor/convert_colors_with_editor_theme", "false"),
+    ]),
+    ".wav": ("wav", "AudioStreamWAV", "sample", "", [
+        ("force/8_bit", "false"), ("force/mono", "false"), ("force/max_rate", "false"),
+        ("force/max_rate_hz", "44100"), ("edit/trim", "false"), ("edit/normalize", "false"),
+        ("edit/loop_mode", "0"), ("edit/loop_begin", "0"), ("edit/loop_end", "-1"), ("compress/mode", "0"),
+    ]),
+    ".ogg": ("oggvorbisstr", "AudioStreamOggVorbis", "oggvorbisstr", "", [
+        ("loop", "false"), ("loop_offset", "0"), ("bpm", "0"), ("beat_count", "0"), ("bar_beats", "4"),
+    ]),
+}
+
+
+def res_path(path):
+    return "res://" + path.replace(os.sep, "/")
+
+
+def godot_uid(resource_path):
+    """
+    Deterministic Godot UID (uid://..., as ResourceUID writes it) for a res://
+    path. The same path always gets the same UID, so references and the
+    editor's import cache stay valid when a project is regenerated.
+    """
+    value = int.from_bytes(hashlib.sha256(resource_path.encode()).digest()[:8], "big") & 0x7FFFFFFFFFFFFFFF
+    text = ""
+    while True:
+        text = UID_CHARS[value % len(UID_CHARS)] + text
+        value //= len(UID_CHARS)
+        if not value:
+            return "uid://" + text
 
-                # Generate sine wave sample
-                sample = int(32767 * 0.3 * envelope * math.sin(2 * math.pi * freq * t))
-                # Pack as signed 16-bit integer
-                wav_file.writeframes(struct.pack('<h', sample))
 
+def script_uid_files():
+    """Godot 4.4 and later keep the UID of each script in a .uid file next to it."""
+    try:
+        major, minor = (int(part) for part in GODOT_VERSION.split(".")[:2])
+    except ValueError:
+        return True
+    return (major, minor) >= (4, 4)
+
+
+def resource_uid(resource_path):
+    """
+    UID the generated project gives a res:// path, or None if it has none the
+    hook controls: template scenes carry their own, and scripts only have one
+    with .uid files.
+    """
+    extension = os.path.splitext(resource_path)[1]
+    if extension == ".tscn" or (extension == ".gd" and not script_uid_files()):
+        return None
+    return godot_uid(resource_path)
+
+
+def import_sidecar(path):
+    """Text of the .import file Godot would write for an SVG or audio file, with a stable UID."""
+    importer, imported_type, extension, metadata, params = IMPORTERS[os.path.splitext(path)[1]]
+    source = res_path(path)
+    imported = f"{IMPORT_DIR}/{os.path.basename(path)}-{hashlib.md5(source.encode()).hexdigest()}.{extension}"
+    return (f'[remap]\n\nimporter="{importer}"\ntype="{imported_type}"\nuid="{godot_uid(source)}"\n'
+            f'path="{imported}"\n{metadata}\n'
+            f'[deps]\n\nsource_file="{source}"\ndest_files=["{imported}"]\n\n'
+            "[params]\n\n" + "".join(f"{key}={value}\n" for key, value in params))
+
+
+def project_files(extensions):
+    """Paths of the project's files with the given extensions, skipping hidden directories and addons."""
+    for directory, subdirectories, files in os.walk("."):
+        subdirectories[:] = sorted(d for d in subdirectories
+                                   if not d.startswith(".") and not (directory == "." and d == "addons"))
+        for name in sorted(files):
+            if os.path.splitext(name)[1] in extensions:
+                yield os.path.relpath(os.path.join(directory, name))
+
+
+def link_template_uids():
+    """Add the UIDs of generated resources to the ext_resources of the template scenes."""
+    pattern = re.compile(r'(\[ext_resource type="[^"]*") (path="([^"]*)")')
+
+    def add_uid(match):
+        uid = resource_uid(match.group(3))
+        return f'{match.group(1)} uid="{uid}" {match.group(2)}' if uid else match.group(0)
+
+    for name in TEMPLATE_SCENES:
+        path = os.path.join("scenes", name)
+        if not os.path.exists(path):
+            continue
+        with open(path) as f:
+            scene = f.read()
+        linked = pattern.sub(add_uid, scene)
+        if linked != scene:
+            with open(path, "w") as f:
+                f.write(linked)
+
+
+def write_uid_sidecars():
+    """
+    Give every imported asset a .import file and every script a .uid file
+    (Godot 4.4+) with deterministic UIDs, and reference those UIDs from the
+    template scenes. A project opened with a cached .godot directory then
+    finds its imports up to date instead of reimporting everything.
+    """
+    imports = uid_files = kept = 0
+    for path in project_files(IMPORTERS):
+        if write_output(path + ".import", import_sidecar(path)):
+            imports += 1
+        else:
+            kept += 1
+    if script_uid_files():
+        for path in project_files((".gd",)):
+            if write_output(path + ".uid", godot_uid(res_path(path)) + "\n"):
+                uid_files += 1
+            else:
+                kept += 1
+    link_template_uids()
+    print(f"Wrote {imports} .import and {uid_files} .uid file(s) with stable UIDs"
+          + (f", kept {kept} unchanged" if kept else ""))
+
+
+# Notes: C5 (523 Hz), E5 (659 Hz), G5 (784 Hz)
+VICTORY_NOTES = [523, 659, 784]
+
+
+def synthesize_notes(notes, duration, sample_rate=44100, channels=1, volume=0.3):
+    """
+    Render a sequence of enveloped sine notes as 16-bit little-endian PCM bytes.
+
+    The whole signal is built in one buffer (NumPy when available, otherwise
+    an array('h')) so it can be handed to wave.writeframes() in a single call.
+    Multi-channel output duplicates the mono signal into every channel.
+    """
+    note_duration = duration / len(notes)
+    samples_per_note = int(sample_rate * note_duration)
+    amplitude = 32767 * volume
+    fade_in = samples_per_note * 0.1
+    fade_out = samples_per_note * 0.2
+
+    if numpy is not None:
+        i = numpy.arange(samples_per_note)
+        t = i / sample_rate
+        envelope = numpy.minimum(numpy.minimum(i / fade_in, (samples_per_note - i) / fade_out), 1.0)
+        signal = numpy.concatenate([
+            (amplitude * envelope * numpy.sin(2 * math.pi * freq * t)).astype('<i2')
+            for freq in notes
+        ])
+        if channels > 1:
+            signal = numpy.repeat(signal, channels)
+        return signal.tobytes()
+
+    # Pure-Python fallback: same maths, but still a single contiguous buffer
+    signal = array('h')
+    for freq in notes:
+        step = 2 * math.pi * freq
+        signal.extend(
+            int(amplitude * min(i / fade_in, (samples_per_note - i) / fade_out, 1.0)
+                * math.sin(step * (i / sample_rate)))
+            for i in range(samples_per_note)
+        )
+    if channels > 1:
+        interleaved = array('h', bytes(len(signal) * channels * 2))
+        for channel in range(channels):
+            interleaved[channel::channels] = signal
+        signal = interleaved
+    if sys.byteorder == 'big':
+        signal.byteswap()
+    return signal.tobytes()
+
+
+def generate_victory_sound(output_path, duration=0.6, sample_rate=44100, channels=1):
+    """
+    Generate a simple victory sound (three ascending notes: C, E, G)
+    """
+    frames = synthesize_notes(VICTORY_NOTES, duration, sample_rate, channels)
+    write_wav(output_path, frames, sample_rate, channels)
     print(f"Generated victory sound: {output_path}")
 
 
+def write_wav(target, frames, sample_rate, channels=1):
+    """Write 16-bit PCM frames as a WAV file; target is a path or a binary file object."""
+    with wave.open(target, 'wb') as wav_file:
+        # Set parameters: 2 bytes per sample (16-bit), sample_rate
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(frames)
+
+
 def setup_victory_sound():
     """
     Setup victory sound - use custom if provided, otherwise generate default
     """
     victory_sound_dest = os.path.join("assets", "victory.wav")
-    resolved_path = resolve_path(VICTORY_SOUND_PATH)
+    resolved_path = resolve_input(VICTORY_SOUND_PATH)
 
-    if resolved_path and os.path.isfile(resolved_path):
-        shutil.copy(resolved_path, victory_sound_dest)
+    if resolved_path:
+        copy_asset(resolved_path, victory_sound_dest)
         print(f"Copied custom victory sound from: {resolved_path}")
     else:
-        # Generate default victory sound
-        generate_victory_sound(victory_sound_dest)
+        # Generate default victory sound (or reuse an identical one from the cache)
+        key = asset_cache_key("victory_sound", VICTORY_NOTES, generate_victory_sound.__defaults__)
+
+        def produce(path):
+            if cached_asset(key, path, generate_victory_sound):
+                print(f"Reused cached victory sound: {path}")
+
+        produce_output(victory_sound_dest, key, produce)
         if VICTORY_SOUND_PATH:
-            print(f"Warning: Custom victory sound path not found: {VICTORY_SOUND_PATH}")
-            print("Using generated victory sound instead.")
+            print("Custom victory sound not found, using generated victory sound instead.")
 
 
-def load_levels_config():
+# Level sounds: short jingles declared per level in the levels config
+# ("sounds": {"victory": {...}, "collect": {...}, "jump": {...}}). A jingle's
+# parameters override the defaults for its kind.
+LEVEL_SOUND_KINDS = ("victory", "collect", "jump")
+DEFAULT_JINGLES = {
+    "victory": {"notes": VICTORY_NOTES, "duration": 0.6, "volume": 0.3, "sample_rate": 44100},
+    "collect": {"notes": [988, 1319], "duration": 0.12, "volume": 0.25, "sample_rate": 44100},
+    "jump": {"notes": [392, 587], "duration": 0.1, "volume": 0.2, "sample_rate": 44100},
+}
+LEVEL_SOUND_DIR = os.path.join("assets", "sounds")
+OGG_QUALITY = 4  # Vorbis quality (-1..10); 4 is about 128 kbit/s
+
+# Jingle key -> path of its rendered file in this run
+_jingle_paths = {}
+_ogg_encoder = []
+
+
+def ogg_encoder():
+    """Return the path of a local Ogg Vorbis encoder (oggenc, else ffmpeg), or None."""
+    if not _ogg_encoder:
+        _ogg_encoder.append(shutil.which("oggenc") or shutil.which("ffmpeg"))
+    return _ogg_encoder[0]
+
+
+def sound_format():
+    """
+    File format of generated level sounds: "wav" (default) or "ogg". Ogg
+    needs a local encoder; without one, sounds are written as WAV.
+    """
+    fmt = hook_setting(SOUND_FORMAT, "COOKIECUTTER_GODOT_SOUND_FORMAT").lower()
+    return "ogg" if fmt == "ogg" and ogg_encoder() else "wav"
+
+
+def level_jingles(level):
+    """Return {kind: jingle parameters} for the sounds a level declares."""
+    sounds = level.get('sounds') or {}
+    jingles = {}
+    for kind in LEVEL_SOUND_KINDS:
+        spec = sounds.get(kind)
+        if not spec and spec != {}:
+            continue
+        jingle = dict(DEFAULT_JINGLES[kind])
+        if isinstance(spec, dict):
+            jingle.update((name, spec[name]) for name in jingle if spec.get(name))
+        jingle["notes"] = [float(note) for note in jingle["notes"]]
+        jingle["duration"] = float(jingle["duration"])
+        jingle["volume"] = float(jingle["volume"])
+        jingle["sample_rate"] = int(jingle["sample_rate"])
+        jingles[kind] = jingle
+    return jingles
+
+
+def jingle_key(jingle, fmt):
+    return asset_cache_key("jingle", fmt, OGG_QUALITY if fmt == "ogg" else None,
+                           jingle["notes"], jingle["duration"], jingle["volume"], jingle["sample_rate"])
+
+
+def encode_ogg(wav_path, ogg_path):
+    encoder = ogg_encoder()
+    if os.path.basename(encoder).startswith("oggenc"):
+        command = [encoder, "--quiet", "-q", str(OGG_QUALITY), "-o", ogg_path, wav_path]
+    else:
+        command = [encoder, "-loglevel", "error", "-y", "-i", wav_path,
+                   "-c:a", "libvorbis", "-q:a", str(OGG_QUALITY), ogg_path]
+    subprocess.run(command, check=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+
+
+def render_jingle(jingle, fmt):
+    """Synthesize a jingle and return its file content as fmt ("wav" or "ogg"); None if encoding fails."""
+    frames = synthesize_notes(jingle["notes"], jingle["duration"], jingle["sample_rate"], 1, jingle["volume"])
+    wav = io.BytesIO()
+    write_wav(wav, frames, jingle["sample_rate"])
+    if fmt == "wav":
+        return wav.getvalue()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        wav_path = os.path.join(tmp, "jingle.wav")
+        ogg_path = os.path.join(tmp, "jingle.ogg")
+        with open(wav_path, "wb") as f:
+            f.write(wav.getvalue())
+        try:
+            encode_ogg(wav_path, ogg_path)
+            with open(ogg_path, "rb") as f:
+                return f.read()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+
+def asset_is_cached(key):
+    """True if cached_asset(key, ...) would not need to produce the asset."""
+    if _memory_assets is not None and key in _memory_assets:
+        return True
+    return asset_cache_enabled() and os.path.isfile(_cache_entry_path(key))
+
+
+def render_level_sounds(levels):
+    """
+    Render the jingles declared by a batch of levels and set each level's
+    "sound_files" ({kind: res:// path}).
+
+    Jingles are keyed by their parameters, so every level using the same
+    jingle shares one file and each is rendered once per run. Jingles whose
+    file is current (update mode) or cached are not synthesized again. With
+    sound_format "ogg", the encoder runs for several jingles at a time.
+    """
+    level_sounds = [(level, level_jingles(level)) for level in levels]
+    fmt = sound_format()
+    pending = {}
+    for _, jingles in level_sounds:
+        for jingle in jingles.values():
+            key = jingle_key(jingle, fmt)
+            if key not in _jingle_paths:
+                pending[key] = jingle
+
+    if pending:
+        if fmt != hook_setting(SOUND_FORMAT, "COOKIECUTTER_GODOT_SOUND_FORMAT").lower():
+            print("Warning: No Ogg Vorbis encoder (oggenc or ffmpeg) found, writing level sounds as WAV")
+        os.makedirs(LEVEL_SOUND_DIR, exist_ok=True)
+        jobs = [(key, jingle, os.path.join(LEVEL_SOUND_DIR, f"jingle_{key[:12]}.{fmt}"))
+                for key, jingle in pending.items()]
+        stale = [(key, jingle) for key, jingle, path in jobs
+                 if not output_is_current(path, key) and not asset_is_cached(key)]
+
+        workers = min(level_workers(), len(stale))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                rendered = pool.map(lambda job: render_jingle(job[1], fmt), stale)
+                contents = dict(zip((key for key, _ in stale), rendered))
+        else:
+            contents = {key: render_jingle(jingle, fmt) for key, jingle in stale}
+
+        for key, jingle, path in jobs:
+            content = contents.get(key)
+            if key in contents and content is None:
+                print(f"Warning: Could not encode {path}, writing it as WAV")
+                key = jingle_key(jingle, "wav")
+                path = os.path.join(LEVEL_SOUND_DIR, f"jingle_{key[:12]}.wav")
+                content = render_jingle(jingle, "wav")
+
+            def write(dest, content=content, jingle=jingle, fmt=os.path.splitext(path)[1][1:]):
+                # Not pre-rendered when the cache had it; it may have been evicted since
+                if content is None:
+                    content = render_jingle(jingle, fmt)
+                if content is None:
+                    raise RuntimeError(f"Could not encode {dest}")
+                with open(dest, "wb") as f:
+                    f.write(content)
+
+            def produce(dest, key=key, write=write):
+                if cached_asset(key, dest, write):
+                    print(f"Reused cached level sound: {dest}")
+                else:
+                    print(f"Generated level sound: {dest}")
+
+            produce_output(path, key, produce)
+            _jingle_paths[jingle_key(jingle, fmt)] = path
+
+    for level, jingles in level_sounds:
+        if jingles:
+            level['sound_files'] = {
+                kind: "res://" + _jingle_paths[jingle_key(jingle, fmt)].replace(os.sep, "/")
+                for kind, jingle in jingles.items()
+            }
+
+
+def levels_output():
+    """
+    How level configuration is written for the game: "json" (one
+    levels_config.json plus the levels.bin manifest) or "sharded" (one file
+    per level plus a small index, streamed without loading the whole config).
+    """
+    mode = hook_setting(LEVELS_OUTPUT, "COOKIECUTTER_GODOT_LEVELS_OUTPUT").lower()
+    return mode if mode in ("json", "sharded") else "json"
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class JsonStreamReader:
+    """
+    Minimal incremental JSON reader over a text file. Values are decoded one
+    at a time with raw_decode() from a buffer that grows only as far as the
+    value being decoded, so large documents are never read in full.
+    """
+
+    def __init__(self, f, chunk_size=64 * 1024):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        # Read at least as much as is buffered so retries of a large value stay linear
+        chunk = self.f.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\n\r":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid JSON: expected '{char}' but found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def separator(self, close):
+        """Consume the ',' between container items; returns False at the closing bracket."""
+        if self.peek() == close:
+            return False
+        self.expect(",")
+        if self.peek() == close:
+            raise ValueError(f"Invalid JSON: trailing ',' before '{close}'")
+        return True
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def stream_json_array(f, key):
+    """
+    Yield the elements of the array stored under key in the top-level object
+    of f, one at a time. Other top-level values are decoded and discarded.
     """
-    Load levels configuration from JSON file or create default config
+    reader = JsonStreamReader(f)
+    reader.expect("{")
+    more = reader.peek() != "}"
+    while more:
+        name = reader.value()
+        reader.expect(":")
+        if name == key:
+            reader.expect("[")
+            more = reader.peek() != "]"
+            while more:
+                yield reader.value()
+                more = reader.separator("]")
+            return
+        reader.value()
+        more = reader.separator("}")
+    raise KeyError(key)
+
+
+def iter_levels_config():
+    """
+    Yield levels from the JSON config file, or the default configuration,
+    one level at a time
     """
     if LEVELS_CONFIG_PATH:
-        resolved_path = resolve_path(LEVELS_CONFIG_PATH)
-        if resolved_path and os.path.isfile(resolved_path):
+        resolved_path = resolve_input(LEVELS_CONFIG_PATH)
+        if resolved_path:
             with open(resolved_path, 'r') as f:
-                config = json.load(f)
                 print(f"Loaded levels configuration from: {resolved_path}")
-                return config['levels']
-        else:
-            print(f"Warning: Levels config not found: {LEVELS_CONFIG_PATH}")
+                yield from stream_json_array(f, 'levels')
+            return
 
     # Generate default levels configuration
     print(f"Generating default configuration for {LEVEL_COUNT} level(s)...")
-    levels = []
     for i in range(LEVEL_COUNT):
         level_num = i + 1
-        levels.append({
+        yield {
             "name": f"level_{level_num}",
             "npc": {
                 "enabled": INCLUDE_NPC.lower() == "yes",
@@ -240,11 +1586,130 @@ def load_levels_config():
             "collectibles": 4 + (i * 2),  # Increase collectibles each level
             "target_score": 40 + (i * 20),  # Increase target each level
             "background_color": "#1a1a1a"
-        })
-    return levels
+        }
+
+
+def load_levels_config():
+    """
+    Load levels configuration from JSON file or create default config.
+    In sharded output mode the levels are returned as a lazy stream.
+    """
+    if levels_output() == "sharded":
+        return iter_levels_config()
+    return list(iter_levels_config())
+
+
+class SpatialHash:
+    """
+    Uniform grid of points for constant-time minimum-spacing checks.
+    Cells are min_spacing wide, so any point closer than min_spacing to
+    (x, y) lies in the 3x3 block of cells around it.
+    """
+
+    def __init__(self, min_spacing, points=()):
+        self.min_spacing = min_spacing
+        self._min_spacing_sq = min_spacing * min_spacing
+        self._cells = {}
+        for x, y in points:
+            self.add(x, y)
+
+    def _cell(self, x, y):
+        return int(x // self.min_spacing), int(y // self.min_spacing)
+
+    def add(self, x, y):
+        self._cells.setdefault(self._cell(x, y), []).append((x, y))
+
+    def is_clear(self, x, y):
+        """True if no stored point is closer than min_spacing to (x, y)."""
+        cx, cy = self._cell(x, y)
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for px, py in self._cells.get((gx, gy), ()):
+                    if (x - px) ** 2 + (y - py) ** 2 < self._min_spacing_sq:
+                        return False
+        return True
+
+
+def place_spaced_randomly(count, min_spacing, bounds, rng, max_attempts=100):
+    """
+    Randomly place count points inside bounds (left, top, right, bottom),
+    keeping every pair at least min_spacing apart.
+
+    Neighbour checks go through a SpatialHash, so placement is linear in count.
+    When the area is saturated at the current spacing (max_attempts misses in
+    a row), the spacing is halved for the remaining points instead of placing
+    them without any spacing, so the smallest reduced spacing still holds for
+    every pair. All randomness is drawn from rng (a random.Random).
+    """
+    left, top, right, bottom = bounds
+    positions = []
+    grid = SpatialHash(min_spacing)
+
+    for _ in range(count):
+        placed = False
+        while not placed:
+            for _ in range(max_attempts):
+                x = rng.uniform(left, right)
+                y = rng.uniform(top, bottom)
+                if grid.is_clear(x, y):
+                    placed = True
+                    break
+
+            if not placed:
+                if min_spacing <= 1:
+                    # Nothing meaningful left to shrink; keep the last candidate
+                    placed = True
+                else:
+                    # Area is full at this spacing: halve it and rebuild the grid
+                    min_spacing /= 2
+                    grid = SpatialHash(min_spacing, positions)
+
+        positions.append((x, y))
+        grid.add(x, y)
+
+    return positions
+
+
+def layout_positions(count, position_fn):
+    """
+    Evaluate a layout formula for indices 0..count-1 in one batch.
+
+    position_fn(i, xp) returns (x, y) using only arithmetic and xp.cos/xp.sin,
+    so the same expression runs on a NumPy index array (xp=numpy) and on a
+    single float index (xp=math). Returns a contiguous (count, 2) float array
+    when NumPy is available, otherwise a list of (x, y) float tuples.
+    """
+    if numpy is not None:
+        positions = numpy.empty((count, 2))
+        positions[:, 0], positions[:, 1] = position_fn(numpy.arange(count), numpy)
+        return positions
+    # Float indices keep every coordinate a float, matching the NumPy output
+    return list(map(position_fn, map(float, range(count)), itertools.repeat(math)))
+
+
+def as_positions(points):
+    """Convert a sequence of (x, y) pairs to the layout backend's position container."""
+    if numpy is not None:
+        return numpy.array(points, dtype=float).reshape(-1, 2)
+    return [(float(x), float(y)) for x, y in points]
+
 
+def concat_positions(first, second):
+    if numpy is not None:
+        return numpy.concatenate((first, second))
+    return first + second
 
-def generate_collectible_positions(count, layout='grid', screen_width=1152, screen_height=648):
+
+def iter_positions(positions, chunk_size=4096):
+    """Yield (x, y) float pairs from either position container without per-row NumPy overhead."""
+    if numpy is not None and isinstance(positions, numpy.ndarray):
+        for start in range(0, len(positions), chunk_size):
+            yield from positions[start:start + chunk_size].tolist()
+    else:
+        yield from positions
+
+
+def generate_collectible_positions(count, layout='grid', screen_width=1152, screen_height=648, rng=None):
     """
     Generate collectible positions based on the specified layout pattern.
 
@@ -253,17 +1718,19 @@ def generate_collectible_positions(count, layout='grid', screen_width=1152, scre
         layout: Layout pattern to use (grid, circle, random, horizontal, vertical, diagonal, corners, scatter)
         screen_width: Width of the game screen (default: 1152)
         screen_height: Height of the game screen (default: 648)
+        rng: random.Random used by the random and scatter layouts. Pass a
+            seeded instance (see level_rng) for reproducible output; defaults
+            to a fresh unseeded generator
 
     Returns:
-        List of (x, y) tuples for collectible positions
+        A contiguous (count, 2) float array when NumPy is installed, otherwise a
+        list of (x, y) float tuples. Both iterate as (x, y) pairs.
     """
-    import random
-    import math
-
-    positions = []
-
     if count <= 0:
-        return positions
+        return as_positions([])
+
+    if rng is None:
+        rng = random.Random()
 
     # Define safe margins to keep collectibles away from edges
     margin_x = 150
@@ -278,12 +1745,10 @@ def generate_collectible_positions(count, layout='grid', screen_width=1152, scre
         spacing_x = safe_width / (cols + 1)
         spacing_y = safe_height / (rows + 1)
 
-        for i in range(count):
-            row = i // cols
-            col = i % cols
-            x = margin_x + spacing_x * (col + 1)
-            y = margin_y + spacing_y * (row + 1)
-            positions.append((x, y))
+        positions = layout_positions(count, lambda i, xp: (
+            margin_x + spacing_x * (i % cols + 1),
+            margin_y + spacing_y * (i // cols + 1),
+        ))
 
     elif layout == 'circle':
         # Arrange collectibles in a circular pattern
@@ -291,69 +1756,34 @@ def generate_collectible_positions(count, layout='grid', screen_width=1152, scre
         center_y = screen_height / 2
         radius = min(safe_width, safe_height) / 2.5
 
-        for i in range(count):
-            angle = (2 * math.pi * i) / count
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            positions.append((x, y))
+        positions = layout_positions(count, lambda i, xp: (
+            center_x + radius * xp.cos((2 * math.pi * i) / count),
+            center_y + radius * xp.sin((2 * math.pi * i) / count),
+        ))
 
     elif layout == 'random':
         # Randomly place collectibles with minimum spacing
-        min_spacing = 120
-        max_attempts = 100
-
-        for _ in range(count):
-            placed = False
-            for _ in range(max_attempts):
-                x = random.uniform(margin_x, screen_width - margin_x)
-                y = random.uniform(margin_y, screen_height - margin_y)
-
-                # Check if position is far enough from existing positions
-                too_close = False
-                for px, py in positions:
-                    distance = math.sqrt((x - px) ** 2 + (y - py) ** 2)
-                    if distance < min_spacing:
-                        too_close = True
-                        break
-
-                if not too_close:
-                    positions.append((x, y))
-                    placed = True
-                    break
-
-            # If we couldn't place with spacing, place anywhere
-            if not placed:
-                x = random.uniform(margin_x, screen_width - margin_x)
-                y = random.uniform(margin_y, screen_height - margin_y)
-                positions.append((x, y))
+        positions = as_positions(place_spaced_randomly(
+            count, 120, (margin_x, margin_y, screen_width - margin_x, screen_height - margin_y), rng))
 
     elif layout == 'horizontal':
         # Arrange collectibles in a horizontal line
-        y = screen_height / 2
         spacing = safe_width / (count + 1)
-
-        for i in range(count):
-            x = margin_x + spacing * (i + 1)
-            positions.append((x, y))
+        positions = layout_positions(count, lambda i, xp: (margin_x + spacing * (i + 1), screen_height / 2))
 
     elif layout == 'vertical':
         # Arrange collectibles in a vertical line
-        x = screen_width / 2
         spacing = safe_height / (count + 1)
-
-        for i in range(count):
-            y = margin_y + spacing * (i + 1)
-            positions.append((x, y))
+        positions = layout_positions(count, lambda i, xp: (screen_width / 2, margin_y + spacing * (i + 1)))
 
     elif layout == 'diagonal':
         # Arrange collectibles diagonally from top-left to bottom-right
         spacing_x = safe_width / (count + 1)
         spacing_y = safe_height / (count + 1)
-
-        for i in range(count):
-            x = margin_x + spacing_x * (i + 1)
-            y = margin_y + spacing_y * (i + 1)
-            positions.append((x, y))
+        positions = layout_positions(count, lambda i, xp: (
+            margin_x + spacing_x * (i + 1),
+            margin_y + spacing_y * (i + 1),
+        ))
 
     elif layout == 'corners':
         # Place collectibles in corners, then fill with grid
@@ -365,8 +1795,7 @@ def generate_collectible_positions(count, layout='grid', screen_width=1152, scre
         ]
 
         # Add corners first
-        for i in range(min(count, 4)):
-            positions.append(corner_positions[i])
+        positions = as_positions(corner_positions[:min(count, 4)])
 
         # If more than 4 collectibles, fill the rest with grid in the center
         if count > 4:
@@ -382,57 +1811,152 @@ def generate_collectible_positions(count, layout='grid', screen_width=1152, scre
             start_x = center_x - (cols - 1) * spacing_x / 2
             start_y = center_y - (rows - 1) * spacing_y / 2
 
-            for i in range(remaining):
-                row = i // cols
-                col = i % cols
-                x = start_x + col * spacing_x
-                y = start_y + row * spacing_y
-                positions.append((x, y))
+            positions = concat_positions(positions, layout_positions(remaining, lambda i, xp: (
+                start_x + (i % cols) * spacing_x,
+                start_y + (i // cols) * spacing_y,
+            )))
 
     elif layout == 'scatter':
         # More spread out random placement (larger minimum spacing)
-        min_spacing = 180
-        max_attempts = 100
-
-        for _ in range(count):
-            placed = False
-            for _ in range(max_attempts):
-                x = random.uniform(margin_x, screen_width - margin_x)
-                y = random.uniform(margin_y, screen_height - margin_y)
-
-                # Check if position is far enough from existing positions
-                too_close = False
-                for px, py in positions:
-                    distance = math.sqrt((x - px) ** 2 + (y - py) ** 2)
-                    if distance < min_spacing:
-                        too_close = True
-                        break
-
-                if not too_close:
-                    positions.append((x, y))
-                    placed = True
-                    break
-
-            # If we couldn't place with spacing, reduce spacing requirement
-            if not placed:
-                min_spacing = 120
-                x = random.uniform(margin_x, screen_width - margin_x)
-                y = random.uniform(margin_y, screen_height - margin_y)
-                positions.append((x, y))
+        positions = as_positions(place_spaced_randomly(
+            count, 180, (margin_x, margin_y, screen_width - margin_x, screen_height - margin_y), rng))
 
     else:
         # Default to grid if unknown layout
-        return generate_collectible_positions(count, 'grid', screen_width, screen_height)
+        return generate_collectible_positions(count, 'grid', screen_width, screen_height, rng)
 
     return positions
 
 
-def generate_platform_layout(collectible_count, layout='horizontal'):
+# Jump physics of the template player, used for any value that cannot be
+# read from scripts/player.gd or scenes/player.tscn
+PLAYER_PHYSICS_DEFAULTS = {
+    "speed": 300.0,
+    "jump_velocity": -700.0,
+    "gravity": 980.0,
+    "width": 128.0,
+    "height": 128.0,
+}
+_player_physics = {}
+
+# Generated jumps use this fraction of the player's full jump height and
+# distance, so every platform can be reached without a pixel-perfect jump
+JUMP_SAFETY_MARGIN = 0.85
+GROUND_TOP = 576  # Top edge of the ground platform (y 600, height 48)
+MIN_PLATFORM_TOP = 160  # Keeps platforms and the collectibles above them on screen
+COLLECTIBLE_RADIUS = 32
+
+
+def player_physics():
+    """
+    Read the player's movement exports from scripts/player.gd and its
+    collision box from scenes/player.tscn, so generated jumps follow any
+    tuning of the player template. Read once per process.
+    """
+    if _player_physics:
+        return _player_physics
+
+    physics = dict(PLAYER_PHYSICS_DEFAULTS)
+    try:
+        with open(os.path.join("scripts", "player.gd"), encoding="utf-8") as f:
+            script = f.read()
+    except OSError:
+        script = ""
+    for name in ("speed", "jump_velocity", "gravity"):
+        match = re.search(r"^@export var " + name + r"\b[^=\n]*=\s*(-?[0-9.]+)", script, re.MULTILINE)
+        if match:
+            physics[name] = float(match.group(1))
+
+    try:
+        with open(os.path.join("scenes", "player.tscn"), encoding="utf-8") as f:
+            scene = f.read()
+    except OSError:
+        scene = ""
+    match = re.search(r"^size = Vector2\(([0-9.]+), ([0-9.]+)\)", scene, re.MULTILINE)
+    if match:
+        physics["width"], physics["height"] = float(match.group(1)), float(match.group(2))
+
+    _player_physics.update(physics)
+    return _player_physics
+
+
+class JumpReach:
+    """
+    Jump envelope of the player under constant gravity at full run speed.
+
+    A jump rises at most max_rise px. A jump landing rise px higher than it
+    took off (negative when landing lower) covers at most distance(rise) px
+    horizontally. margin scales both down for generating layouts.
     """
-    Generate platform positions for a side-scrolling platformer level.
+
+    def __init__(self, physics, margin=1.0):
+        self.speed = physics["speed"] * margin
+        self.velocity = abs(physics["jump_velocity"])
+        self.gravity = physics["gravity"]
+        self.max_rise = self.velocity ** 2 / (2 * self.gravity) * margin
+        self.player_height = physics["height"]
+
+    def distance(self, rise):
+        """Horizontal reach of a jump landing rise px higher; -1.0 when out of reach."""
+        if rise > self.max_rise:
+            return -1.0
+        airtime = (self.velocity + math.sqrt(self.velocity ** 2 - 2 * self.gravity * rise)) / self.gravity
+        return self.speed * airtime
+
+    def can_reach(self, a, b):
+        """True if a jump from surface a lands on surface b (surfaces from platform_surface())."""
+        rise = a[2] - b[2]
+        gap = max(b[0] - a[1], a[0] - b[1], 0)
+        return rise <= self.max_rise and gap <= self.distance(rise)
+
+
+def platform_surface(platform):
+    """Return the walkable top edge of a platform as (left, right, top)."""
+    return platform['x'], platform['x'] + platform['width'], platform['y'] - platform['height'] / 2
+
+
+def surface_buckets(surfaces, cell_width):
+    """Index surfaces by x cell; a surface wider than a cell is listed in every cell it spans."""
+    buckets = {}
+    for i, (left, right, _) in enumerate(surfaces):
+        for cell in range(int(left // cell_width), int(right // cell_width) + 1):
+            buckets.setdefault(cell, []).append(i)
+    return buckets
+
+
+# Height tier (1 = lowest) of jump platform i for each layout. tiers is the
+# number of tiers that fit on screen; random layouts draw from rng.
+PLATFORM_PROFILES = {
+    'horizontal': lambda i, tiers, rng: 1 + i % 2,
+    'grid': lambda i, tiers, rng: 1 + i % 3,
+    'vertical': lambda i, tiers, rng: 1 + i % tiers,
+    'diagonal': lambda i, tiers, rng: 1 + (i // 2) % tiers,
+    'circle': lambda i, tiers, rng: 1 + round((tiers - 1) * (1 - math.cos(math.pi * i / 4)) / 2),
+    'corners': lambda i, tiers, rng: 1 if i % 2 == 0 else tiers,
+    'random': lambda i, tiers, rng: rng.randint(1, tiers),
+    'scatter': lambda i, tiers, rng: rng.randint(1, tiers),
+}
+
+
+def generate_platform_layout(collectible_count, layout='horizontal', rng=None, length=3000, reach=None):
+    """
+    Generate platform positions for a side-scrolling platformer level of the given length (px).
+
+    Jump platforms fill the whole length, at heights following the layout's
+    profile in PLATFORM_PROFILES. Each platform is clamped so it can be
+    reached from the one before it with reach (a JumpReach, by default the
+    generated player's jump with JUMP_SAFETY_MARGIN), which makes every
+    platform reachable from the ground. Placement is a single pass, linear
+    in the number of platforms. Any randomized placement must draw from rng
+    (the level's seeded random.Random).
 
     Returns a list of platform dictionaries with position, width, and type.
     """
+    if rng is None:
+        rng = random.Random()
+    if reach is None:
+        reach = JumpReach(player_physics(), JUMP_SAFETY_MARGIN)
+
     platforms = []
 
     # Always add ground platform(s)
@@ -440,126 +1964,257 @@ def generate_platform_layout(collectible_count, layout='horizontal'):
     platforms.append({
         'x': 0,
         'y': 600,
-        'width': 3000,  # Long ground for side-scrolling
+        'width': length,  # Long ground for side-scrolling
         'height': 48,
         'type': 'ground'
     })
 
     # Add jump platforms based on collectible count and layout
-    if collectible_count > 0:
-        # Distribute platforms across the level
-        platform_spacing = 400
-        num_platforms = min(collectible_count + 2, 8)  # More platforms for more collectibles
-
-        for i in range(num_platforms):
-            x = 200 + (i * platform_spacing)
-            # Vary height for interesting platforming
-            if i % 3 == 0:
-                y = 450
-            elif i % 3 == 1:
-                y = 350
-            else:
-                y = 250
-
-            platforms.append({
-                'x': x,
-                'y': y,
-                'width': 200,
-                'height': 40,
-                'type': 'platform'
-            })
+    if collectible_count <= 0:
+        return platforms
+
+    # Tier 1 sits where the original layout's lowest platform did, tiers
+    # above it one step up, as far as fits on screen
+    first_rise = min(146, int(reach.max_rise))
+    step = min(100, int(reach.max_rise))
+    tiers = max(1, 1 + (GROUND_TOP - first_rise - MIN_PLATFORM_TOP) // step)
+    profile = PLATFORM_PROFILES.get(layout, PLATFORM_PROFILES['grid'])
+    randomized = layout in ('random', 'scatter')
+
+    previous = platform_surface(platforms[0])
+    i = 0
+    while True:
+        width = rng.randrange(120, 241, 20) if layout == 'scatter' else 200
+        gap = rng.randrange(120, 301, 20) if randomized else 200
+        top = GROUND_TOP - first_rise - step * (min(profile(i, tiers, rng), tiers) - 1)
+
+        # Never higher than a jump from the previous platform can reach, and
+        # never further away than that jump can carry the player
+        top = max(top, math.ceil(previous[2] - reach.max_rise))
+        gap = min(gap, int(reach.distance(previous[2] - top)))
+        left = previous[1] + gap if i else 200
+        if left + width > length:
+            break
+
+        platforms.append({
+            'x': left,
+            'y': top + 20,
+            'width': width,
+            'height': 40,
+            'type': 'platform'
+        })
+        previous = (left, left + width, top)
+        i += 1
 
     return platforms
 
 
-def generate_platformer_collectible_positions(count, platforms, layout='horizontal'):
+def reachable_platforms(platforms, reach):
+    """
+    Flood-fill the jump graph of a level from its ground, returning one bool
+    per platform. Surfaces are bucketed by x in cells as wide as the longest
+    possible jump, so each surface is only tested against the surfaces in
+    neighbouring cells and the pass stays linear in the number of platforms.
+    """
+    surfaces = [platform_surface(p) for p in platforms]
+    if not surfaces:
+        return []
+    tops = [s[2] for s in surfaces]
+    cell_width = max(reach.distance(min(tops) - max(tops)), 1.0)
+    buckets = surface_buckets(surfaces, cell_width)
+
+    reached = [p['type'] == 'ground' for p in platforms]
+    queue = [i for i, is_reached in enumerate(reached) if is_reached]
+    while queue:
+        surface = surfaces[queue.pop()]
+        first_cell = int((surface[0] - cell_width) // cell_width)
+        last_cell = int((surface[1] + cell_width) // cell_width)
+        for cell in range(first_cell, last_cell + 1):
+            for j in buckets.get(cell, ()):
+                if not reached[j] and reach.can_reach(surface, surfaces[j]):
+                    reached[j] = True
+                    queue.append(j)
+    return reached
+
+
+def ensure_collectibles_reachable(positions, platforms, reach):
+    """
+    Check every collectible against the surfaces reachable from the ground:
+    it must be above one of them, low enough to touch with a full jump. A
+    collectible out of reach is moved down to ground level at the same x
+    (clamped to the ground). Returns positions unchanged when all are reachable.
+    """
+    reached = reachable_platforms(platforms, reach)
+    surfaces = [platform_surface(p) for p, is_reached in zip(platforms, reached) if is_reached]
+    ground = platform_surface(platforms[0])
+    cell_width = 400
+    buckets = surface_buckets(surfaces, cell_width)
+    jump_height = reach.max_rise + reach.player_height + COLLECTIBLE_RADIUS
+
+    checked = []
+    moved = False
+    for x, y in iter_positions(positions):
+        candidates = buckets.get(int(x // cell_width), ())
+        if not any(surfaces[j][0] <= x <= surfaces[j][1] and surfaces[j][2] - jump_height <= y <= surfaces[j][2]
+                   for j in candidates):
+            x = min(max(x, ground[0] + 100.0), ground[1] - 100.0)
+            y = ground[2] - 80.0
+            moved = True
+        checked.append((x, y))
+    return as_positions(checked) if moved else positions
+
+
+def generate_platformer_collectible_positions(count, platforms, layout='horizontal', rng=None):
     """
     Generate collectible positions for platformer levels.
-    Places collectibles on or near platforms.
+    Places collectibles on or near platforms. Any randomized placement must
+    draw from rng (the level's seeded random.Random).
+    Returns the same position container as generate_collectible_positions().
     """
-    import random
-
-    positions = []
-
     if count <= 0:
-        return positions
+        return as_positions([])
 
     # Get platforms excluding ground
     jump_platforms = [p for p in platforms if p['type'] == 'platform']
 
     if not jump_platforms:
         # Fallback: place on ground
-        for i in range(count):
-            x = 300 + (i * 200)
-            y = 550  # Above ground
-            positions.append((x, y))
+        return layout_positions(count, lambda i, xp: (300 + (i * 200), 550.0))
+
+    # Space collectibles evenly along the platforms laid end to end:
+    # collectible i sits at fraction f of platform j's width, 80px above it
+    n = len(jump_platforms)
+    lefts = [p['x'] for p in jump_platforms]
+    widths = [p['width'] for p in jump_platforms]
+    heights = [p['y'] - 100 for p in jump_platforms]
+
+    if numpy is not None:
+        u = (numpy.arange(count) + 0.5) * n / count
+        j = numpy.minimum(u.astype(int), n - 1)
+        f = u - j
+        positions = numpy.empty((count, 2))
+        positions[:, 0] = numpy.array(lefts, dtype=float)[j] + numpy.array(widths, dtype=float)[j] * f
+        positions[:, 1] = numpy.array(heights, dtype=float)[j]
         return positions
 
-    # Distribute collectibles across platforms
+    positions = []
     for i in range(count):
-        platform_index = i % len(jump_platforms)
-        platform = jump_platforms[platform_index]
-
-        # Place collectible above platform
-        x = platform['x'] + (platform['width'] / 2)
-        # Add some variation
-        if count > len(jump_platforms):
-            x += ((i // len(jump_platforms)) - 0.5) * 60
-
-        y = platform['y'] - 100  # Above the platform
-
-        positions.append((x, y))
-
+        u = (i + 0.5) * n / count
+        j = min(int(u), n - 1)
+        f = u - j
+        positions.append((float(lefts[j] + widths[j] * f), float(heights[j])))
     return positions
 
 
-def generate_level_scene(level_config, level_index):
-    """
-    Generate a level scene file (.tscn) based on level configuration
+def level_rng(level_config):
     """
-    level_name = level_config['name']
-    npc_config = level_config.get('npc', {})
-    collectibles_count = level_config.get('collectibles', 4)
-    bg_color = level_config.get('background_color', '#1a1a1a')
-    layout = level_config.get('layout', 'grid')
-
-    # Convert hex color to Godot Color format
-    def hex_to_godot_color(hex_color):
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-        return f"Color({r:.3f}, {g:.3f}, {b:.3f}, 1)"
+    Return the seeded random.Random for one level's layout generators.
 
-    godot_color = hex_to_godot_color(bg_color)
-    has_npc = npc_config.get('enabled', False)
-    npc_message = npc_config.get('message', 'Hi, how are you?')
+    Uses the level's "seed" field when present. Otherwise the seed is derived
+    from the project-wide level_seed and the level name, so regenerating the
+    same levels config yields identical scenes, and reordering levels does not
+    change them.
+    """
+    seed = level_config.get('seed')
+    if seed is None:
+        project_seed = hook_setting(LEVEL_SEED, "COOKIECUTTER_GODOT_LEVEL_SEED")
+        seed = f"{project_seed}:{level_config['name']}"
+    return random.Random(seed)
 
-    # Calculate load_steps - add 2 for level-specific NPC (texture + sub_resource) if NPC is enabled, +1 for platform
-    load_steps = 8 if has_npc else 5
 
-    # Generate platform platformers
-    platform_positions = generate_platform_layout(collectibles_count, layout)
+class TscnWriter:
+    """
+    Streaming writer for Godot text scenes (.tscn, format=3) and resources (.tres).
 
-    # Generate collectible positions using the specified layout (adjusted for platformer)
-    collectible_positions = generate_platformer_collectible_positions(collectibles_count, platform_positions, layout)
+    Each [ext_resource], [sub_resource] and [node] section is written to the
+    output file handle as soon as it is emitted, so memory use does not grow
+    with the number of nodes. Values are written verbatim and must already be
+    in Godot's text format (see godot_string()).
+    """
 
-    # Build the scene file content
-    scene_content = f'''[gd_scene load_steps={load_steps} format=3 uid="uid://level_{level_index}_uid"]
+    def __init__(self, out):
+        self.out = out
+        self._started = False
+        self._last_heading = None
+
+    def _section(self, heading, attributes, properties=()):
+        # Consecutive [ext_resource] lines are grouped; every other section is
+        # separated from the previous one by a blank line
+        separator = "\n" if self._started and not (
+            heading == "ext_resource" and self._last_heading == "ext_resource") else ""
+        body = "".join(f"{key} = {value}\n" for key, value in properties)
+        opening = f"{heading} {attributes}" if attributes else heading
+        self.out.write(f"{separator}[{opening}]\n{body}")
+        self._started = True
+        self._last_heading = heading
+
+    def header(self, load_steps, uid):
+        self._section("gd_scene", f'load_steps={load_steps} format=3 uid="{uid}"')
+
+    def resource_header(self, resource_type, load_steps, uid):
+        self._section("gd_resource", f'type="{resource_type}" load_steps={load_steps} format=3 uid="{uid}"')
+
+    def resource(self, properties=()):
+        """The [resource] section holding the properties of a .tres file's main resource."""
+        self._section("resource", "", properties)
+
+    def ext_resource(self, resource_type, path, resource_id, uid=None):
+        uid = uid or resource_uid(path)
+        uid_attribute = f' uid="{uid}"' if uid else ""
+        self._section("ext_resource", f'type="{resource_type}"{uid_attribute} path="{path}" id="{resource_id}"')
+
+    def sub_resource(self, resource_type, resource_id, properties=()):
+        self._section("sub_resource", f'type="{resource_type}" id="{resource_id}"', properties)
+
+    def node(self, name, node_type=None, parent=None, instance=None, properties=()):
+        attributes = f'name="{name}"'
+        if node_type:
+            attributes += f' type="{node_type}"'
+        if parent is not None:
+            attributes += f' parent="{parent}"'
+        if instance:
+            attributes += f' instance=ExtResource("{instance}")'
+        self._section("node", attributes, properties)
+
+    def instances(self, name_prefix, instance, positions, parent="."):
+        """
+        Emit one instanced node per (x, y) position, named name_prefix1..N.
+        Fast path for the thousands of identical collectible nodes in large levels.
+        """
+        write = self.out.write
+        separator = "\n" if self._started else ""
+        for i, (x, y) in enumerate(iter_positions(positions), 1):
+            write(f'{separator}[node name="{name_prefix}{i}" parent="{parent}" instance=ExtResource("{instance}")]\n'
+                  f'position = Vector2({x}, {y})\n')
+            separator = "\n"
+            self._started = True
+            self._last_heading = "node"
+
+
+def godot_string(value):
+    """Quote a Python string as a Godot text-format String literal."""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def packed_vector2_array(positions):
+    """Format positions as a Godot text-format PackedVector2Array literal."""
+    return f"PackedVector2Array({', '.join(f'{x}, {y}' for x, y in iter_positions(positions))})"
+
+
+def uses_dense_collectibles(level_config):
+    """
+    True if the level's collectibles go into one CollectibleField node instead
+    of one instanced scene each: the level's own "dense_collectibles" flag, or
+    a collectible count at or above the dense_collectibles threshold (0 = off).
+    """
+    if 'dense_collectibles' in level_config:
+        return bool(level_config['dense_collectibles'])
+    threshold = int(hook_setting(DENSE_COLLECTIBLES, "COOKIECUTTER_GODOT_DENSE_COLLECTIBLES") or 0)
+    return threshold > 0 and level_config.get('collectibles', 4) >= threshold
 
-[ext_resource type="PackedScene" uid="uid://b8j5k2x4y1z3" path="res://scenes/player.tscn" id="1_player"]
-[ext_resource type="PackedScene" uid="uid://c9k6l3y5z2a4" path="res://scenes/collectible.tscn" id="2_collectible"]
-[ext_resource type="Script" path="res://scripts/game_manager.gd" id="3_manager"]
-[ext_resource type="PackedScene" uid="uid://d5k7m9n1p3q5r" path="res://scenes/platform.tscn" id="4_platform"]
-'''
 
-    if has_npc:
-        scene_content += '[ext_resource type="PackedScene" uid="uid://npc1a2b3c4d5e" path="res://scenes/npc.tscn" id="5_npc"]\n'
-        scene_content += f'[ext_resource type="Texture2D" path="res://assets/{level_name}_npc.svg" id="6_npc_texture"]\n'
-        scene_content += '[ext_resource type="PackedScene" uid="uid://ui1a2b3c4d5e6" path="res://scenes/ui_layer.tscn" id="7_ui"]\n\n'
-        # Add custom SpriteFrames sub-resource for level-specific NPC texture
-        scene_content += '''[sub_resource type="SpriteFrames" id="SpriteFrames_NPC"]
-animations = [{
+# SpriteFrames for the level-specific NPC texture (idle + talking)
+NPC_SPRITE_FRAMES = '''[{
 "frames": [{
 "duration": 1.0,
 "texture": ExtResource("6_npc_texture")
@@ -575,133 +2230,663 @@ animations = [{
 "loop": true,
 "name": &"talking",
 "speed": 8.0
-}]
+}]'''
 
-'''
-    else:
-        scene_content += '[ext_resource type="PackedScene" uid="uid://ui1a2b3c4d5e6" path="res://scenes/ui_layer.tscn" id="5_ui"]\n\n'
 
-    scene_content += '''[node name="Main" type="Node2D"]
-process_mode = 3
-script = ExtResource("3_manager")
+def level_length(level_config):
+    return int(level_config.get('length', 3000))
+
+
+def level_chunks(level_config):
+    """
+    Return (chunk_width, chunk_count) for a level. chunk_count is 0 when the
+    level is written as one flat scene: chunking is off (chunk width 0) or
+    the level fits in a single chunk.
+    """
+    chunk_width = int(level_config.get(
+        'chunk_width', hook_setting(LEVEL_CHUNK_WIDTH, "COOKIECUTTER_GODOT_LEVEL_CHUNK_WIDTH") or 0))
+    length = level_length(level_config)
+    if chunk_width <= 0 or length <= chunk_width:
+        return chunk_width, 0
+    return chunk_width, -(-length // chunk_width)
+
 
-[node name="Background" type="ColorRect" parent="."]
-offset_right = 3000.0
-offset_bottom = 648.0
-color = ''' + godot_color + '''
+def level_chunk_path(level_config, chunk_index):
+    return os.path.join("scenes", f"{level_config['name']}_chunks", f"chunk_{chunk_index}.tscn")
 
-[node name="Player" parent="." instance=ExtResource("1_player")]
-process_mode = 1
-position = Vector2(200, 400)
 
-[node name="Camera2D" type="Camera2D" parent="Player"]
-offset = Vector2(200, 0)
-limit_left = 0
-limit_top = 0
-limit_right = 3000
-limit_bottom = 648
-position_smoothing_enabled = true
-position_smoothing_speed = 5.0
+def level_layout(level_config):
+    """
+    Generate a level's platforms and collectible positions. Every layout
+    generator draws from the level's seeded generator, so the same level
+    config always produces a byte-identical scene.
+    """
+    collectibles_count = level_config.get('collectibles', 4)
+    layout = level_config.get('layout', 'grid')
+    rng = level_rng(level_config)
+
+    # Generate platform platformers
+    platform_positions = generate_platform_layout(collectibles_count, layout, rng, level_length(level_config))
+
+    # Generate collectible positions using the specified layout (adjusted for platformer)
+    collectible_positions = generate_platformer_collectible_positions(
+        collectibles_count, platform_positions, layout, rng)
+    collectible_positions = ensure_collectibles_reachable(
+        collectible_positions, platform_positions, JumpReach(player_physics()))
+    return platform_positions, collectible_positions
 
-'''
 
+def split_level_chunks(platforms, collectible_positions, length, chunk_width, chunk_count):
+    """
+    Split a level layout into chunk_count fixed-width chunks by x position.
+    The ground is cut into one segment per chunk; every other platform and
+    collectible goes to the chunk containing its centre.
+    Returns a list of (platforms, collectible_positions), one per chunk.
+    """
+    chunk_platforms = [[] for _ in range(chunk_count)]
+    chunk_positions = [[] for _ in range(chunk_count)]
+
+    def chunk_of(x):
+        return min(max(int(x // chunk_width), 0), chunk_count - 1)
+
+    for platform in platforms:
+        if platform['type'] == 'ground':
+            for k in range(chunk_count):
+                start = k * chunk_width
+                width = min(chunk_width, length - start)
+                chunk_platforms[k].append(dict(platform, x=start, width=width))
+        else:
+            chunk_platforms[chunk_of(platform['x'] + platform['width'] / 2)].append(platform)
+    for x, y in iter_positions(collectible_positions):
+        chunk_positions[chunk_of(x)].append((x, y))
+    return [(p, as_positions(c)) for p, c in zip(chunk_platforms, chunk_positions)]
+
+
+def write_level_content(writer, platforms, collectible_positions, dense, parent="."):
+    """Emit the platform and collectible nodes shared by flat level scenes and chunk scenes."""
     # Add platforms
-    for i, platform in enumerate(platform_positions, 1):
+    for i, platform in enumerate(platforms, 1):
         # Scale platform based on width/height
         scale_x = platform['width'] / 200.0  # Default platform width is 200
         scale_y = platform['height'] / 40.0  # Default platform height is 40
+        writer.node(f"Platform{i}", parent=parent, instance="4_platform", properties=[
+            ("position", f"Vector2({platform['x'] + platform['width']/2}, {platform['y']})"),
+            ("scale", f"Vector2({scale_x}, {scale_y})"),
+        ])
+
+    # Add collectibles: one field node holding every position, or one instance each
+    if dense:
+        writer.node("Collectibles", "Node2D", parent=parent, properties=[
+            ("process_mode", "1"),
+            ("script", 'ExtResource("2_collectible_field")'),
+            ("positions", packed_vector2_array(collectible_positions)),
+        ])
+    else:
+        writer.instances("Collectible", "2_collectible", collectible_positions, parent=parent)
 
-        scene_content += f'''[node name="Platform{i}" parent="." instance=ExtResource("4_platform")]
-position = Vector2({platform['x'] + platform['width']/2}, {platform['y']})
-scale = Vector2({scale_x}, {scale_y})
 
-'''
+def write_content_resources(writer, dense):
+    if dense:
+        writer.ext_resource("Script", "res://scripts/collectible_field.gd", "2_collectible_field")
+    else:
+        writer.ext_resource("PackedScene", "res://scenes/collectible.tscn", "2_collectible", uid="uid://c9k6l3y5z2a4")
+
+
+def stream_level_scene(out, level_config, level_index, npc_texture_path=None, layout=None):
+    """
+    Write a level scene (.tscn) based on level configuration to the file handle out.
+    npc_texture_path overrides the level's NPC texture (e.g. a deduplicated shared asset).
+    layout is a precomputed level_layout() result. Chunked levels get a
+    ChunkStreamer node in place of their platforms and collectibles, which
+    are written separately with stream_level_chunk().
+    """
+    level_name = level_config['name']
+    npc_config = level_config.get('npc', {})
+    bg_color = level_config.get('background_color', '#1a1a1a')
+    length = level_length(level_config)
+    chunk_width, chunk_count = level_chunks(level_config)
+
+    # Convert hex color to Godot Color format
+    def hex_to_godot_color(hex_color):
+        hex_color = hex_color.lstrip('#')
+        r = int(hex_color[0:2], 16) / 255.0
+        g = int(hex_color[2:4], 16) / 255.0
+        b = int(hex_color[4:6], 16) / 255.0
+        return f"Color({r:.3f}, {g:.3f}, {b:.3f}, 1)"
 
-    # Add collectibles
-    for i, (x, y) in enumerate(collectible_positions, 1):
-        scene_content += f'''[node name="Collectible{i}" parent="." instance=ExtResource("2_collectible")]
-position = Vector2({x}, {y})
+    godot_color = hex_to_godot_color(bg_color)
+    has_npc = npc_config.get('enabled', False)
+    npc_message = npc_config.get('message', 'Hi, how are you?')
+
+    sound_files = level_config.get('sound_files', {})
+
+    # Count the ext/sub resources - player, collectibles, manager, platform and UI,
+    # plus 3 for a level-specific NPC (scene, texture and SpriteFrames sub_resource)
+    resource_count = 8 if has_npc else 5
+    if chunk_count:
+        # The streamer script replaces the platform and collectible resources
+        resource_count -= 1
+    resource_count += len(sound_files)
+    # As Godot writes it, load_steps counts the scene itself too
+    load_steps = resource_count + 1
+
+    writer = TscnWriter(out)
+    writer.header(load_steps, godot_uid(f"res://scenes/{level_name}.tscn"))
+    writer.ext_resource("PackedScene", "res://scenes/player.tscn", "1_player", uid="uid://b8j5k2x4y1z3")
+    dense = uses_dense_collectibles(level_config)
+    if chunk_count:
+        writer.ext_resource("Script", "res://scripts/chunk_streamer.gd", "2_chunk_streamer")
+        writer.ext_resource("Script", "res://scripts/game_manager.gd", "3_manager")
+    else:
+        write_content_resources(writer, dense)
+        writer.ext_resource("Script", "res://scripts/game_manager.gd", "3_manager")
+        writer.ext_resource("PackedScene", "res://scenes/platform.tscn", "4_platform", uid="uid://d5k7m9n1p3q5r")
 
-'''
+    # UI layer resource ID depends on whether the NPC resources are present
+    if has_npc:
+        npc_texture = npc_texture_path or os.path.join("assets", f"{level_name}_npc.svg")
+        writer.ext_resource("PackedScene", "res://scenes/npc.tscn", "5_npc", uid="uid://npc1a2b3c4d5e")
+        writer.ext_resource(texture_resource_type(npc_texture), f"res://{npc_texture.replace(os.sep, '/')}",
+                            "6_npc_texture")
+        ui_resource_id = "7_ui"
+        writer.ext_resource("PackedScene", "res://scenes/ui_layer.tscn", ui_resource_id, uid="uid://ui1a2b3c4d5e6")
+        # Add custom SpriteFrames sub-resource for level-specific NPC texture
+        writer.sub_resource("SpriteFrames", "SpriteFrames_NPC", [("animations", NPC_SPRITE_FRAMES)])
+    else:
+        ui_resource_id = "5_ui"
+        writer.ext_resource("PackedScene", "res://scenes/ui_layer.tscn", ui_resource_id, uid="uid://ui1a2b3c4d5e6")
+    for kind, sound_path in sound_files.items():
+        writer.ext_resource("AudioStream", sound_path, f"8_{kind}_sound")
+
+    writer.node("Main", "Node2D", properties=[
+        ("process_mode", "3"),
+        ("script", 'ExtResource("3_manager")'),
+    ])
+    writer.node("Background", "ColorRect", parent=".", properties=[
+        ("offset_right", f"{float(length)}"),
+        ("offset_bottom", "648.0"),
+        ("color", godot_color),
+    ])
+    writer.node("Player", parent=".", instance="1_player", properties=[
+        ("process_mode", "1"),
+        ("position", "Vector2(200, 400)"),
+    ])
+    writer.node("Camera2D", "Camera2D", parent="Player", properties=[
+        ("offset", "Vector2(200, 0)"),
+        ("limit_left", "0"),
+        ("limit_top", "0"),
+        ("limit_right", f"{length}"),
+        ("limit_bottom", "648"),
+        ("position_smoothing_enabled", "true"),
+        ("position_smoothing_speed", "5.0"),
+    ])
+
+    if chunk_count:
+        chunk_directory = os.path.dirname(level_chunk_path(level_config, 0)).replace(os.sep, '/')
+        writer.node("ChunkStreamer", "Node2D", parent=".", properties=[
+            ("script", 'ExtResource("2_chunk_streamer")'),
+            ("chunk_directory", godot_string(f"res://{chunk_directory}")),
+            ("chunk_count", f"{chunk_count}"),
+            ("chunk_width", f"{float(chunk_width)}"),
+        ])
+    else:
+        platform_positions, collectible_positions = layout or level_layout(level_config)
+        write_level_content(writer, platform_positions, collectible_positions, dense)
 
     # Add NPC if enabled
     if has_npc:
-        scene_content += '''[node name="NPC" parent="." instance=ExtResource("5_npc")]
-position = Vector2(800, 550)
-npc_message = "''' + npc_message + '''"
+        writer.node("NPC", parent=".", instance="5_npc", properties=[
+            ("position", "Vector2(800, 550)"),
+            ("npc_message", godot_string(npc_message)),
+        ])
+        writer.node("AnimatedSprite2D", parent="NPC", properties=[
+            ("sprite_frames", 'SubResource("SpriteFrames_NPC")'),
+        ])
+
+    writer.node("UILayer", parent=".", instance=ui_resource_id, properties=[
+        ("process_mode", "1"),
+    ])
+
+    # Level sounds, played by GameManager.play_level_sound()
+    if sound_files:
+        writer.node("LevelSounds", "Node", parent=".")
+        for kind, sound_path in sound_files.items():
+            writer.node(kind.capitalize(), "AudioStreamPlayer", parent="LevelSounds", properties=[
+                ("stream", f'ExtResource("8_{kind}_sound")'),
+            ])
+
+
+def stream_level_chunk(out, level_config, level_index, chunk_index, platforms, collectible_positions):
+    """Write one chunk scene of a chunked level: its platforms and collectibles, in level coordinates."""
+    # Collectibles (scene or CollectibleField script) and platform, plus the scene itself
+    resource_count = 2
+    writer = TscnWriter(out)
+    writer.header(resource_count + 1, godot_uid(res_path(level_chunk_path(level_config, chunk_index))))
+    dense = uses_dense_collectibles(level_config)
+    write_content_resources(writer, dense)
+    writer.ext_resource("PackedScene", "res://scenes/platform.tscn", "4_platform", uid="uid://d5k7m9n1p3q5r")
+    writer.node(f"Chunk{chunk_index}", "Node2D")
+    write_level_content(writer, platforms, collectible_positions, dense)
+
+
+def generate_level_scene(level_config, level_index, npc_texture_path=None):
+    """
+    Generate a level scene file (.tscn) based on level configuration and return it as a string.
+    Prefer stream_level_scene() for large levels; this keeps the whole scene in memory.
+    """
+    out = io.StringIO()
+    stream_level_scene(out, level_config, level_index, npc_texture_path)
+    return out.getvalue()
 
-[node name="AnimatedSprite2D" parent="NPC"]
-sprite_frames = SubResource("SpriteFrames_NPC")
 
-'''
+def level_workers():
+    """
+    Number of worker processes used to generate level scenes.
+    1 (default) generates serially; 0 uses one worker per CPU.
+    """
+    workers = int(hook_setting(LEVEL_WORKERS, "COOKIECUTTER_GODOT_LEVEL_WORKERS") or 1)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
 
-    # Add UI layer - use correct ExtResource ID based on whether NPC is present
-    ui_resource_id = "7_ui" if has_npc else "5_ui"
-    scene_content += f'''[node name="UILayer" parent="." instance=ExtResource("{ui_resource_id}")]
-process_mode = 1
-'''
 
-    return scene_content
+def setup_level_npc(level, messages):
+    """
+    Setup the NPC SVG for one level. Log lines are appended to messages.
+    Returns the path of the NPC texture, or None if the level has no NPC.
+    """
+    level_name = level['name']
+    npc_config = level.get('npc', {})
+    if not npc_config.get('enabled', False):
+        return None
 
+    npc_svg_path = npc_config.get('svg', '')
+    dest_path = os.path.join("assets", f"{level_name}_npc.svg")
+    kept_count = len(_kept_outputs)
 
-def setup_levels(levels_config):
+    def placed(path, message):
+        # An update run that kept the file from the previous run says so instead
+        if len(_kept_outputs) > kept_count:
+            message = f"Unchanged, kept {path}"
+        messages.append(f"  {level_name}: {message}")
+        return path
+
+    if npc_svg_path:
+        resolved_path = resolve_input(npc_svg_path)
+        if resolved_path:
+            return placed(copy_asset(resolved_path, dest_path, shareable=True),
+                          f"Copied NPC SVG from {resolved_path}")
+        # Use default NPC SVG; a streamed level was not seen by preflight_inputs()
+        check_input(f"{level_name} npc svg", npc_svg_path)
+        return placed(write_text_asset(dest_path, DEFAULT_NPC_SVG, shareable=True), "Using default NPC SVG")
+
+    # Use default NPC SVG
+    return placed(write_text_asset(dest_path, DEFAULT_NPC_SVG, shareable=True), "Created default NPC SVG")
+
+
+def level_fingerprint(level, level_index, npc_texture_path):
+    """
+    Hash every input that determines a level's scene: the level's config
+    entry, its position, NPC texture, the project seed, the player's jump
+    physics, the Godot version (it decides which scripts have UIDs) and the
+    scene format.
+    """
+    inputs = {
+        "level": level,
+        "index": level_index,
+        "npc_texture": npc_texture_path,
+        "godot_version": GODOT_VERSION,
+        "seed": hook_setting(LEVEL_SEED, "COOKIECUTTER_GODOT_LEVEL_SEED"),
+        "dense_collectibles": uses_dense_collectibles(level),
+        "chunks": level_chunks(level),
+        "physics": player_physics(),
+        "format": LEVEL_SCENE_FORMAT,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def level_dependencies(level, npc_texture_path):
+    """
+    List the resources a level needs, scene first, so LevelManager can load
+    them all in the background before the level starts. Player sprites are
+    loaded at runtime by player type and are added by LevelManager.
+    """
+    dependencies = [
+        f"res://scenes/{level['name']}.tscn",
+        "res://scenes/player.tscn",
+        "res://scripts/collectible_field.gd" if uses_dense_collectibles(level) else "res://scenes/collectible.tscn",
+        "res://scenes/platform.tscn",
+        "res://scripts/game_manager.gd",
+        "res://scenes/ui_layer.tscn",
+    ]
+    if level.get('npc', {}).get('enabled', False):
+        npc_texture = npc_texture_path or os.path.join("assets", f"{level['name']}_npc.svg")
+        dependencies += ["res://scenes/npc.tscn", f"res://{npc_texture.replace(os.sep, '/')}"]
+    dependencies += level.get('sound_files', {}).values()
+    # Chunked levels stream their chunks at runtime; preload the ones around the start
+    chunk_count = level_chunks(level)[1]
+    if chunk_count:
+        dependencies.append("res://scripts/chunk_streamer.gd")
+        dependencies += [f"res://{level_chunk_path(level, k).replace(os.sep, '/')}" for k in range(min(chunk_count, 2))]
+    return dependencies
+
+
+def write_level_scene(job):
+    """
+    Generate and write one level scene file. job is (level, level_index, npc_texture_path).
+    Module-level so it can be sent to process pool workers; returns the log
+    line, the scene size in bytes and the time spent writing it.
     """
-    Setup level-specific assets (NPCs, etc.) based on configuration
+    started = time.perf_counter()
+    level, level_index, npc_texture_path = job
+    scene_path = os.path.join("scenes", f"{level['name']}.tscn")
+    layout = level_layout(level)
+    with open(scene_path, 'w', buffering=1024 * 1024) as f:
+        stream_level_scene(f, level, level_index, npc_texture_path, layout)
+        size = f.tell()
+
+    chunk_width, chunk_count = level_chunks(level)
+    if chunk_count:
+        os.makedirs(os.path.dirname(level_chunk_path(level, 0)), exist_ok=True)
+        chunks = split_level_chunks(*layout, level_length(level), chunk_width, chunk_count)
+        for chunk_index, (platforms, positions) in enumerate(chunks):
+            with open(level_chunk_path(level, chunk_index), 'w', buffering=1024 * 1024) as f:
+                stream_level_chunk(f, level, level_index, chunk_index, platforms, positions)
+                size += f.tell()
+        message = f"  {level['name']}: Created scene file {scene_path} with {chunk_count} chunk scene(s)"
+    else:
+        message = f"  {level['name']}: Created scene file {scene_path}"
+    return message, size, time.perf_counter() - started
+
+
+LEVEL_MANIFEST_PATH = "levels.bin"
+LEVEL_MANIFEST_MAGIC = b"GLVL"
+LEVEL_MANIFEST_VERSION = 1
+
+
+def level_manifest_bytes(levels_config):
     """
-    print(f"Setting up {len(levels_config)} level(s)...")
+    Build the compact level manifest LevelManager reads at runtime.
 
-    for i, level in enumerate(levels_config):
-        level_name = level['name']
-        npc_config = level.get('npc', {})
+    Layout (little-endian): a 16-byte header (magic, version, level count,
+    offset table position), an offset table of (offset, length) uint32 pairs,
+    then one compact UTF-8 JSON record per level. The game seeks to a single
+    record instead of parsing the whole levels_config.json.
+    """
+    records = [json.dumps(level, separators=(",", ":")).encode() for level in levels_config]
+    table_offset = 16
+    offset = table_offset + 8 * len(records)
+    table = []
+    for record in records:
+        table.extend((offset, len(record)))
+        offset += len(record)
+    header = struct.pack("<4sIII", LEVEL_MANIFEST_MAGIC, LEVEL_MANIFEST_VERSION, len(records), table_offset)
+    return b"".join([header, struct.pack(f"<{len(table)}I", *table)] + records)
 
-        # Setup NPC SVG if needed
-        if npc_config.get('enabled', False):
-            npc_type = npc_config.get('type', 'npc')
-            npc_svg_path = npc_config.get('svg', '')
-            dest_path = os.path.join("assets", f"{level_name}_npc.svg")
 
-            if npc_svg_path:
-                resolved_path = resolve_path(npc_svg_path)
-                if resolved_path and os.path.isfile(resolved_path):
-                    shutil.copy(resolved_path, dest_path)
-                    print(f"  {level_name}: Copied NPC SVG from {resolved_path}")
-                else:
-                    # Use default NPC SVG
-                    with open(dest_path, "w") as f:
-                        f.write(DEFAULT_NPC_SVG)
-                    print(f"  {level_name}: Using default NPC SVG")
+def write_level_manifest(levels_config):
+    if write_output(LEVEL_MANIFEST_PATH, level_manifest_bytes(levels_config)):
+        print(f"Wrote level manifest to: {LEVEL_MANIFEST_PATH}")
+
+
+LEVEL_SHARD_DIR = "levels"
+# The underscore keeps the index out of the level name namespace
+LEVEL_INDEX_NAME = "_index"
+LEVEL_INDEX_PATH = os.path.join(LEVEL_SHARD_DIR, f"{LEVEL_INDEX_NAME}.json")
+LEVEL_BATCH_SIZE = 1024
+
+
+def write_level_shard(level):
+    """Write one level's configuration to levels/<name>.json (sharded output mode)"""
+    if level['name'] == LEVEL_INDEX_NAME:
+        raise ValueError(f"Level name '{LEVEL_INDEX_NAME}' is reserved for the level index in sharded output")
+    write_output(os.path.join(LEVEL_SHARD_DIR, f"{level['name']}.json"), json.dumps(level, indent=2))
+
+
+def write_level_index(level_names):
+    """Write levels/_index.json, the only file LevelManager reads at startup in sharded mode"""
+    content = json.dumps({"count": len(level_names), "levels": level_names}, indent=2)
+    if write_output(LEVEL_INDEX_PATH, content):
+        print(f"Wrote level index to: {LEVEL_INDEX_PATH}")
+    else:
+        print(f"Level index unchanged: {LEVEL_INDEX_PATH}")
+
+
+def remove_unused_level_index(sharded):
+    """
+    Delete the level manifest or shard index left by a run in the other
+    levels_output mode. LevelManager opens levels.bin before
+    levels/_index.json, so a stale manifest would hide the shards.
+    """
+    path = LEVEL_MANIFEST_PATH if sharded else LEVEL_INDEX_PATH
+    if os.path.isfile(path):
+        os.remove(path)
+        _previous_outputs.pop(_output_key(path), None)
+        print(f"Removed {path} (levels_output is {levels_output()})")
+
+
+def setup_levels(levels_config):
+    """
+    Setup level-specific assets (NPCs, etc.) based on configuration.
+    levels_config may be a stream (sharded output mode); levels are then
+    processed in batches so only one batch is held in memory.
+    In update mode, levels whose inputs are unchanged keep their existing scene file.
+    """
+    sharded = levels_output() == "sharded"
+    if sharded:
+        os.makedirs(LEVEL_SHARD_DIR, exist_ok=True)
+        print("Setting up levels (sharded level configuration)...")
+        workers = level_workers()
+    else:
+        print(f"Setting up {len(levels_config)} level(s)...")
+        workers = min(level_workers(), len(levels_config))
+
+    executor = None
+    level_names = []
+    levels = iter(levels_config)
+    for batch in iter(lambda: list(itertools.islice(levels, LEVEL_BATCH_SIZE)), []):
+        # Assets go through the shared cache/dedupe registry, so they are placed
+        # in this process; only scene generation may fan out to the pool
+        render_level_sounds(batch)
+        jobs = []
+        level_messages = []
+        level_seconds = []
+        for level in batch:
+            messages = []
+            started = time.perf_counter()
+            level_index = len(level_names) + 1
+            level_names.append(level['name'])
+            npc_texture_path = setup_level_npc(level, messages)
+            if npc_texture_path and texture_atlas_enabled():
+                npc_texture_path = atlas_sprite(npc_texture_path)
+            scene_path = os.path.join("scenes", f"{level['name']}.tscn")
+            fingerprint = level_fingerprint(level, level_index, npc_texture_path)
+            chunk_paths = [level_chunk_path(level, k) for k in range(level_chunks(level)[1])]
+            for path in [scene_path] + chunk_paths:
+                record_output(path, fingerprint)
+            if output_is_current(scene_path, fingerprint) and all(map(os.path.isfile, chunk_paths)):
+                _kept_outputs.extend([scene_path] + chunk_paths)
+                messages.append(f"  {level['name']}: Unchanged, kept {scene_path}")
+                jobs.append(None)
             else:
-                # Use default NPC SVG
-                with open(dest_path, "w") as f:
-                    f.write(DEFAULT_NPC_SVG)
-                print(f"  {level_name}: Created default NPC SVG")
-
-        # Generate level scene file
-        scene_content = generate_level_scene(level, i + 1)
-        scene_path = os.path.join("scenes", f"{level_name}.tscn")
-        with open(scene_path, 'w') as f:
-            f.write(scene_content)
-        print(f"  {level_name}: Created scene file {scene_path}")
+                jobs.append((level, level_index, npc_texture_path))
+            level['dependencies'] = level_dependencies(level, npc_texture_path)
+            if sharded:
+                write_level_shard(level)
+            level_messages.append(messages)
+            level_seconds.append(time.perf_counter() - started)
+
+        pending = [job for job in jobs if job is not None]
+        if workers <= 1 or len(pending) <= 1:
+            scene_results = map(write_level_scene, pending)
+        else:
+            if executor is None:
+                print(f"Generating level scenes with {workers} worker processes...")
+                executor = ProcessPoolExecutor(max_workers=workers)
+            chunksize = max(1, len(pending) // (workers * 4))
+            scene_results = executor.map(write_level_scene, pending, chunksize=chunksize)
+
+        # map() yields results in submission order, so the log stays in level order
+        for level, messages, seconds, job in zip(batch, level_messages, level_seconds, jobs):
+            size = 0
+            if job is not None:
+                message, size, scene_seconds = next(scene_results)
+                messages.append(message)
+                seconds += scene_seconds
+                _profile.record_file(os.path.join("scenes", f"{level['name']}.tscn"), size)
+            _profile.record_level(level['name'], seconds, size)
+            print("\n".join(messages))
+
+    if executor is not None:
+        executor.shutdown()
+
+    if sharded:
+        print(f"Set up {len(level_names)} level(s)")
+        write_level_index(level_names)
+        remove_unused_level_index(sharded)
+        return
 
     # Write levels configuration to a file for the game to read
     config_path = os.path.join("levels_config.json")
-    with open(config_path, 'w') as f:
-        json.dump({"levels": levels_config}, f, indent=2)
-    print(f"Wrote levels configuration to: {config_path}")
+    if write_output(config_path, json.dumps({"levels": levels_config}, indent=2)):
+        print(f"Wrote levels configuration to: {config_path}")
+    else:
+        print(f"Levels configuration unchanged: {config_path}")
+    write_level_manifest(levels_config)
+    remove_unused_level_index(sharded)
+
+
+def preflight_inputs(levels_config=None):
+    """
+    Resolve every input file the project references in one pass, before
+    anything is generated, and queue the missing ones for
+    report_missing_inputs(). Level NPC SVGs are checked here when the levels
+    config is in memory; in sharded mode each is checked as its level streams in.
+    """
+    custom_svgs = parse_player_svgs()
+    for player_type in (t.strip() for t in PLAYER_TYPES.split(",")):
+        check_input(f"custom_player_svgs ({player_type})", custom_svgs.get(player_type))
+    if INCLUDE_NPC.lower() == "yes":
+        check_input("custom_npc_svg", CUSTOM_NPC_SVG_PATH)
+    check_input("victory_sound", VICTORY_SOUND_PATH)
+
+    if LEVEL_COUNT > 1:
+        check_input("levels_config", LEVELS_CONFIG_PATH)
+    if isinstance(levels_config, list):
+        for level in levels_config:
+            npc_config = level.get('npc', {})
+            if npc_config.get('enabled', False):
+                check_input(f"{level['name']} npc svg", npc_config.get('svg', ''))
+
+
+# Module constant holding each cookiecutter variable the hook reads
+CONTEXT_SETTINGS = {
+    "custom_player_svgs": "CUSTOM_PLAYER_SVGS",
+    "player_types": "PLAYER_TYPES",
+    "include_npc": "INCLUDE_NPC",
+    "custom_npc_svg": "CUSTOM_NPC_SVG_PATH",
+    "victory_sound": "VICTORY_SOUND_PATH",
+    "level_count": "LEVEL_COUNT",
+    "levels_config": "LEVELS_CONFIG_PATH",
+    "asset_cache": "ASSET_CACHE",
+    "dedupe_assets": "DEDUPE_ASSETS",
+    "level_workers": "LEVEL_WORKERS",
+    "level_seed": "LEVEL_SEED",
+    "levels_output": "LEVELS_OUTPUT",
+    "dense_collectibles": "DENSE_COLLECTIBLES",
+    "level_chunk_width": "LEVEL_CHUNK_WIDTH",
+    "generation_report": "GENERATION_REPORT",
+    "generation_profile": "GENERATION_PROFILE",
+    "sound_format": "SOUND_FORMAT",
+    "performance_monitor": "PERFORMANCE_MONITOR",
+    "log_level": "LOG_LEVEL",
+    "texture_atlas": "TEXTURE_ATLAS",
+    "godot_version": "GODOT_VERSION",
+}
+
+
+def configure(context):
+    """
+    Prepare the hook to generate another project in the same process
+    (see scripts/batch_generate.py): apply that project's cookiecutter
+    context and reset all per-run state. Process-wide caches (input file
+    lookups, asset bytes, player physics) are kept and shared by every
+    project generated afterwards.
+    """
+    global _profile, _memory_assets
+    for key, name in CONTEXT_SETTINGS.items():
+        if key in context:
+            value = str(context[key])
+            globals()[name] = int(value) if name == "LEVEL_COUNT" else value
+
+    _profile = GenerationProfile()
+    if _memory_assets is None:
+        _memory_assets = {}
+    for state in (_previous_outputs, _generated_outputs, _placed_assets, _missing_inputs, _jingle_paths,
+                  _atlas_sprites):
+        state.clear()
+    _placed_paths.clear()
+    _atlas_sources.clear()
+    del _kept_outputs[:]
+    del _deduplicated_assets[:]
 
 
 def main():
-    setup_player_svg()
-    setup_npc()
-    setup_victory_sound()
+    if update_mode():
+        print("Update mode: only outputs whose inputs changed will be rewritten")
+    load_generation_manifest()
+
+    levels_config = None
+    with _profile.stage("preflight"):
+        if LEVEL_COUNT > 1:
+            levels_config = load_levels_config()
+        preflight_inputs(levels_config)
+        report_missing_inputs()
+
+    with _profile.stage("player_svgs"):
+        setup_player_svg()
+    with _profile.stage("npc"):
+        setup_npc()
+    with _profile.stage("victory_sound"):
+        setup_victory_sound()
 
     # Setup levels if count > 1
     if LEVEL_COUNT > 1:
-        levels_config = load_levels_config()
-        setup_levels(levels_config)
+        with _profile.stage("levels"):
+            setup_levels(levels_config)
     else:
         print("Single level mode - no level configuration needed")
 
+    if texture_atlas_enabled():
+        with _profile.stage("atlas"):
+            build_texture_atlas()
+
+    with _profile.stage("finalize"):
+        setup_performance_monitor()
+        strip_debug_logging()
+        write_uid_sidecars()
+        report_missing_inputs()
+        report_deduplicated_assets()
+        if asset_cache_enabled():
+            evict_asset_cache()
+
+        save_generation_manifest()
+        if update_mode():
+            report_update()
+
+    _profile.print_summary()
+    report_path = resolve_output_path(hook_setting(GENERATION_REPORT, "COOKIECUTTER_GODOT_GENERATION_REPORT"))
+    if report_path:
+        _profile.write_report(report_path)
+
 
 if __name__ == "__main__":
-    main()
+    profile_path = resolve_output_path(hook_setting(GENERATION_PROFILE, "COOKIECUTTER_GODOT_GENERATION_PROFILE"))
+    if profile_path:
+        # Level scenes written by worker processes are not part of the profile
+        profiler = cProfile.Profile()
+        profiler.runcall(main)
+        profiler.dump_stats(profile_path)
+        print(f"Wrote cProfile data to: {profile_path}")
+    else:
+        main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Generate many projects from this template in one batch.
+
+Reads one cookiecutter context per line from a JSONL file. Keys a line does
+not set take the cookiecutter.json defaults, and every project needs its own
+project_slug. Template files are rendered by cookiecutter with hooks turned
+off; the post-generation hook then runs in-process. Each worker loads the
+hook once and keeps its caches of input file lookups and asset bytes across
+every project it generates, so shared SVGs and sounds are read (and default
+assets synthesized) once per worker instead of once per project.
+
+Relative input paths in a context are resolved from the output directory,
+as if cookiecutter had been run there.
+
+Usage:
+    python scripts/batch_generate.py CONTEXTS.jsonl [--output-dir DIR] [--workers N] [--verbose]
+"""
+import argparse
+import collections
+import contextlib
+import io
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cookiecutter.main import cookiecutter
+
+from hook_loader import ROOT, default_context, load_hook
+
+_hook = None  # Loaded once per process by generate_project()
+
+
+def read_contexts(path):
+    """Read the JSONL file into full cookiecutter contexts (defaults plus each line's overrides)."""
+    contexts = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            overrides = json.loads(line)
+            if not isinstance(overrides, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object")
+            contexts.append(default_context(overrides))
+
+    slugs = collections.Counter(context["project_slug"] for context in contexts)
+    duplicates = sorted(slug for slug, count in slugs.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"{path}: project_slug must be unique, repeated: {', '.join(duplicates)}")
+    return contexts
+
+
+def generate_project(context, output_dir):
+    """
+    Render one project and run the hook in it.
+    Returns (project_slug, seconds, hook log, error message or None).
+    """
+    global _hook
+    if _hook is None:
+        _hook = load_hook()
+
+    started = time.perf_counter()
+    log = io.StringIO()
+    cwd = os.getcwd()
+    error = None
+    try:
+        with contextlib.redirect_stdout(log):
+            project_dir = cookiecutter(ROOT, no_input=True, extra_context=context, output_dir=output_dir,
+                                       overwrite_if_exists=True, accept_hooks=False)
+            os.chdir(project_dir)
+            _hook.configure(context)
+            _hook.main()
+    except (Exception, SystemExit) as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        os.chdir(cwd)
+    return context["project_slug"], time.perf_counter() - started, log.getvalue(), error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("contexts", help="JSONL file with one cookiecutter context per line")
+    parser.add_argument("--output-dir", default=".", help="directory the projects are generated in")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (0: one per CPU)")
+    parser.add_argument("--verbose", action="store_true", help="print each project's hook output")
+    args = parser.parse_args()
+
+    contexts = read_contexts(args.contexts)
+    output_dir = os.path.abspath(args.output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+
+    started = time.perf_counter()
+    failures = 0
+    with contextlib.ExitStack() as stack:
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = executor.map(generate_project, contexts, itertools.repeat(output_dir))
+        else:
+            results = map(generate_project, contexts, itertools.repeat(output_dir))
+
+        for slug, seconds, log, error in results:
+            if args.verbose:
+                print(log, end="")
+            if error:
+                failures += 1
+            print(f"{slug:<32}{seconds * 1000:>10.1f} ms  {'FAILED: ' + error if error else 'ok'}")
+
+    elapsed = time.perf_counter() - started
+    count = len(contexts)
+    print(f"Generated {count - failures} of {count} project(s) in {elapsed:.2f} s "
+          f"({count / elapsed:.1f} projects/s, {workers} worker(s))")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
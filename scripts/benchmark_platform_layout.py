@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark the platform layout engine of the post-generation hook.
+
+Generates levels with increasing numbers of platforms, runs the jump
+reachability check over them and reports the cost per platform, which
+should stay flat as the level grows. Also confirms every platform and
+collectible in the generated levels is reachable.
+
+Usage:
+    python scripts/benchmark_platform_layout.py [--sizes N,N,...] [--layout LAYOUT] [--repeat N]
+"""
+import argparse
+import os
+import time
+
+from hook_loader import TEMPLATE_DIR, load_hook
+
+
+def time_layout(hook, level, repeat):
+    """Return the best wall time (in s) to lay out a level and check its reachability, and the layout."""
+    reach = hook.JumpReach(hook.player_physics())
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        platforms, positions = hook.level_layout(level)
+        reached = hook.reachable_platforms(platforms, reach)
+        best = min(best, time.perf_counter() - start)
+    return best, platforms, positions, reached
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,50000", help="comma-separated target platform counts")
+    parser.add_argument("--layout", default="random", help="level layout to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (best is reported)")
+    args = parser.parse_args()
+
+    hook = load_hook()
+    # Read the template player, as the hook reads the generated project's player
+    os.chdir(TEMPLATE_DIR)
+    reach = hook.JumpReach(hook.player_physics())
+
+    backend = "numpy" if hook.numpy is not None else "python"
+    print(f"Layout backend: {backend}")
+    print(f"Jump: rise {reach.max_rise:.0f} px, level distance {reach.distance(0):.0f} px")
+    print(f"{'platforms':>10}{'length px':>12}{'total ms':>11}{'us/platform':>13}{'reachable':>11}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        level = {"name": f"benchmark_{size}", "layout": args.layout, "collectibles": size, "length": size * 400}
+        seconds, platforms, positions, reached = time_layout(hook, level, args.repeat)
+        checked = hook.ensure_collectibles_reachable(positions, platforms, reach)
+        reachable = "yes" if all(reached) and checked is positions else "NO"
+        print(f"{len(platforms):>10}{level['length']:>12}{seconds * 1000:>11.1f}"
+              f"{seconds / len(platforms) * 1e6:>13.2f}{reachable:>11}")
+
+
+if __name__ == "__main__":
+    main()
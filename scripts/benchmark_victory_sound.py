@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark victory sound synthesis.
+
+Compares the original per-sample writer (one struct.pack + writeframes call
+per sample) with the buffered synthesize_notes() implementation and reports
+the cost per second of generated audio.
+
+Usage:
+    python scripts/benchmark_victory_sound.py [--duration SECONDS] [--repeat N]
+"""
+import argparse
+import math
+import os
+import struct
+import tempfile
+import time
+import wave
+
+import generate_victory_sound as victory
+
+
+def legacy_generate_victory_sound(output_path, duration=0.6, sample_rate=44100, channels=1):
+    """Original implementation: one writeframes() call per sample."""
+    notes = [523, 659, 784]
+    note_duration = duration / len(notes)
+    samples_per_note = int(sample_rate * note_duration)
+
+    with wave.open(output_path, 'w') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+
+        for freq in notes:
+            for i in range(samples_per_note):
+                t = i / sample_rate
+                envelope = min(i / (samples_per_note * 0.1),
+                             (samples_per_note - i) / (samples_per_note * 0.2))
+                envelope = min(envelope, 1.0)
+                sample = int(32767 * 0.3 * envelope * math.sin(2 * math.pi * freq * t))
+                wav_file.writeframes(struct.pack('<h', sample) * channels)
+
+
+def buffered_generate_victory_sound(output_path, duration=0.6, sample_rate=44100, channels=1):
+    """Current implementation, without the progress print."""
+    frames = victory.synthesize_notes([523, 659, 784], duration, sample_rate, channels)
+    with wave.open(output_path, 'w') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(frames)
+
+
+def time_per_audio_second(generator, output_path, duration, sample_rate, channels, repeat):
+    """Return the best wall time (in ms) spent per second of generated audio."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        generator(output_path, duration, sample_rate, channels)
+        best = min(best, time.perf_counter() - start)
+    return best / duration * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds of audio per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (best is reported)")
+    args = parser.parse_args()
+
+    backend = "numpy" if victory.numpy is not None else "array"
+    print(f"Synthesis backend: {backend}")
+    print(f"{'format':<16}{'legacy ms/s':>14}{'buffered ms/s':>16}{'speedup':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "victory.wav")
+        for sample_rate, channels in ((44100, 1), (48000, 2)):
+            legacy = time_per_audio_second(legacy_generate_victory_sound, output_path,
+                                           args.duration, sample_rate, channels, args.repeat)
+            buffered = time_per_audio_second(buffered_generate_victory_sound, output_path,
+                                             args.duration, sample_rate, channels, args.repeat)
+            label = f"{sample_rate} Hz x{channels}"
+            print(f"{label:<16}{legacy:>14.2f}{buffered:>16.2f}{legacy / buffered:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,75 @@
 #!/usr/bin/env python3
+import sys
 import wave
 import math
-import struct
+from array import array
 
-def generate_victory_sound(output_path, duration=0.6, sample_rate=44100):
+try:
+    import numpy
+except ImportError:  # NumPy is optional; synthesis falls back to the array module
+    numpy = None
+
+
+def synthesize_notes(notes, duration, sample_rate=44100, channels=1, volume=0.3):
+    """
+    Render a sequence of enveloped sine notes as 16-bit little-endian PCM bytes.
+
+    The whole signal is built in one buffer (NumPy when available, otherwise
+    an array('h')) so it can be handed to wave.writeframes() in a single call.
+    Multi-channel output duplicates the mono signal into every channel.
+    """
+    note_duration = duration / len(notes)
+    samples_per_note = int(sample_rate * note_duration)
+    amplitude = 32767 * volume
+    fade_in = samples_per_note * 0.1
+    fade_out = samples_per_note * 0.2
+
+    if numpy is not None:
+        i = numpy.arange(samples_per_note)
+        t = i / sample_rate
+        envelope = numpy.minimum(numpy.minimum(i / fade_in, (samples_per_note - i) / fade_out), 1.0)
+        signal = numpy.concatenate([
+            (amplitude * envelope * numpy.sin(2 * math.pi * freq * t)).astype('<i2')
+            for freq in notes
+        ])
+        if channels > 1:
+            signal = numpy.repeat(signal, channels)
+        return signal.tobytes()
+
+    # Pure-Python fallback: same maths, but still a single contiguous buffer
+    signal = array('h')
+    for freq in notes:
+        step = 2 * math.pi * freq
+        signal.extend(
+            int(amplitude * min(i / fade_in, (samples_per_note - i) / fade_out, 1.0)
+                * math.sin(step * (i / sample_rate)))
+            for i in range(samples_per_note)
+        )
+    if channels > 1:
+        interleaved = array('h', bytes(len(signal) * channels * 2))
+        for channel in range(channels):
+            interleaved[channel::channels] = signal
+        signal = interleaved
+    if sys.byteorder == 'big':
+        signal.byteswap()
+    return signal.tobytes()
+
+
+def generate_victory_sound(output_path, duration=0.6, sample_rate=44100, channels=1):
     """
     Generate a simple victory sound (three ascending notes: C, E, G)
     """
     # Notes: C5 (523 Hz), E5 (659 Hz), G5 (784 Hz)
     notes = [523, 659, 784]
-    note_duration = duration / len(notes)
-    samples_per_note = int(sample_rate * note_duration)
+    frames = synthesize_notes(notes, duration, sample_rate, channels)
 
     # Open WAV file
     with wave.open(output_path, 'w') as wav_file:
-        # Set parameters: 1 channel (mono), 2 bytes per sample (16-bit), sample_rate
-        wav_file.setnchannels(1)
+        # Set parameters: 2 bytes per sample (16-bit), sample_rate
+        wav_file.setnchannels(channels)
         wav_file.setsampwidth(2)
         wav_file.setframerate(sample_rate)
-
-        # Generate each note
-        for freq in notes:
-            for i in range(samples_per_note):
-                # Generate sine wave with envelope (fade in/out)
-                t = i / sample_rate
-                envelope = min(i / (samples_per_note * 0.1),
-                             (samples_per_note - i) / (samples_per_note * 0.2))
-                envelope = min(envelope, 1.0)
-
-                # Generate sine wave sample
-                sample = int(32767 * 0.3 * envelope * math.sin(2 * math.pi * freq * t))
-                # Pack as signed 16-bit integer
-                wav_file.writeframes(struct.pack('<h', sample))
+        wav_file.writeframes(frames)
 
     print(f"Generated victory sound: {output_path}")
 
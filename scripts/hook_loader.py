@@ -0,0 +1,44 @@
+"""
+Load the post-generation hook as a Python module, outside of cookiecutter.
+
+The hook is a Jinja template: its cookiecutter placeholders are filled from
+the defaults in cookiecutter.json, plus any overrides, before it is compiled.
+Used by the benchmark and batch scripts in this directory.
+"""
+import importlib.util
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(ROOT, "{{cookiecutter.project_slug}}")
+HOOK_PATH = os.path.join(ROOT, "hooks", "post_gen_project.py")
+
+
+def default_context(overrides=None):
+    """Return the cookiecutter.json defaults updated with overrides."""
+    with open(os.path.join(ROOT, "cookiecutter.json")) as f:
+        context = json.load(f)
+    context.update(overrides or {})
+    return context
+
+
+def render(source, context):
+    """Fill the {{ cookiecutter.* }} placeholders of a template file (no other Jinja syntax)."""
+    return re.sub(r"\{\{ cookiecutter\.(\w+) \}\}", lambda m: str(context[m.group(1)]), source)
+
+
+def load_hook(overrides=None):
+    """Render hooks/post_gen_project.py with the default context and load it as a module."""
+    context = default_context(overrides)
+    with open(HOOK_PATH) as f:
+        source = render(f.read(), context)
+
+    # Registered in sys.modules so the hook's functions can be pickled
+    # when it hands level scenes to a process pool (level_workers > 1)
+    spec = importlib.util.spec_from_file_location("post_gen_project", HOOK_PATH)
+    hook = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = hook
+    exec(compile(source, HOOK_PATH, "exec"), hook.__dict__)
+    return hook
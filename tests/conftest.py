@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The batch and benchmark scripts import hook_loader as a top-level module
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
@@ -0,0 +1,25 @@
+"""Tests for scripts/batch_generate.py."""
+import os
+
+import pytest
+
+pytest.importorskip("cookiecutter")
+
+import batch_generate  # noqa: E402
+from hook_loader import ROOT, default_context  # noqa: E402
+
+
+def test_level_workers_in_batch(tmp_path):
+    """Level scenes handed to a process pool must pickle the in-process hook's functions."""
+    context = default_context({
+        "project_slug": "parallel_levels",
+        "level_count": "3",
+        "level_workers": "2",
+        "levels_config": os.path.join(ROOT, "example_levels.json"),
+    })
+    slug, _, log, error = batch_generate.generate_project(context, str(tmp_path))
+
+    assert error is None, log
+    assert "Generating level scenes with 2 worker processes" in log
+    for level in ("level_1", "level_2", "level_3"):
+        assert (tmp_path / slug / "scenes" / f"{level}.tscn").is_file()
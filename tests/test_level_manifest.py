@@ -0,0 +1,61 @@
+"""Tests for the levels.bin manifest the hook writes and LevelManager reads."""
+import json
+import os
+import re
+import struct
+
+import pytest
+
+from hook_loader import ROOT, TEMPLATE_DIR, default_context, load_hook
+
+hook = load_hook()
+
+
+def read_level(data, index):
+    """Read one record the way level_manager.gd's read_level_config() does."""
+    table_offset = struct.unpack_from("<I", data, 12)[0]
+    offset, length = struct.unpack_from("<II", data, table_offset + index * 8)
+    return json.loads(data[offset:offset + length].decode("utf-8"))
+
+
+def test_byte_layout():
+    data = hook.level_manifest_bytes([{"name": "a"}, {"name": "bé", "n": 2}])
+    record_a = b'{"name":"a"}'
+    record_b = b'{"name":"b\\u00e9","n":2}'  # Records are compact, ASCII-escaped JSON
+    assert data == (
+        b"GLVL" + struct.pack("<III", 1, 2, 16)
+        + struct.pack("<IIII", 32, len(record_a), 32 + len(record_a), len(record_b))
+        + record_a + record_b
+    )
+
+
+def test_empty_manifest():
+    assert hook.level_manifest_bytes([]) == b"GLVL" + struct.pack("<III", 1, 0, 16)
+
+
+def test_matches_gdscript_reader_constants():
+    with open(os.path.join(TEMPLATE_DIR, "scripts", "level_manager.gd")) as f:
+        source = f.read()
+    assert re.search(r'const MANIFEST_MAGIC = "(\w+)"', source).group(1).encode() == hook.LEVEL_MANIFEST_MAGIC
+    assert int(re.search(r"const MANIFEST_VERSION = (\d+)", source).group(1)) == hook.LEVEL_MANIFEST_VERSION
+    assert re.search(r'const MANIFEST_PATH = "res://([\w.]+)"', source).group(1) == hook.LEVEL_MANIFEST_PATH
+
+
+def test_generated_manifest_holds_every_level(tmp_path):
+    pytest.importorskip("cookiecutter")
+    import batch_generate
+
+    context = default_context({
+        "project_slug": "manifest",
+        "level_count": "3",
+        "levels_config": os.path.join(ROOT, "example_levels.json"),
+    })
+    slug, _, log, error = batch_generate.generate_project(context, str(tmp_path))
+    assert error is None, log
+
+    project = tmp_path / slug
+    levels = json.loads((project / "levels_config.json").read_text())["levels"]
+    data = (project / "levels.bin").read_bytes()
+    magic, version, count, _ = struct.unpack_from("<4sIII", data)
+    assert (magic, version, count) == (b"GLVL", 1, len(levels))
+    assert [read_level(data, i) for i in range(count)] == levels
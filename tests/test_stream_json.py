@@ -0,0 +1,75 @@
+"""Tests for the incremental JSON reader used by sharded level output."""
+import io
+import json
+import re
+
+import pytest
+
+from hook_loader import load_hook
+
+hook = load_hook()
+
+
+class Trickle:
+    """Text file that returns at most size characters per read(), whatever is asked for."""
+
+    def __init__(self, text, size):
+        self.f = io.StringIO(text)
+        self.size = size
+
+    def read(self, n=-1):
+        return self.f.read(self.size)
+
+
+LEVELS = [
+    {"name": "level_1", "collectibles": 12345, "npc": {"enabled": True, "message": "Hi, \"you\"!"}},
+    {"name": "level_2", "target_score": -1.5e3, "layout": None, "tags": ["a", "b"]},
+]
+
+
+def levels(text, size):
+    return list(hook.stream_json_array(Trickle(text, size), "levels"))
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_values_across_buffer_boundaries(size):
+    text = json.dumps({"meta": {"levels": [0]}, "levels": LEVELS, "after": 1})
+    assert levels(text, size) == LEVELS
+
+
+@pytest.mark.parametrize("size", [1, 5])
+def test_whitespace_and_commas_between_chunks(size):
+    text = ' \n{ "levels" :\t[\n  {"name": "a"}\r\n ,\n\n {"name": "b"} ,{"name":"c"}  ]\n}\n '
+    assert [level["name"] for level in levels(text, size)] == ["a", "b", "c"]
+
+
+def test_number_at_end_of_chunk_is_not_cut():
+    # Each read ends inside the number, so 123456 must not be decoded as 1 or 12
+    assert levels('{"levels": [123456, 7]}', 13) == [123456, 7]
+
+
+def test_empty_array():
+    assert levels('{"levels": []}', 1) == []
+    assert levels('{"levels": [ \n ]}', 64) == []
+
+
+def test_missing_key():
+    with pytest.raises(KeyError):
+        levels('{"other": [1, 2]}', 3)
+
+
+@pytest.mark.parametrize("text, message", [
+    ("", "expected '{' but found 'end of file'"),
+    ('{"levels": [{"name": "a"}', "expected ',' but found 'end of file'"),
+    ('{"levels": [{"name": "a"} {"name": "b"}]}', "expected ','"),
+    ('{"levels": [1, 2,]}', "trailing ','"),
+    ('{"levels": 5}', "expected '['"),
+])
+def test_malformed_input(text, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        levels(text, 4)
+
+
+def test_truncated_value():
+    with pytest.raises(ValueError):
+        levels('{"levels": [{"name": "lev', 4)
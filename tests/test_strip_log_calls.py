@@ -0,0 +1,29 @@
+"""Tests for the log_level stripping of generated GDScript."""
+import os
+
+from hook_loader import TEMPLATE_DIR, default_context, load_hook, render
+
+
+def _opener(lines, i):
+    return next(line for line in reversed(lines[:i]) if line.strip() and not line.strip().startswith("#"))
+
+
+def _indent(line):
+    return len(line) - len(line.lstrip())
+
+
+def test_error_level_game_manager_pass_only_in_emptied_blocks():
+    hook = load_hook()
+    with open(os.path.join(TEMPLATE_DIR, "scripts", "game_manager.gd")) as f:
+        source = render(f.read(), default_context())
+
+    stripped, removed = hook.strip_log_calls(source, "error")
+    assert removed > 0
+    assert 'print("Game started with ' not in stripped
+
+    lines = stripped.splitlines()
+    for i, line in enumerate(lines):
+        if line.strip() == "pass":
+            opener = _opener(lines, i)
+            assert opener.rstrip().endswith(":"), f"line {i + 1}: pass outside an emptied block"
+            assert _indent(line) > _indent(opener), f"line {i + 1}: pass not inside {opener.strip()!r}"
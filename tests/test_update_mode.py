@@ -0,0 +1,90 @@
+"""Tests for the incremental update mode (COOKIECUTTER_GODOT_UPDATE=yes)."""
+import json
+import os
+
+import pytest
+
+cookiecutter = pytest.importorskip("cookiecutter.main").cookiecutter
+
+from hook_loader import ROOT, default_context, load_hook  # noqa: E402
+
+hook = load_hook()
+OLD = 1_000_000_000_000_000_000  # mtime (ns) set on every file after the first run
+LEVELS = ["level_1", "level_2", "level_3"]
+
+
+def generate(output_dir, levels_config, monkeypatch, update):
+    """Render the template with cookiecutter (hooks off) unless it exists, then run the hook in it."""
+    context = default_context({"project_slug": "game", "level_count": "3", "levels_config": str(levels_config)})
+    project = output_dir / "game"
+    if not project.exists():
+        cookiecutter(ROOT, no_input=True, extra_context=context, output_dir=str(output_dir), accept_hooks=False)
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("COOKIECUTTER_GODOT_UPDATE", "yes" if update else "no")
+    hook.configure(context)
+    hook.main()
+    return project
+
+
+def snapshot(project):
+    outputs = [f"scenes/{name}.tscn" for name in LEVELS] + [f"assets/{name}_npc.svg" for name in LEVELS]
+    outputs += ["levels.bin", "levels_config.json", "assets/victory.wav"]
+    return {path: (os.stat(project / path).st_mtime_ns, (project / path).read_bytes()) for path in outputs}
+
+
+def age(project):
+    for dirpath, _, filenames in os.walk(project):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), ns=(OLD, OLD))
+
+
+def edit_level_2(source, dest):
+    with open(source) as f:
+        config = json.load(f)
+    config["levels"][1]["npc"]["message"] = "Level 2 changed"
+    with open(dest, "w") as f:
+        json.dump(config, f)
+
+
+def test_update_rewrites_only_changed_outputs(tmp_path, monkeypatch):
+    levels_config = tmp_path / "levels.json"
+    with open(os.path.join(ROOT, "example_levels.json")) as f:
+        levels_config.write_text(f.read())
+
+    project = generate(tmp_path / "out", levels_config, monkeypatch, update=False)
+    age(project)
+    before = snapshot(project)
+
+    # Nothing changed: every output keeps its bytes and mtime
+    generate(tmp_path / "out", levels_config, monkeypatch, update=True)
+    assert snapshot(project) == before
+
+    # One level changed: only its scene and the level configuration are rewritten
+    edit_level_2(levels_config, levels_config)
+    generate(tmp_path / "out", levels_config, monkeypatch, update=True)
+    after = snapshot(project)
+    rewritten = sorted(path for path in after if after[path] != before[path])
+    assert rewritten == ["levels.bin", "levels_config.json", "scenes/level_2.tscn"]
+    assert b"Level 2 changed" in after["scenes/level_2.tscn"][1]
+    assert all(after[path][0] != OLD for path in rewritten)
+
+    # The update result matches a full generation from the same inputs
+    fresh = snapshot(generate(tmp_path / "fresh", levels_config, monkeypatch, update=False))
+    assert {path: content for path, (_, content) in after.items()} == \
+        {path: content for path, (_, content) in fresh.items()}
+
+
+def test_scene_format_bump_rewrites_every_scene(tmp_path, monkeypatch):
+    levels_config = os.path.join(ROOT, "example_levels.json")
+    project = generate(tmp_path / "out", levels_config, monkeypatch, update=False)
+    age(project)
+    before = snapshot(project)
+
+    monkeypatch.setattr(hook, "LEVEL_SCENE_FORMAT", hook.LEVEL_SCENE_FORMAT + 1)
+    generate(tmp_path / "out", levels_config, monkeypatch, update=True)
+    after = snapshot(project)
+    for name in LEVELS:
+        path = f"scenes/{name}.tscn"
+        assert after[path][0] != OLD, f"{path} should be rewritten"
+        assert after[path][1] == before[path][1], f"{path} should have the same content"
+    assert after["assets/victory.wav"] == before["assets/victory.wav"]
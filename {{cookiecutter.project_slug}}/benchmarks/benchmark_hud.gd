@@ -0,0 +1,86 @@
+extends SceneTree
+
+# Benchmark the HUD updates of a timed level.
+# Compares the script time per frame of the signal-driven HUD (game_manager.gd
+# and hud.gd) with the previous approach, which looked up the three labels and
+# rebuilt their text on every frame. The level is filled with collectible-like
+# nodes so the measurement runs in a realistically sized tree.
+#
+# Usage:
+#     godot --headless --path . -s res://benchmarks/benchmark_hud.gd -- [--frames=N] [--nodes=N]
+
+const GameManager = preload("res://scripts/game_manager.gd")
+
+func _initialize():
+	var options = {"frames": 36000, "nodes": 5000}
+	for arg in OS.get_cmdline_user_args():
+		var parts = arg.trim_prefix("--").split("=")
+		if parts.size() == 2 and options.has(parts[0]):
+			options[parts[0]] = int(parts[1])
+
+	var level = _build_level(options["nodes"])
+	root.add_child(level)
+	var ui_layer = level.get_node("UILayer")
+
+	var legacy_us = _time_legacy(ui_layer, options["frames"])
+	var signal_us = _time_signals(ui_layer, options["frames"])
+
+	print("Nodes in tree: ", level.get_child_count() + ui_layer.get_child_count(), ", frames: ", options["frames"])
+	print("Per-frame update_ui: %.3f us/frame" % (legacy_us / options["frames"]))
+	print("Signal-driven HUD:   %.3f us/frame" % (signal_us / options["frames"]))
+	print("Saved:               %.3f us/frame" % ((legacy_us - signal_us) / options["frames"]))
+	level.free()
+	quit()
+
+func _build_level(node_count: int) -> Node2D:
+	var level = Node2D.new()
+	for i in range(node_count):
+		var node = Area2D.new()
+		node.name = "Collectible" + str(i)
+		node.position = Vector2(i * 16, 400)
+		level.add_child(node)
+
+	var ui_layer = CanvasLayer.new()
+	ui_layer.name = "UILayer"
+	for label_name in ["ScoreLabel", "TimerLabel", "TargetLabel", "EndGameLabel"]:
+		var label = Label.new()
+		label.name = label_name
+		ui_layer.add_child(label)
+	level.add_child(ui_layer)
+	return level
+
+func _time_legacy(ui_layer: Node, frames: int) -> float:
+	"""The previous per-frame update_ui: three lookups and three new strings every frame"""
+	var score = 0
+	var time_remaining = float(frames)
+	var start = Time.get_ticks_usec()
+	for i in range(frames):
+		time_remaining -= 1.0 / 60.0
+		var score_label = ui_layer.get_node_or_null("ScoreLabel")
+		var target_label = ui_layer.get_node_or_null("TargetLabel")
+		var timer_label = ui_layer.get_node_or_null("TimerLabel")
+		if score_label:
+			score_label.text = "Score: " + str(score)
+		if timer_label:
+			timer_label.text = "Time: " + str(int(time_remaining)) + "s"
+		if target_label:
+			target_label.text = "Target: " + str(100)
+	return Time.get_ticks_usec() - start
+
+func _time_signals(ui_layer: Node, frames: int) -> float:
+	"""The game manager's _process with the signal-driven HUD bound to the layer"""
+	var game = Node.new()
+	game.set_script(GameManager)
+	game.game_mode = "timed"
+	game.game_started = true
+	game.time_remaining = float(frames)
+	game.ui_layer = ui_layer
+	game.update_ui()
+
+	var start = Time.get_ticks_usec()
+	for i in range(frames):
+		game._process(1.0 / 60.0)
+	var elapsed = Time.get_ticks_usec() - start
+	game.ui_layer = null
+	game.free()
+	return elapsed
@@ -0,0 +1,125 @@
+extends Node2D
+
+# ChunkStreamer - streams a long level in fixed-width chunk scenes.
+# Only the chunks around the target (the player, followed by the camera) are
+# in the tree; chunks further behind are freed and the next chunk ahead is
+# loaded on a background thread, so node count and memory stay flat however
+# long the level is. Collected pickups stay collected when a chunk is reloaded.
+
+@export var chunk_directory = ""
+@export var chunk_count = 0
+@export var chunk_width = 2048.0
+@export var chunks_ahead = 1
+@export var chunks_behind = 1
+@export var target_path = NodePath("../Player")
+
+var loaded_chunks = {}  # chunk index -> chunk Node
+
+var _target: Node2D = null
+var _requested = {}  # chunk index -> true while a background load is pending
+var _collectible_names = {}  # chunk index -> names of collectibles in the chunk
+var _collected = {}  # chunk index -> names of collectibles already picked up
+var _field_state = {}  # chunk index -> {field name: collected PackedByteArray}
+
+func _ready():
+	_target = get_node_or_null(target_path)
+	update_window(_target_x(), true)
+
+func _process(_delta):
+	if _target:
+		update_window(_target_x(), false)
+
+func _target_x() -> float:
+	return _target.global_position.x - global_position.x if _target else 0.0
+
+func chunk_path(index: int) -> String:
+	return chunk_directory.path_join("chunk_" + str(index) + ".tscn")
+
+func chunk_index_at(x: float) -> int:
+	return clampi(floori(x / chunk_width), 0, max(chunk_count - 1, 0))
+
+func update_window(x: float, blocking: bool):
+	"""Load the chunks around x and free the ones outside the window"""
+	if chunk_count <= 0:
+		return
+	var center = chunk_index_at(x)
+	var first = max(center - chunks_behind, 0)
+	var last = min(center + chunks_ahead, chunk_count - 1)
+
+	for index in loaded_chunks.keys():
+		if index < first or index > last:
+			_unload_chunk(index)
+
+	for index in range(first, last + 1):
+		if not loaded_chunks.has(index):
+			# The chunk under the target must exist now; the others may finish loading later
+			_load_chunk(index, blocking or index == center)
+
+	if last + 1 < chunk_count:
+		_request_chunk(last + 1)
+
+func _request_chunk(index: int):
+	if _requested.has(index) or loaded_chunks.has(index):
+		return
+	if ResourceLoader.load_threaded_request(chunk_path(index)) == OK:
+		_requested[index] = true
+
+func _load_chunk(index: int, blocking: bool):
+	var path = chunk_path(index)
+	var packed_scene: PackedScene = null
+	if _requested.has(index):
+		if not blocking and ResourceLoader.load_threaded_get_status(path) == ResourceLoader.THREAD_LOAD_IN_PROGRESS:
+			return
+		packed_scene = ResourceLoader.load_threaded_get(path)
+		_requested.erase(index)
+	elif blocking:
+		packed_scene = load(path)
+	else:
+		_request_chunk(index)
+		return
+
+	if not packed_scene:
+		push_error("ChunkStreamer: Failed to load chunk: ", path)
+		return
+
+	var chunk = packed_scene.instantiate()
+	_restore_chunk(index, chunk)
+	loaded_chunks[index] = chunk
+	add_child(chunk)
+
+func _restore_chunk(index: int, chunk: Node):
+	"""Drop collectibles picked up on an earlier visit and remember the rest"""
+	for collectible_name in _collected.get(index, []):
+		var collectible = chunk.get_node_or_null(NodePath(collectible_name))
+		if collectible:
+			chunk.remove_child(collectible)
+			collectible.free()
+
+	var names = []
+	var fields = _field_state.get(index, {})
+	for child in chunk.get_children():
+		if child.has_method("_on_body_entered"):
+			names.append(String(child.name))
+		elif child.has_method("collect_near") and fields.has(String(child.name)):
+			child.collected = fields[String(child.name)]
+	_collectible_names[index] = names
+
+func _unload_chunk(index: int):
+	var chunk = loaded_chunks[index]
+	loaded_chunks.erase(index)
+
+	# A collectible that is gone (or being freed) from a live chunk was picked up
+	var collected = _collected.get(index, [])
+	for collectible_name in _collectible_names.get(index, []):
+		var collectible = chunk.get_node_or_null(NodePath(collectible_name))
+		if collectible == null or collectible.is_queued_for_deletion():
+			collected.append(collectible_name)
+	_collected[index] = collected
+
+	var fields = {}
+	for child in chunk.get_children():
+		if child.has_method("collect_near"):
+			fields[String(child.name)] = child.collected
+	_field_state[index] = fields
+
+	chunk.queue_free()
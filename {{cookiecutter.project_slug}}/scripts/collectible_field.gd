@@ -0,0 +1,139 @@
+extends Node2D
+
+# CollectibleField - dense collectibles without one Area2D node per pickup.
+# The level scene stores every pickup position in a single PackedVector2Array.
+# Pickups are drawn in one batch by a MultiMeshInstance2D and collected with a
+# spatial grid lookup around the player, so cost per frame does not depend on
+# how many pickups the level has.
+
+const CollectibleScene = preload("res://scenes/collectible.tscn")
+const PlayerScene = preload("res://scenes/player.tscn")
+
+@export var positions = PackedVector2Array()
+@export var points = 10
+@export var pickup_radius = -1.0  # Negative: derived from the collision shapes (see shape_pickup_radius)
+@export var sprite_texture: Texture2D = preload("res://icon.svg")
+@export var sprite_scale = 0.5
+@export var sprite_modulate = Color(1, 0.84, 0, 1)
+
+var collected = PackedByteArray()
+var remaining = 0
+var player: Node2D = null
+
+var _multimesh: MultiMesh = null
+var _cells = {}  # Vector2i -> PackedInt32Array of pickup indices
+var _cell_size = 96.0
+
+static var _shape_pickup_radius = -1.0
+
+func _ready():
+	player = _find_player()
+	build()
+
+func _find_player() -> Node2D:
+	# Fields sit in the level scene itself, or inside a chunk added by ChunkStreamer
+	var node = get_parent()
+	while node:
+		var found = node.get_node_or_null("Player")
+		if found:
+			return found
+		node = node.get_parent()
+	return null
+
+static func shape_pickup_radius() -> float:
+	"""Collectible circle radius plus half the player's collision width, where an Area2D collectible is touched"""
+	if _shape_pickup_radius < 0.0:
+		var collectible = CollectibleScene.instantiate()
+		var player = PlayerScene.instantiate()
+		var circle: CircleShape2D = collectible.get_node("CollisionShape2D").shape
+		var rect: RectangleShape2D = player.get_node("CollisionShape2D").shape
+		_shape_pickup_radius = circle.radius + rect.size.x / 2.0
+		collectible.free()
+		player.free()
+	return _shape_pickup_radius
+
+func build():
+	"""(Re)build the render batch and collision grid from positions"""
+	# A collected array set before build (e.g. restored by ChunkStreamer) is kept
+	if collected.size() != positions.size():
+		collected.resize(positions.size())
+		collected.fill(0)
+	remaining = collected.count(0)
+
+	if pickup_radius < 0.0:
+		pickup_radius = shape_pickup_radius()
+	_cell_size = pickup_radius * 2.0
+	_cells.clear()
+	for i in positions.size():
+		var cell = _cell_of(positions[i])
+		if not _cells.has(cell):
+			_cells[cell] = PackedInt32Array()
+		_cells[cell].append(i)
+
+	if sprite_texture:
+		_build_multimesh()
+
+func _build_multimesh():
+	var quad = QuadMesh.new()
+	quad.size = sprite_texture.get_size()
+
+	_multimesh = MultiMesh.new()
+	_multimesh.transform_format = MultiMesh.TRANSFORM_2D
+	_multimesh.mesh = quad
+	_multimesh.instance_count = positions.size()
+	for i in positions.size():
+		if collected[i] == 0:
+			_multimesh.set_instance_transform_2d(i, _pickup_transform(positions[i]))
+		else:
+			_multimesh.set_instance_transform_2d(i, _hidden_transform(positions[i]))
+
+	var renderer = MultiMeshInstance2D.new()
+	renderer.name = "Batch"
+	renderer.multimesh = _multimesh
+	renderer.texture = sprite_texture
+	renderer.modulate = sprite_modulate
+	add_child(renderer)
+
+func _pickup_transform(position_2d: Vector2) -> Transform2D:
+	# QuadMesh is built y-up, so flip y to draw the texture the right way up in 2D
+	return Transform2D(Vector2(sprite_scale, 0), Vector2(0, -sprite_scale), position_2d)
+
+func _hidden_transform(position_2d: Vector2) -> Transform2D:
+	# A zero basis hides the instance without reordering the batch
+	return Transform2D(Vector2.ZERO, Vector2.ZERO, position_2d)
+
+func _cell_of(point: Vector2) -> Vector2i:
+	return Vector2i(floori(point.x / _cell_size), floori(point.y / _cell_size))
+
+func _physics_process(_delta):
+	if player and remaining > 0:
+		collect_near(player.global_position - global_position)
+
+func collect_near(point: Vector2) -> int:
+	"""Collect every pickup within pickup_radius of point (field-local); returns how many"""
+	var count = 0
+	var center = _cell_of(point)
+	var radius_squared = pickup_radius * pickup_radius
+	for dx in range(-1, 2):
+		for dy in range(-1, 2):
+			var cell = center + Vector2i(dx, dy)
+			if not _cells.has(cell):
+				continue
+			for i in _cells[cell]:
+				if collected[i] == 0 and positions[i].distance_squared_to(point) <= radius_squared:
+					_collect(i)
+					count += 1
+	return count
+
+func _collect(index: int):
+	collected[index] = 1
+	remaining -= 1
+	if _multimesh:
+		_multimesh.set_instance_transform_2d(index, _hidden_transform(positions[index]))
+
+	if player and player.has_method("play_collect_animation"):
+		player.play_collect_animation()
+
+	var main_scene = get_tree().current_scene if is_inside_tree() else null
+	if main_scene and main_scene.has_method("add_score"):
+		main_scene.add_score(points)
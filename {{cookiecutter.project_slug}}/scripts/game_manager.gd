@@ -1,5 +1,12 @@
 extends Node
 
+# HUD updates are pushed through these signals (see hud.gd)
+signal score_changed(new_score)
+signal second_elapsed(seconds_remaining)
+signal target_changed(new_target)
+
+const Hud = preload("res://scripts/hud.gd")
+
 var score = 0
 var player_select_scene = preload("res://scenes/player_select.tscn")
 var player_select_instance = null
@@ -12,8 +19,15 @@ var target_score = {{ cookiecutter.target_score }}
 var time_remaining = 0.0
 var game_over = false
 
-# UI reference
-var ui_layer = null
+# UI reference; assigning it binds a HUD that caches the layer's labels
+var ui_layer = null:
+	set(value):
+		if hud:
+			hud.unbind()
+		ui_layer = value
+		hud = Hud.new(value, self) if value else null
+var hud = null
+var _whole_seconds = -1  # Last whole second sent through second_elapsed
 
 # Level configuration (if using multi-level mode)
 var level_config = null
@@ -118,7 +132,10 @@ func _process(delta):
 	# Handle timed mode
 	if game_mode == "timed":
 		time_remaining -= delta
-		update_ui()
+		var whole_seconds = int(time_remaining)
+		if whole_seconds != _whole_seconds:
+			_whole_seconds = whole_seconds
+			second_elapsed.emit(whole_seconds)
 
 		if time_remaining <= 0:
 			end_game(false, "Time's up! Final score: " + str(score))
@@ -129,43 +146,38 @@ func add_score(points):
 
 	score += points
 	print("Score: ", score)
-	update_ui()
+	play_level_sound("Collect")
+	score_changed.emit(score)
 
 	# Check win condition - target score reached in any mode
 	if score >= target_score:
 		end_game(true, "You win! Target score reached!")
 
+func play_level_sound(sound_name: String) -> bool:
+	"""Play one of the level's generated sounds (Victory, Collect, Jump); false if the level has none"""
+	var sound = get_node_or_null(NodePath("LevelSounds/" + sound_name))
+	if sound and sound.stream:
+		sound.play()
+		return true
+	return false
+
 func update_ui():
-	if not ui_layer:
+	"""Push the full HUD state; afterwards only the signals update it"""
+	if not hud:
 		return
 
-	# Get UI label references once
-	var score_label = ui_layer.get_node_or_null("ScoreLabel")
-	var target_label = ui_layer.get_node_or_null("TargetLabel")
-	var timer_label = ui_layer.get_node_or_null("TimerLabel")
-
 	# Hide score/target UI on celebration levels
 	if is_celebration_level:
-		if score_label:
-			score_label.visible = false
-		if target_label:
-			target_label.visible = false
-		if timer_label:
-			timer_label.visible = false
+		hud.set_stats_visible(false)
 		return
 
-	# Update score label
-	if score_label:
-		score_label.text = "Score: " + str(score)
-
+	score_changed.emit(score)
 	# Update timer label for timed mode
 	if game_mode == "timed":
-		if timer_label:
-			timer_label.text = "Time: " + str(int(time_remaining)) + "s"
-
+		_whole_seconds = int(time_remaining)
+		second_elapsed.emit(_whole_seconds)
 	# Always update target label (target score applies to all modes)
-	if target_label:
-		target_label.text = "Target: " + str(target_score)
+	target_changed.emit(target_score)
 
 func end_game(won: bool, message: String):
 	# Check if we have more levels to load (multi-level mode)
@@ -187,13 +199,10 @@ func end_game(won: bool, message: String):
 
 	# Show end game message with restart instruction
 	if ui_layer:
-		var end_label = ui_layer.get_node_or_null("EndGameLabel")
-		if end_label:
-			end_label.text = message + "\n\nPress any key to restart"
-			end_label.visible = true
+		hud.show_end_message(message + "\n\nPress any key to restart")
 
-		# Play victory sound if won
-		if won:
+		# Play victory sound if won (the level's own jingle takes precedence)
+		if won and not play_level_sound("Victory"):
 			var victory_sound = ui_layer.get_node_or_null("VictorySound")
 			if victory_sound and victory_sound.stream:
 				victory_sound.play()
@@ -0,0 +1,72 @@
+extends RefCounted
+
+# HUD - keeps the UILayer labels in sync with the GameManager
+# Label references are looked up once when the HUD is bound to a UI layer.
+# Values arrive through the GameManager's signals (score_changed,
+# second_elapsed, target_changed), and a label's text is only rebuilt when
+# the value it displays actually changes, so a running timer touches the
+# TimerLabel once per second instead of every frame.
+
+var score_label: Label = null
+var timer_label: Label = null
+var target_label: Label = null
+var end_label: Label = null
+
+# Last value written to each label; null until first shown
+var _shown_score = null
+var _shown_seconds = null
+var _shown_target = null
+
+var _game: Node = null
+
+func _init(ui_layer: Node, game: Node = null):
+	score_label = ui_layer.get_node_or_null("ScoreLabel")
+	timer_label = ui_layer.get_node_or_null("TimerLabel")
+	target_label = ui_layer.get_node_or_null("TargetLabel")
+	end_label = ui_layer.get_node_or_null("EndGameLabel")
+	if game:
+		bind(game)
+
+func bind(game: Node):
+	"""Follow the score, timer and target signals of a GameManager"""
+	unbind()
+	_game = game
+	game.score_changed.connect(show_score)
+	game.second_elapsed.connect(show_seconds)
+	game.target_changed.connect(show_target)
+
+func unbind():
+	if _game and is_instance_valid(_game):
+		_game.score_changed.disconnect(show_score)
+		_game.second_elapsed.disconnect(show_seconds)
+		_game.target_changed.disconnect(show_target)
+	_game = null
+
+func show_score(score):
+	if score == _shown_score or not score_label:
+		return
+	_shown_score = score
+	score_label.text = "Score: " + str(score)
+
+func show_seconds(seconds: int):
+	if seconds == _shown_seconds or not timer_label:
+		return
+	_shown_seconds = seconds
+	timer_label.text = "Time: " + str(seconds) + "s"
+
+func show_target(target):
+	if target == _shown_target or not target_label:
+		return
+	_shown_target = target
+	target_label.text = "Target: " + str(target)
+
+func set_stats_visible(visible: bool):
+	"""Show or hide the score, timer and target labels (hidden on celebration levels)"""
+	for label in [score_label, timer_label, target_label]:
+		if label:
+			label.visible = visible
+
+func show_end_message(message: String):
+	if end_label:
+		end_label.text = message
+		end_label.visible = true
@@ -3,15 +3,42 @@ extends Node
 # LevelManager singleton - handles level transitions and state
 # Add this as an autoload in Project Settings
 
-var levels_config = []
+const MANIFEST_PATH = "res://levels.bin"
+const MANIFEST_MAGIC = "GLVL"
+const MANIFEST_VERSION = 1
+const SHARD_INDEX_PATH = "res://levels/_index.json"
+
+var levels_config = []  # Only filled when falling back to levels_config.json
+var level_count = 0
 var current_level_index = 0
 var player_type = "blue"  # Persists between levels
 
+# Open level manifest; records are read on demand, one level at a time
+var _manifest: FileAccess = null
+var _table_offset = 0
+var _cached_index = -1
+var _cached_config = null
+
+# Sharded mode: level names from levels/_index.json, one config file per level
+var _shard_dir = ""
+var _level_names = []
+
+# Background preloading of the next level's scene and dependencies
+var _preload_index = -1
+var _preload_type = ""  # Player type whose frames the preload includes
+var _preload_paths = []
+var _preloaded_resources = []  # Keeps the previous level's resources cached until replaced
+
 func _ready():
 	load_levels_config()
+	# The first level is the project's main scene; preloading the one after it
+	# starts in set_player_type(), once the player sprite to load is known
 
 func load_levels_config():
-	"""Load levels configuration from JSON file"""
+	"""Open the binary level manifest or sharded index, falling back to the JSON config"""
+	if open_level_manifest(MANIFEST_PATH) or open_level_index(SHARD_INDEX_PATH):
+		return
+
 	var config_path = "res://levels_config.json"
 
 	if FileAccess.file_exists(config_path):
@@ -27,6 +54,7 @@ func load_levels_config():
 				var data = json.data
 				if data.has("levels"):
 					levels_config = data["levels"]
+					level_count = levels_config.size()
 					print("LevelManager: Loaded ", levels_config.size(), " level(s)")
 				else:
 					push_warning("LevelManager: No 'levels' key in config")
@@ -35,23 +63,85 @@ func load_levels_config():
 	else:
 		print("LevelManager: No levels config found - single level mode")
 
+func open_level_manifest(path: String) -> bool:
+	"""Read the manifest header (16 bytes: magic, version, level count, offset table position)"""
+	if not FileAccess.file_exists(path):
+		return false
+	var file = FileAccess.open(path, FileAccess.READ)
+	if not file:
+		return false
+	if file.get_buffer(4).get_string_from_ascii() != MANIFEST_MAGIC or file.get_32() != MANIFEST_VERSION:
+		push_warning("LevelManager: Unsupported level manifest: ", path)
+		return false
+
+	level_count = file.get_32()
+	_table_offset = file.get_32()
+	_manifest = file
+	_cached_index = -1
+	_cached_config = null
+	print("LevelManager: Indexed ", level_count, " level(s) from ", path)
+	return true
+
+func open_level_index(path: String) -> bool:
+	"""Read the sharded level index (level names only); level files are read on demand"""
+	if not FileAccess.file_exists(path):
+		return false
+	var index = JSON.parse_string(FileAccess.get_file_as_string(path))
+	if not index is Dictionary or not index.has("levels"):
+		push_warning("LevelManager: Invalid level index: ", path)
+		return false
+
+	_level_names = index["levels"]
+	_shard_dir = path.get_base_dir()
+	level_count = _level_names.size()
+	_cached_index = -1
+	_cached_config = null
+	print("LevelManager: Indexed ", level_count, " level(s) from ", path)
+	return true
+
+func read_level_config(index: int):
+	"""Read one level's configuration without loading the others"""
+	if index < 0 or index >= level_count:
+		return null
+	if _manifest == null and _level_names.is_empty():
+		return levels_config[index]
+	if index == _cached_index:
+		return _cached_config
+
+	var record = null
+	if _manifest:
+		# Each offset table entry is an (offset, length) pair of uint32
+		_manifest.seek(_table_offset + index * 8)
+		var offset = _manifest.get_32()
+		var length = _manifest.get_32()
+		_manifest.seek(offset)
+		record = JSON.parse_string(_manifest.get_buffer(length).get_string_from_utf8())
+	else:
+		var shard_path = _shard_dir.path_join(_level_names[index] + ".json")
+		record = JSON.parse_string(FileAccess.get_file_as_string(shard_path))
+	if record == null:
+		push_error("LevelManager: Corrupt level record ", index)
+		return null
+
+	_cached_index = index
+	_cached_config = record
+	return record
+
 func get_current_level_config():
 	"""Get configuration for the current level"""
-	if current_level_index < levels_config.size():
-		return levels_config[current_level_index]
-	return null
+	return read_level_config(current_level_index)
 
 func get_level_count():
 	"""Get total number of levels"""
-	return levels_config.size()
+	return level_count
 
 func is_multi_level():
 	"""Check if game has multiple levels"""
-	return levels_config.size() > 1
+	return level_count > 1
 
 func next_level():
 	"""Advance to the next level"""
-	if current_level_index < levels_config.size() - 1:
+	if current_level_index < level_count - 1:
 		current_level_index += 1
 		print("LevelManager: Advancing to level ", current_level_index + 1)
 		return true
@@ -64,16 +154,69 @@ func restart_levels():
 	current_level_index = 0
 	print("LevelManager: Restarting from level 1")
 
+func get_level_scene_path(level_config) -> String:
+	return "res://scenes/" + level_config.get("name", "level_1") + ".tscn"
+
+func preload_level(index: int):
+	"""Start loading a level's scene and dependencies on background threads"""
+	if index == _preload_index and player_type == _preload_type:
+		return
+	var level_config = read_level_config(index)
+	if not level_config:
+		return
+
+	# The hook lists everything the level needs; the player sprite depends on the runtime choice
+	var paths = level_config.get("dependencies", [get_level_scene_path(level_config)]).duplicate()
+	paths.append("res://assets/player_" + player_type + "_frames.tres")
+
+	_preload_index = index
+	_preload_type = player_type
+	_preload_paths = []
+	for path in paths:
+		if ResourceLoader.exists(path) and ResourceLoader.load_threaded_request(path, "", true) == OK:
+			_preload_paths.append(path)
+
+func is_level_preloaded(index: int) -> bool:
+	"""True once every dependency of a preloading level has finished loading"""
+	if index != _preload_index:
+		return false
+	for path in _preload_paths:
+		if ResourceLoader.load_threaded_get_status(path) != ResourceLoader.THREAD_LOAD_LOADED:
+			return false
+	return true
+
+func take_preloaded_scene(index: int, level_path: String) -> PackedScene:
+	"""Collect a preloaded level scene, waiting only for whatever is still loading"""
+	if index != _preload_index or not _preload_paths.has(level_path):
+		return null
+
+	var resources = []
+	var scene = null
+	for path in _preload_paths:
+		var resource = ResourceLoader.load_threaded_get(path)
+		resources.append(resource)
+		if path == level_path:
+			scene = resource
+	_preloaded_resources = resources
+	_preload_index = -1
+	_preload_paths = []
+	return scene as PackedScene
+
 func load_current_level():
-	"""Load the current level scene"""
+	"""Load the current level scene, using the background-loaded copy if available"""
 	var level_config = get_current_level_config()
 	if level_config:
-		var level_name = level_config.get("name", "level_1")
-		var level_path = "res://scenes/" + level_name + ".tscn"
-
-		if ResourceLoader.exists(level_path):
+		var level_path = get_level_scene_path(level_config)
+
+		var packed_scene = take_preloaded_scene(current_level_index, level_path)
+		if packed_scene:
+			get_tree().change_scene_to_packed(packed_scene)
+			print("LevelManager: Loading preloaded level scene: ", level_path)
+			preload_level(current_level_index + 1)
+		elif ResourceLoader.exists(level_path):
 			get_tree().change_scene_to_file(level_path)
 			print("LevelManager: Loading level scene: ", level_path)
+			preload_level(current_level_index + 1)
 		else:
 			push_error("LevelManager: Level scene not found: ", level_path)
 			# Fallback to main scene
@@ -86,6 +229,7 @@ func set_player_type(type: String):
 	"""Store selected player type across levels"""
 	player_type = type
 	print("LevelManager: Player type set to: ", type)
+	preload_level(current_level_index + 1)
 
 func get_player_type() -> String:
 	"""Get the current player type"""
@@ -0,0 +1,117 @@
+extends Node
+
+# PerformanceMonitor singleton - samples engine Performance monitors
+# Added as an autoload when the project is generated with performance_monitor=yes.
+# Every sample_interval seconds it reads frame time, physics time, node and
+# object counts and static memory, shows them in the current scene's UILayer
+# and appends them to a CSV file, so headless benchmark runs leave a trace.
+
+const CSV_COLUMNS = ["time", "scene", "fps", "frame_ms", "physics_ms", "nodes", "objects", "static_memory_mb"]
+
+@export var sample_interval = 0.5
+@export var csv_path = "user://performance.csv"
+@export var show_overlay = true  # Toggle in game with F3
+
+var last_sample = {}
+
+var _elapsed = 0.0
+var _csv: FileAccess = null
+var _label: Label = null
+
+func _ready():
+	process_mode = Node.PROCESS_MODE_ALWAYS
+	if DisplayServer.get_name() == "headless":
+		show_overlay = false
+	open_csv(csv_path)
+
+func _exit_tree():
+	close_csv()
+
+func _process(delta):
+	_elapsed += delta
+	if _elapsed < sample_interval:
+		return
+	_elapsed = 0.0
+	last_sample = sample()
+	write_csv_row(last_sample)
+	update_overlay(last_sample)
+
+func _unhandled_input(event):
+	if event is InputEventKey and event.pressed and not event.echo and event.keycode == KEY_F3:
+		show_overlay = not show_overlay
+		if _label and is_instance_valid(_label):
+			_label.visible = show_overlay
+
+func sample() -> Dictionary:
+	"""Read the current values of the monitored Performance counters"""
+	var scene = get_tree().current_scene if is_inside_tree() else null
+	return {
+		"time": Time.get_ticks_msec() / 1000.0,
+		"scene": scene.name if scene else "",
+		"fps": Performance.get_monitor(Performance.TIME_FPS),
+		"frame_ms": Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0,
+		"physics_ms": Performance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0,
+		"nodes": int(Performance.get_monitor(Performance.OBJECT_NODE_COUNT)),
+		"objects": int(Performance.get_monitor(Performance.OBJECT_COUNT)),
+		"static_memory_mb": Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0,
+	}
+
+func open_csv(path: String) -> bool:
+	"""Start a new CSV log at path, writing the header row"""
+	close_csv()
+	_csv = FileAccess.open(path, FileAccess.WRITE)
+	if _csv == null:
+		push_warning("PerformanceMonitor: Cannot write " + path)
+		return false
+	_csv.store_csv_line(PackedStringArray(CSV_COLUMNS))
+	_csv.flush()
+	return true
+
+func close_csv():
+	if _csv:
+		_csv.close()
+		_csv = null
+
+func write_csv_row(values: Dictionary):
+	"""Append one sample to the CSV log, flushed so it survives a crash or kill"""
+	if _csv == null:
+		return
+	var row = PackedStringArray()
+	for column in CSV_COLUMNS:
+		var value = values.get(column, "")
+		row.append(("%.3f" % value) if value is float else str(value))
+	_csv.store_csv_line(row)
+	_csv.flush()
+
+func format_sample(values: Dictionary) -> String:
+	return "FPS %d | frame %.2f ms | physics %.2f ms\nnodes %d | objects %d | static %.1f MB" % [
+		values["fps"], values["frame_ms"], values["physics_ms"],
+		values["nodes"], values["objects"], values["static_memory_mb"]]
+
+func update_overlay(values: Dictionary):
+	"""Show the sample in the current scene's UILayer, re-attaching after a scene change"""
+	if not show_overlay:
+		return
+	if _label == null or not is_instance_valid(_label):
+		_label = _create_label()
+		if _label == null:
+			return
+	_label.text = format_sample(values)
+
+func _create_label() -> Label:
+	var scene = get_tree().current_scene
+	var ui_layer = scene.get_node_or_null("UILayer") if scene else null
+	if ui_layer == null:
+		return null
+	var label = Label.new()
+	label.name = "PerformanceLabel"
+	label.anchor_left = 1.0
+	label.anchor_right = 1.0
+	label.offset_left = -420.0
+	label.offset_top = 20.0
+	label.offset_right = -20.0
+	label.horizontal_alignment = HORIZONTAL_ALIGNMENT_RIGHT
+	label.add_theme_font_size_override("font_size", 16)
+	label.mouse_filter = Control.MOUSE_FILTER_IGNORE
+	ui_layer.add_child(label)
+	return label
@@ -7,6 +7,13 @@ extends CharacterBody2D
 var player_type = "blue"
 var is_collecting = false
 
+# Pre-baked SpriteFrames per player type, written by the project generator
+const FRAMES_PATH = "res://assets/player_%s_frames.tres"
+
+# Player type -> SpriteFrames, shared by every Player instance and kept across
+# levels; null while a background load requested by request_frames() is pending
+static var _frames_cache = {}
+
 @onready var animated_sprite = $AnimatedSprite2D
 
 func _ready():
@@ -15,10 +22,43 @@ func _ready():
 	if animated_sprite:
 		animated_sprite.animation_finished.connect(_on_animation_finished)
 
+static func request_frames(types):
+	"""Start loading the SpriteFrames of each player type on a background thread"""
+	for type in types:
+		var path = FRAMES_PATH % type
+		if not _frames_cache.has(type) and ResourceLoader.exists(path):
+			if ResourceLoader.load_threaded_request(path) == OK:
+				_frames_cache[type] = null
+
+static func get_frames(type: String) -> SpriteFrames:
+	"""The pre-baked SpriteFrames of a player type, or null if the project has none"""
+	if _frames_cache.get(type) is SpriteFrames:
+		return _frames_cache[type]
+	var path = FRAMES_PATH % type
+	var frames = null
+	if _frames_cache.has(type):
+		# Waits for the background load if it is still running
+		frames = ResourceLoader.load_threaded_get(path)
+	elif ResourceLoader.exists(path):
+		frames = load(path)
+	if frames is SpriteFrames:
+		_frames_cache[type] = frames
+		return frames
+	_frames_cache.erase(type)
+	return null
+
 func set_player_type(type: String):
 	player_type = type
 
-	# Try to load type-specific SVG first
+	# Use the prepared SpriteFrames resource when the project has one
+	var frames = get_frames(type)
+	if frames and animated_sprite:
+		animated_sprite.sprite_frames = frames
+		animated_sprite.modulate = Color.WHITE
+		animated_sprite.play(animated_sprite.animation)
+		return
+
+	# Otherwise build the animations from the type-specific SVG
 	var type_specific_path = "res://assets/player_" + type + ".svg"
 	if ResourceLoader.exists(type_specific_path):
 		var texture = load(type_specific_path)
@@ -39,7 +79,9 @@ func _setup_animations_with_texture(texture: Texture2D):
 	if not animated_sprite or not animated_sprite.sprite_frames:
 		return
 
-	var sprite_frames = animated_sprite.sprite_frames
+	# Work on a copy: the scene's SpriteFrames may be a shared pre-baked resource
+	var sprite_frames = animated_sprite.sprite_frames.duplicate()
+	animated_sprite.sprite_frames = sprite_frames
 
 	# Add texture to idle animation
 	if sprite_frames.has_animation("idle"):
@@ -116,6 +158,9 @@ func _physics_process(delta):
 	# Handle jump
 	if Input.is_action_just_pressed("ui_accept") and is_on_floor():
 		velocity.y = jump_velocity
+		var main_scene = get_tree().current_scene
+		if main_scene and main_scene.has_method("play_level_sound"):
+			main_scene.play_level_sound("Jump")
 
 	# Get horizontal input
 	var direction = Input.get_axis("ui_left", "ui_right")
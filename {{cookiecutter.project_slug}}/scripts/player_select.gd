@@ -2,6 +2,8 @@ extends Control
 
 signal player_selected(player_type: String)
 
+const Player = preload("res://scripts/player.gd")
+
 # Available player types from cookiecutter configuration
 var available_types = "{{ cookiecutter.player_types }}".split(",")
 var selected_player = available_types[0] if available_types.size() > 0 else "blue"
@@ -14,6 +16,9 @@ func _ready():
 	print("Process mode: ", process_mode)
 	print("Available player types: ", available_types)
 	
+	# Load every character's SpriteFrames in the background while the menu is shown
+	Player.request_frames(available_types)
+
 	# Create buttons dynamically based on available types
 	_create_ui()
 	_update_selection()
@@ -0,0 +1,79 @@
+extends GutTest
+
+# Test suite for ChunkStreamer functionality
+
+var ChunkStreamer = preload("res://scripts/chunk_streamer.gd")
+var Collectible = preload("res://scripts/collectible.gd")
+var streamer_instance = null
+var chunk_dir = "user://test_chunks"
+var chunk_count = 8
+
+func before_all():
+	# Write small chunk scenes, each with one collectible
+	DirAccess.make_dir_recursive_absolute(chunk_dir)
+	for i in chunk_count:
+		var root = Node2D.new()
+		root.name = "Chunk" + str(i)
+		var collectible = Area2D.new()
+		collectible.name = "Collectible1"
+		collectible.set_script(Collectible)
+		root.add_child(collectible)
+		collectible.owner = root
+		var packed_scene = PackedScene.new()
+		packed_scene.pack(root)
+		ResourceSaver.save(packed_scene, chunk_dir.path_join("chunk_" + str(i) + ".tscn"))
+		root.free()
+
+func after_all():
+	for file_name in DirAccess.get_files_at(chunk_dir):
+		DirAccess.remove_absolute(chunk_dir.path_join(file_name))
+	DirAccess.remove_absolute(chunk_dir)
+
+func before_each():
+	# Create a fresh streamer without a target, so it only moves when told to
+	streamer_instance = Node2D.new()
+	streamer_instance.set_script(ChunkStreamer)
+	streamer_instance.chunk_directory = chunk_dir
+	streamer_instance.chunk_count = chunk_count
+	streamer_instance.chunk_width = 100.0
+	streamer_instance.target_path = NodePath("")
+	add_child_autoqfree(streamer_instance)
+
+func after_each():
+	streamer_instance = null
+
+func test_ready_loads_start_of_level():
+	assert_true(streamer_instance.loaded_chunks.has(0), "Chunk under the start should be loaded")
+	assert_true(streamer_instance.loaded_chunks.has(1), "Chunk ahead should be loaded")
+	assert_eq(streamer_instance.loaded_chunks.size(), 2, "Only the window should be loaded")
+
+func test_chunk_index_at_clamps_to_level():
+	assert_eq(streamer_instance.chunk_index_at(-50.0), 0, "Positions before the level map to the first chunk")
+	assert_eq(streamer_instance.chunk_index_at(250.0), 2, "Position should map to its chunk")
+	assert_eq(streamer_instance.chunk_index_at(10000.0), chunk_count - 1, "Positions past the end map to the last chunk")
+
+func test_moving_frees_chunks_behind():
+	streamer_instance.update_window(450.0, true)
+	assert_eq(streamer_instance.loaded_chunks.keys().size(), 3, "Window should be behind, current and ahead")
+	for index in [3, 4, 5]:
+		assert_true(streamer_instance.loaded_chunks.has(index), "Chunk " + str(index) + " should be loaded")
+	assert_false(streamer_instance.loaded_chunks.has(0), "Chunks behind the window should be freed")
+
+func test_node_count_stays_flat():
+	var counts = []
+	for x in range(0, chunk_count * 100, 100):
+		streamer_instance.update_window(float(x), true)
+		await get_tree().process_frame
+		counts.append(streamer_instance.get_child_count())
+	assert_true(counts.max() <= 3, "No more than three chunks should ever be in the tree")
+
+func test_collected_pickups_stay_collected():
+	streamer_instance.loaded_chunks[0].get_node("Collectible1").queue_free()
+	await get_tree().process_frame
+
+	streamer_instance.update_window(500.0, true)
+	streamer_instance.update_window(0.0, true)
+	assert_null(streamer_instance.loaded_chunks[0].get_node_or_null("Collectible1"),
+		"Collected pickup should not come back when its chunk reloads")
+	assert_not_null(streamer_instance.loaded_chunks[1].get_node_or_null("Collectible1"),
+		"Other chunks should keep their pickups")
@@ -0,0 +1,78 @@
+extends GutTest
+
+# Test suite for CollectibleField (dense collectibles) functionality
+
+var CollectibleField = preload("res://scripts/collectible_field.gd")
+var field_instance = null
+
+func before_each():
+	# Create a fresh field instance before each test
+	field_instance = autoqfree(Node2D.new())
+	field_instance.set_script(CollectibleField)
+	field_instance.positions = PackedVector2Array([Vector2(100, 100), Vector2(130, 100), Vector2(500, 100)])
+
+func after_each():
+	field_instance = null
+
+func test_field_builds_one_batch():
+	add_child_autoqfree(field_instance)
+	var batch = field_instance.get_node_or_null("Batch")
+	assert_not_null(batch, "Field should draw pickups with one MultiMeshInstance2D")
+	assert_eq(batch.multimesh.instance_count, 3, "Batch should have one instance per position")
+	assert_eq(field_instance.remaining, 3, "All pickups should start uncollected")
+
+func test_collect_near_collects_within_radius():
+	add_child_autoqfree(field_instance)
+	var count = field_instance.collect_near(Vector2(115, 100))
+	assert_eq(count, 2, "Both nearby pickups should be collected")
+	assert_eq(field_instance.remaining, 1, "Far pickup should remain")
+
+func test_collect_near_ignores_far_point():
+	add_child_autoqfree(field_instance)
+	assert_eq(field_instance.collect_near(Vector2(300, 400)), 0, "Nothing should be collected far away")
+	assert_eq(field_instance.remaining, 3, "All pickups should remain")
+
+func test_pickup_radius_matches_collision_shapes():
+	add_child_autoqfree(field_instance)
+	# Collectible circle (32) plus half of the player's 128 px wide rectangle
+	assert_eq(field_instance.pickup_radius, 96.0, "Radius should come from the collision shapes")
+	assert_eq(field_instance.collect_near(Vector2(500, 195)), 1, "Pickup should be collected just inside the radius")
+
+func test_pickup_outside_radius_not_collected():
+	add_child_autoqfree(field_instance)
+	assert_eq(field_instance.collect_near(Vector2(500, 197)), 0, "Pickup should not be collected just outside the radius")
+
+func test_pickup_collected_only_once():
+	add_child_autoqfree(field_instance)
+	field_instance.collect_near(Vector2(500, 100))
+	assert_eq(field_instance.collect_near(Vector2(500, 100)), 0, "Collected pickup should not be collected again")
+	assert_eq(field_instance.remaining, 2, "Only one pickup should be collected")
+
+func test_collect_adds_score_to_main_scene():
+	var GameManagerScript = GDScript.new()
+	GameManagerScript.source_code = """
+extends Node
+var score = 0
+func add_score(points):
+	score += points
+"""
+	GameManagerScript.reload()
+
+	var mock_main_scene = Node.new()
+	mock_main_scene.set_script(GameManagerScript)
+	get_tree().root.add_child(mock_main_scene)
+	var previous_scene = get_tree().current_scene
+	get_tree().current_scene = mock_main_scene
+
+	add_child_autoqfree(field_instance)
+	field_instance.collect_near(Vector2(100, 100))
+	assert_eq(mock_main_scene.score, 20, "Each collected pickup should add 10 points")
+
+	get_tree().current_scene = previous_scene
+	mock_main_scene.queue_free()
+
+func test_empty_field():
+	field_instance.positions = PackedVector2Array()
+	add_child_autoqfree(field_instance)
+	assert_eq(field_instance.remaining, 0, "Empty field should have nothing to collect")
+	assert_eq(field_instance.collect_near(Vector2.ZERO), 0, "Empty field should collect nothing")
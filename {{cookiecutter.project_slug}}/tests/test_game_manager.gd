@@ -494,6 +494,22 @@ func test_victory_sound_does_not_play_on_loss():
 	# Sound should not start playing (though we can't easily verify play() wasn't called)
 	pass_test("Victory sound should only play on win, not on loss")
 
+func test_play_level_sound():
+	add_child_autoqfree(game_manager_instance)
+	assert_false(game_manager_instance.play_level_sound("Collect"), "Level without sounds should play nothing")
+
+	# Create level sounds like the ones written into generated level scenes
+	var level_sounds = Node.new()
+	level_sounds.name = "LevelSounds"
+	var collect_sound = AudioStreamPlayer.new()
+	collect_sound.name = "Collect"
+	collect_sound.stream = AudioStreamGenerator.new()
+	level_sounds.add_child(collect_sound)
+	game_manager_instance.add_child(level_sounds)
+
+	assert_true(game_manager_instance.play_level_sound("Collect"), "Level sound should play")
+	assert_false(game_manager_instance.play_level_sound("Jump"), "Missing level sound should play nothing")
+
 func test_restart_game_method_exists():
 	assert_has_method(game_manager_instance, "restart_game", "GameManager should have restart_game method")
 
@@ -0,0 +1,91 @@
+extends GutTest
+
+# Test suite for the HUD label updates
+
+var Hud = preload("res://scripts/hud.gd")
+var GameManager = preload("res://scripts/game_manager.gd")
+var ui = null
+var score_label = null
+var timer_label = null
+var target_label = null
+
+func before_each():
+	ui = autoqfree(CanvasLayer.new())
+	score_label = Label.new()
+	score_label.name = "ScoreLabel"
+	timer_label = Label.new()
+	timer_label.name = "TimerLabel"
+	target_label = Label.new()
+	target_label.name = "TargetLabel"
+	for label in [score_label, timer_label, target_label]:
+		ui.add_child(label)
+
+func after_each():
+	ui = null
+
+func test_hud_caches_labels():
+	var hud = Hud.new(ui)
+	assert_eq(hud.score_label, score_label, "Score label should be cached")
+	assert_eq(hud.timer_label, timer_label, "Timer label should be cached")
+	assert_eq(hud.target_label, target_label, "Target label should be cached")
+	assert_null(hud.end_label, "Missing labels should be null")
+
+func test_show_values():
+	var hud = Hud.new(ui)
+	hud.show_score(12)
+	hud.show_seconds(30)
+	hud.show_target(100)
+	assert_eq(score_label.text, "Score: 12")
+	assert_eq(timer_label.text, "Time: 30s")
+	assert_eq(target_label.text, "Target: 100")
+
+func test_text_only_rebuilt_when_value_changes():
+	var hud = Hud.new(ui)
+	hud.show_score(5)
+	score_label.text = "marker"
+	hud.show_score(5)
+	assert_eq(score_label.text, "marker", "Same value should not rewrite the label")
+	hud.show_score(6)
+	assert_eq(score_label.text, "Score: 6", "New value should rewrite the label")
+
+func test_game_manager_signals_update_labels():
+	var game = autoqfree(Node.new())
+	game.set_script(GameManager)
+	game.ui_layer = ui
+	game.score_changed.emit(40)
+	game.second_elapsed.emit(9)
+	assert_eq(score_label.text, "Score: 40")
+	assert_eq(timer_label.text, "Time: 9s")
+
+func test_timer_label_updates_once_per_second():
+	var game = autoqfree(Node.new())
+	game.set_script(GameManager)
+	game.game_mode = "timed"
+	game.game_started = true
+	game.time_remaining = 10.4
+	game.ui_layer = ui
+	game.update_ui()
+	assert_eq(timer_label.text, "Time: 10s")
+
+	var emitted = []
+	game.second_elapsed.connect(func(seconds): emitted.append(seconds))
+	for i in range(36):
+		game._process(1.0 / 60.0)
+	assert_eq(emitted, [9], "0.6 s of frames should cross one whole second")
+	assert_eq(timer_label.text, "Time: 9s")
+
+func test_unbind_stops_updates():
+	var game = autoqfree(Node.new())
+	game.set_script(GameManager)
+	game.ui_layer = ui
+	game.score_changed.emit(1)
+	game.ui_layer = null
+	game.score_changed.emit(2)
+	assert_eq(score_label.text, "Score: 1", "Unbound HUD should not follow the signals")
+
+func test_set_stats_visible():
+	var hud = Hud.new(ui)
+	hud.set_stats_visible(false)
+	assert_false(score_label.visible)
+	assert_false(timer_label.visible)
+	assert_false(target_label.visible)
@@ -0,0 +1,192 @@
+extends GutTest
+
+# Test suite for LevelManager level loading
+
+var LevelManager = preload("res://scripts/level_manager.gd")
+var level_manager_instance = null
+var manifest_path = "user://test_levels.bin"
+var shard_dir = "user://test_level_shards"
+
+func before_each():
+	# Create a fresh level manager instance before each test (not added to the
+	# tree, so _ready does not load the project's own levels)
+	level_manager_instance = autoqfree(Node.new())
+	level_manager_instance.set_script(LevelManager)
+
+func after_each():
+	level_manager_instance = null
+	if FileAccess.file_exists(manifest_path):
+		DirAccess.remove_absolute(manifest_path)
+	if DirAccess.dir_exists_absolute(shard_dir):
+		for file_name in DirAccess.get_files_at(shard_dir):
+			DirAccess.remove_absolute(shard_dir.path_join(file_name))
+		DirAccess.remove_absolute(shard_dir)
+
+func write_manifest(levels: Array):
+	"""Write a manifest in the layout produced by the post-generation hook"""
+	var records = []
+	for level in levels:
+		records.append(JSON.stringify(level).to_utf8_buffer())
+
+	var file = FileAccess.open(manifest_path, FileAccess.WRITE)
+	file.store_buffer("GLVL".to_ascii_buffer())
+	file.store_32(1)
+	file.store_32(records.size())
+	file.store_32(16)
+	var offset = 16 + records.size() * 8
+	for record in records:
+		file.store_32(offset)
+		file.store_32(record.size())
+		offset += record.size()
+	for record in records:
+		file.store_buffer(record)
+	file.close()
+
+func write_shards(levels: Array):
+	"""Write per-level files and an index in the sharded layout produced by the hook"""
+	DirAccess.make_dir_recursive_absolute(shard_dir)
+	var names = []
+	for level in levels:
+		names.append(level["name"])
+		var file = FileAccess.open(shard_dir.path_join(level["name"] + ".json"), FileAccess.WRITE)
+		file.store_string(JSON.stringify(level))
+		file.close()
+	var index = FileAccess.open(shard_dir.path_join("_index.json"), FileAccess.WRITE)
+	index.store_string(JSON.stringify({"count": names.size(), "levels": names}))
+	index.close()
+
+func test_initial_level_count():
+	assert_eq(level_manager_instance.get_level_count(), 0, "No levels before a config is loaded")
+	assert_false(level_manager_instance.is_multi_level(), "Should not be multi-level without a config")
+
+func test_open_level_manifest_reads_header():
+	write_manifest([{"name": "level_1"}, {"name": "level_2"}, {"name": "level_3"}])
+	assert_true(level_manager_instance.open_level_manifest(manifest_path), "Manifest should open")
+	assert_eq(level_manager_instance.get_level_count(), 3, "Level count should come from the header")
+	assert_true(level_manager_instance.is_multi_level(), "Three levels should be multi-level")
+
+func test_read_level_config_on_demand():
+	write_manifest([{"name": "level_1", "target_score": 40}, {"name": "level_2", "target_score": 80}])
+	level_manager_instance.open_level_manifest(manifest_path)
+
+	var level = level_manager_instance.read_level_config(1)
+	assert_eq(level["name"], "level_2", "Should read the second record")
+	assert_eq(int(level["target_score"]), 80, "Record fields should be preserved")
+	assert_eq(level_manager_instance.levels_config.size(), 0, "Levels should not be held in memory")
+
+func test_current_level_config_follows_index():
+	write_manifest([{"name": "level_1"}, {"name": "level_2"}])
+	level_manager_instance.open_level_manifest(manifest_path)
+
+	assert_eq(level_manager_instance.get_current_level_config()["name"], "level_1")
+	assert_true(level_manager_instance.next_level(), "Should advance to level 2")
+	assert_eq(level_manager_instance.get_current_level_config()["name"], "level_2")
+	assert_false(level_manager_instance.next_level(), "Should not advance past the last level")
+
+func test_read_level_config_out_of_range():
+	write_manifest([{"name": "level_1"}])
+	level_manager_instance.open_level_manifest(manifest_path)
+	assert_null(level_manager_instance.read_level_config(1), "Out of range index should return null")
+	assert_null(level_manager_instance.read_level_config(-1), "Negative index should return null")
+
+func test_open_level_manifest_rejects_other_files():
+	var file = FileAccess.open(manifest_path, FileAccess.WRITE)
+	file.store_string("{\"levels\": []}")
+	file.close()
+	assert_false(level_manager_instance.open_level_manifest(manifest_path), "Non-manifest file should be rejected")
+	assert_eq(level_manager_instance.get_level_count(), 0, "Level count should be unchanged")
+
+func test_open_level_index_reads_names_only():
+	write_shards([{"name": "level_1"}, {"name": "level_2"}])
+	assert_true(level_manager_instance.open_level_index(shard_dir.path_join("_index.json")), "Index should open")
+	assert_eq(level_manager_instance.get_level_count(), 2, "Level count should come from the index")
+	assert_eq(level_manager_instance.levels_config.size(), 0, "Levels should not be held in memory")
+
+func test_read_level_config_from_shard():
+	write_shards([{"name": "level_1", "target_score": 40}, {"name": "boss", "target_score": 100}])
+	level_manager_instance.open_level_index(shard_dir.path_join("_index.json"))
+
+	var level = level_manager_instance.read_level_config(1)
+	assert_eq(level["name"], "boss", "Should read the second level's file")
+	assert_eq(int(level["target_score"]), 100, "Shard fields should be preserved")
+
+func test_level_named_index_is_not_the_index():
+	write_shards([{"name": "index", "target_score": 40}])
+	assert_true(level_manager_instance.open_level_index(shard_dir.path_join("_index.json")), "Index should open")
+	assert_eq(level_manager_instance.read_level_config(0)["name"], "index", "A level may be named index")
+
+func wait_for_preload(index: int):
+	"""Let background loading run for up to 300 frames"""
+	var frames = 0
+	while not level_manager_instance.is_level_preloaded(index) and frames < 300:
+		await get_tree().process_frame
+		frames += 1
+
+func test_preload_level_loads_dependencies_in_background():
+	var scene_path = "res://scenes/main.tscn"
+	write_manifest([{"name": "main", "dependencies": [scene_path, "res://scenes/platform.tscn"]}])
+	level_manager_instance.open_level_manifest(manifest_path)
+
+	level_manager_instance.preload_level(0)
+	await wait_for_preload(0)
+	assert_true(level_manager_instance.is_level_preloaded(0), "Level should finish loading in the background")
+
+	var scene = level_manager_instance.take_preloaded_scene(0, scene_path)
+	assert_not_null(scene, "Preloaded scene should be returned")
+	assert_true(scene is PackedScene, "Preloaded scene should be a PackedScene")
+	assert_null(level_manager_instance.take_preloaded_scene(0, scene_path), "A preloaded scene is handed out once")
+
+func test_take_preloaded_scene_ignores_other_levels():
+	write_manifest([{"name": "main"}, {"name": "platform"}])
+	level_manager_instance.open_level_manifest(manifest_path)
+
+	level_manager_instance.preload_level(1)
+	assert_null(level_manager_instance.take_preloaded_scene(0, "res://scenes/main.tscn"), "Only the preloaded level can be taken")
+	await wait_for_preload(1)
+	level_manager_instance.take_preloaded_scene(1, "res://scenes/platform.tscn")
+
+func test_benchmark_level_transition_stall():
+	# Compares the main-thread stall of a synchronous level load with
+	# collecting a scene that was loaded in the background
+	var scene_path = "res://scenes/main.tscn"
+	write_manifest([{"name": "main", "dependencies": [scene_path]}])
+	level_manager_instance.open_level_manifest(manifest_path)
+
+	var start = Time.get_ticks_usec()
+	var sync_scene = ResourceLoader.load(scene_path, "", ResourceLoader.CACHE_MODE_IGNORE)
+	var sync_usec = Time.get_ticks_usec() - start
+	assert_not_null(sync_scene, "Synchronous load should succeed")
+
+	level_manager_instance.preload_level(0)
+	await wait_for_preload(0)
+	start = Time.get_ticks_usec()
+	var preloaded_scene = level_manager_instance.take_preloaded_scene(0, scene_path)
+	var preloaded_usec = Time.get_ticks_usec() - start
+	assert_not_null(preloaded_scene, "Preloaded scene should be returned")
+
+	# Timings are benchmark output only; wall-clock comparisons are not reliable on loaded machines
+	gut.p("Level transition stall: synchronous load %d usec, preloaded %d usec" % [sync_usec, preloaded_usec])
+	assert_eq(preloaded_scene.resource_path, scene_path, "Preloaded scene should be the level's scene")
+	assert_same(preloaded_scene, ResourceLoader.load(scene_path), "Preloaded scene should be the cached resource")
+	assert_true(preloaded_scene.can_instantiate(), "Preloaded scene should be ready to instantiate")
+
+func test_player_type_starts_preload_of_next_level():
+	write_manifest([{"name": "main"}, {"name": "platform", "dependencies": ["res://scenes/platform.tscn"]}])
+	level_manager_instance.open_level_manifest(manifest_path)
+
+	level_manager_instance.set_player_type("red")
+	assert_eq(level_manager_instance._preload_index, 1, "Choosing a player should preload the next level")
+	assert_eq(level_manager_instance._preload_type, "red", "The preload should use the chosen player type")
+	await wait_for_preload(1)
+	assert_true(level_manager_instance.is_level_preloaded(1), "Next level should finish loading")
+	level_manager_instance.take_preloaded_scene(1, "res://scenes/platform.tscn")
+
+func test_changing_player_type_restarts_preload():
+	write_manifest([{"name": "main"}, {"name": "platform", "dependencies": ["res://scenes/platform.tscn"]}])
+	level_manager_instance.open_level_manifest(manifest_path)
+
+	level_manager_instance.set_player_type("red")
+	level_manager_instance.set_player_type("green")
+	assert_eq(level_manager_instance._preload_type, "green", "The preload should follow the latest player type")
+	await wait_for_preload(1)
+	level_manager_instance.take_preloaded_scene(1, "res://scenes/platform.tscn")
@@ -0,0 +1,50 @@
+extends GutTest
+
+# Test suite for the PerformanceMonitor autoload
+
+var PerformanceMonitor = preload("res://scripts/performance_monitor.gd")
+var monitor = null
+var csv_path = "user://test_performance.csv"
+
+func before_each():
+	monitor = autoqfree(Node.new())
+	monitor.set_script(PerformanceMonitor)
+	monitor.csv_path = csv_path
+
+func after_each():
+	monitor.close_csv()
+	monitor = null
+	if FileAccess.file_exists(csv_path):
+		DirAccess.remove_absolute(csv_path)
+
+func test_sample_has_all_columns():
+	add_child_autoqfree(monitor)
+	var values = monitor.sample()
+	for column in monitor.CSV_COLUMNS:
+		assert_true(values.has(column), "Sample should include " + column)
+	assert_gt(values["nodes"], 0, "Node count should include the test tree")
+	assert_gt(values["static_memory_mb"], 0.0, "Static memory should be reported")
+
+func test_csv_has_header_and_rows():
+	assert_true(monitor.open_csv(csv_path), "CSV log should open")
+	monitor.write_csv_row(monitor.sample())
+	monitor.write_csv_row(monitor.sample())
+	monitor.close_csv()
+
+	var lines = FileAccess.get_file_as_string(csv_path).strip_edges().split("\n")
+	assert_eq(lines.size(), 3, "CSV should have a header and one row per sample")
+	assert_eq(lines[0], ",".join(monitor.CSV_COLUMNS), "First line should be the header")
+
+func test_format_sample():
+	var text = monitor.format_sample({
+		"fps": 60.0, "frame_ms": 1.5, "physics_ms": 0.25,
+		"nodes": 120, "objects": 900, "static_memory_mb": 32.0,
+	})
+	assert_string_contains(text, "FPS 60")
+	assert_string_contains(text, "nodes 120")
+
+func test_overlay_without_ui_layer():
+	add_child_autoqfree(monitor)
+	monitor.show_overlay = true
+	monitor.update_overlay(monitor.sample())
+	pass_test("Overlay update without a UILayer should not crash")
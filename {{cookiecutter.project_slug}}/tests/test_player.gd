@@ -66,3 +66,15 @@ func test_player_velocity_initialization():
 
 func test_player_has_physics_process():
 	assert_has_method(player_instance, "_physics_process", "Player should have _physics_process method")
+
+func test_get_frames_missing_type():
+	assert_null(Player.get_frames("no_such_type"), "Types without a pre-baked SpriteFrames resource should return null")
+
+func test_fallback_does_not_modify_shared_frames():
+	var sprite = player_instance.get_node("AnimatedSprite2D")
+	var shared_frames = sprite.sprite_frames
+	var shared_texture = shared_frames.get_frame_texture("idle", 0) if shared_frames.get_frame_count("idle") else null
+	player_instance._use_default_appearance("invalid_type")
+	assert_ne(sprite.sprite_frames, shared_frames, "Fallback animations should be built on a copy")
+	var texture_after = shared_frames.get_frame_texture("idle", 0) if shared_frames.get_frame_count("idle") else null
+	assert_eq(texture_after, shared_texture, "The shared SpriteFrames should be left untouched")